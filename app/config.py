@@ -4,6 +4,25 @@ from pydantic_settings import BaseSettings, SettingsConfigDict
 
 class Settings(BaseSettings):
     DATABASE_URL: str = "sqlite:///./app.db"
+    # Async driver URL for request handlers; derived from DATABASE_URL when empty.
+    DATABASE_ASYNC_URL: str = os.getenv("DATABASE_ASYNC_URL", "")
+    # Connection pool (QueuePool); pre-ping and recycle apply to server databases.
+    DATABASE_POOL_SIZE: int = int(os.getenv("DATABASE_POOL_SIZE", 10))
+    DATABASE_MAX_OVERFLOW: int = int(os.getenv("DATABASE_MAX_OVERFLOW", 20))
+    DATABASE_POOL_TIMEOUT_SECONDS: float = float(
+        os.getenv("DATABASE_POOL_TIMEOUT_SECONDS", 30)
+    )
+    DATABASE_POOL_RECYCLE_SECONDS: int = int(
+        os.getenv("DATABASE_POOL_RECYCLE_SECONDS", 1800)
+    )
+    DATABASE_POOL_PRE_PING: bool = (
+        os.getenv("DATABASE_POOL_PRE_PING", "true").lower() == "true"
+    )
+    DATABASE_MIGRATE_ON_STARTUP: bool = (
+        os.getenv("DATABASE_MIGRATE_ON_STARTUP", "true").lower() == "true"
+    )
+    SQLITE_BUSY_TIMEOUT_MS: int = int(os.getenv("SQLITE_BUSY_TIMEOUT_MS", 5000))
+    SQLITE_MMAP_SIZE: int = int(os.getenv("SQLITE_MMAP_SIZE", 256 * 1024 * 1024))
     GOOGLE_GENAI_API_KEY: str = os.getenv("GOOGLE_GENAI_API_KEY", "")
     GOOGLE_GENAI_MODEL: str = os.getenv("GOOGLE_GENAI_MODEL", "")
     COLLECTION_NAME: str = os.getenv("GOOGLE_GENAI_MODEL", "")
@@ -11,6 +30,130 @@ class Settings(BaseSettings):
     VECTOR_STORAGE_URL: str = os.getenv("VECTOR_STORAGE_URL", "")
     VECTOR_SIZE: int = int(os.getenv("VECTOR_SIZE", 768))
     VECTOR_STORAGE_API_KEY: str = os.getenv("VECTOR_STORAGE_API_KEY", "")
+    VECTOR_STORE_BACKEND: str = os.getenv("VECTOR_STORE_BACKEND", "qdrant")
+    VECTOR_STORE_EMBEDDED_DIR: str = os.getenv(
+        "VECTOR_STORE_EMBEDDED_DIR", "./vector_store"
+    )
+    VECTOR_SECTION_WEIGHTS: str = os.getenv("VECTOR_SECTION_WEIGHTS", "")
+    VECTOR_SECTION_GROUP_SIZE: int = int(os.getenv("VECTOR_SECTION_GROUP_SIZE", 3))
+    VECTOR_HYBRID_ENABLED: bool = (
+        os.getenv("VECTOR_HYBRID_ENABLED", "true").lower() == "true"
+    )
+    VECTOR_HYBRID_DENSE_WEIGHT: float = float(os.getenv("VECTOR_HYBRID_DENSE_WEIGHT", 1))
+    VECTOR_HYBRID_SPARSE_WEIGHT: float = float(
+        os.getenv("VECTOR_HYBRID_SPARSE_WEIGHT", 1)
+    )
+    VECTOR_HYBRID_RRF_K: int = int(os.getenv("VECTOR_HYBRID_RRF_K", 60))
+    VECTOR_HYBRID_PREFETCH_LIMIT: int = int(os.getenv("VECTOR_HYBRID_PREFETCH_LIMIT", 50))
+    BM25_K1: float = float(os.getenv("BM25_K1", 1.2))
+    BM25_B: float = float(os.getenv("BM25_B", 0.75))
+    BM25_AVG_DOC_LENGTH: float = float(os.getenv("BM25_AVG_DOC_LENGTH", 80))
+    # Required in the X-Admin-Key header by /admin; the routes are disabled when empty.
+    ADMIN_API_KEY: str = os.getenv("ADMIN_API_KEY", "")
+    VECTOR_RECONCILE_INTERVAL_SECONDS: float = float(
+        os.getenv("VECTOR_RECONCILE_INTERVAL_SECONDS", 6 * 60 * 60)
+    )
+    VECTOR_COLLECTION_PROFILE: str = os.getenv("VECTOR_COLLECTION_PROFILE", "default")
+    VECTOR_QUANTIZATION_OVERSAMPLING: float = float(
+        os.getenv("VECTOR_QUANTIZATION_OVERSAMPLING", 2)
+    )
+    EMBEDDING_OUTPUT_DIMENSIONALITY: int = int(
+        os.getenv("EMBEDDING_OUTPUT_DIMENSIONALITY", 0)
+    )
+    VECTOR_STORAGE_PREFER_GRPC: bool = (
+        os.getenv("VECTOR_STORAGE_PREFER_GRPC", "false").lower() == "true"
+    )
+    VECTOR_STORAGE_GRPC_PORT: int = int(os.getenv("VECTOR_STORAGE_GRPC_PORT", 6334))
+    VECTOR_STORAGE_TIMEOUT_SECONDS: int = int(
+        os.getenv("VECTOR_STORAGE_TIMEOUT_SECONDS", 10)
+    )
+    VECTOR_STORAGE_STARTUP_RETRIES: int = int(
+        os.getenv("VECTOR_STORAGE_STARTUP_RETRIES", 3)
+    )
+    LLM_TIMEOUT_SECONDS: float = float(os.getenv("LLM_TIMEOUT_SECONDS", 60))
+    LLM_MAX_CONCURRENCY: int = int(os.getenv("LLM_MAX_CONCURRENCY", 16))
+    EMBEDDING_TIMEOUT_SECONDS: float = float(os.getenv("EMBEDDING_TIMEOUT_SECONDS", 10))
+    EMBEDDING_MAX_CONCURRENCY: int = int(os.getenv("EMBEDDING_MAX_CONCURRENCY", 32))
+    LLM_RATE_LIMIT_RPS: float = float(os.getenv("LLM_RATE_LIMIT_RPS", 5))
+    LLM_RATE_LIMIT_BURST: int = int(os.getenv("LLM_RATE_LIMIT_BURST", 10))
+    LLM_RATE_LIMIT_MIN_RPS: float = float(os.getenv("LLM_RATE_LIMIT_MIN_RPS", 0.5))
+    LLM_MODEL_RATE_LIMITS: str = os.getenv("LLM_MODEL_RATE_LIMITS", "")
+    LLM_MAX_RETRIES: int = int(os.getenv("LLM_MAX_RETRIES", 4))
+    LLM_RETRY_BASE_SECONDS: float = float(os.getenv("LLM_RETRY_BASE_SECONDS", 0.5))
+    LLM_RETRY_MAX_SECONDS: float = float(os.getenv("LLM_RETRY_MAX_SECONDS", 20))
+    LLM_BREAKER_FAILURE_THRESHOLD: int = int(
+        os.getenv("LLM_BREAKER_FAILURE_THRESHOLD", 5)
+    )
+    LLM_BREAKER_RESET_SECONDS: float = float(os.getenv("LLM_BREAKER_RESET_SECONDS", 30))
+    EMBEDDING_CACHE_ENABLED: bool = (
+        os.getenv("EMBEDDING_CACHE_ENABLED", "true").lower() == "true"
+    )
+    EMBEDDING_CACHE_MAX_ENTRIES: int = int(os.getenv("EMBEDDING_CACHE_MAX_ENTRIES", 10000))
+    EMBEDDING_CACHE_TTL_SECONDS: int = int(os.getenv("EMBEDDING_CACHE_TTL_SECONDS", 86400))
+    EMBEDDING_CACHE_REDIS_URL: str = os.getenv("EMBEDDING_CACHE_REDIS_URL", "")
+    # List endpoints (GET /report, /chat, /chat/{chat_id}) are keyset-paginated.
+    PAGE_DEFAULT_LIMIT: int = int(os.getenv("PAGE_DEFAULT_LIMIT", 20))
+    PAGE_MAX_LIMIT: int = int(os.getenv("PAGE_MAX_LIMIT", 100))
+    CHAT_MESSAGES_PAGE_DEFAULT_LIMIT: int = int(
+        os.getenv("CHAT_MESSAGES_PAGE_DEFAULT_LIMIT", 50)
+    )
+    CHAT_HISTORY_VERBATIM_TURNS: int = int(os.getenv("CHAT_HISTORY_VERBATIM_TURNS", 6))
+    CHAT_SUMMARY_INTERVAL_MESSAGES: int = int(
+        os.getenv("CHAT_SUMMARY_INTERVAL_MESSAGES", 10)
+    )
+    CHAT_PROMPT_TOKEN_BUDGET: int = int(os.getenv("CHAT_PROMPT_TOKEN_BUDGET", 8000))
+    REPORT_DEDUP_ENABLED: bool = os.getenv("REPORT_DEDUP_ENABLED", "true").lower() == "true"
+    # Off by default: scans of the same lab template with different values can
+    # hash identically, and a hit reuses the earlier report's analysis.
+    REPORT_DEDUP_PERCEPTUAL: bool = (
+        os.getenv("REPORT_DEDUP_PERCEPTUAL", "false").lower() == "true"
+    )
+    REPORT_DEDUP_PERCEPTUAL_MAX_DISTANCE: int = int(
+        os.getenv("REPORT_DEDUP_PERCEPTUAL_MAX_DISTANCE", 4)
+    )
+    IMAGE_PREPROCESSING_ENABLED: bool = (
+        os.getenv("IMAGE_PREPROCESSING_ENABLED", "true").lower() == "true"
+    )
+    IMAGE_PREPROCESSING_WORKERS: int = int(os.getenv("IMAGE_PREPROCESSING_WORKERS", 2))
+    IMAGE_MAX_EDGE: int = int(os.getenv("IMAGE_MAX_EDGE", 2048))
+    # Off by default: lab reports flag abnormal values in red, and the
+    # analysis is asked to pick those flags up.
+    IMAGE_GRAYSCALE: bool = os.getenv("IMAGE_GRAYSCALE", "false").lower() == "true"
+    IMAGE_AUTOCONTRAST: bool = os.getenv("IMAGE_AUTOCONTRAST", "true").lower() == "true"
+    IMAGE_JPEG_QUALITY: int = int(os.getenv("IMAGE_JPEG_QUALITY", 85))
+    REPORT_STRUCTURED_OUTPUT: bool = (
+        os.getenv("REPORT_STRUCTURED_OUTPUT", "true").lower() == "true"
+    )
+    REPORT_UPLOAD_DIR: str = os.getenv("REPORT_UPLOAD_DIR", "./uploads")
+    REPORT_UPLOAD_MAX_BYTES: int = int(
+        os.getenv("REPORT_UPLOAD_MAX_BYTES", 25 * 1024 * 1024)
+    )
+    REPORT_UPLOAD_SPOOL_BYTES: int = int(
+        os.getenv("REPORT_UPLOAD_SPOOL_BYTES", 1024 * 1024)
+    )
+    REPORT_UPLOAD_MAX_FILES: int = int(os.getenv("REPORT_UPLOAD_MAX_FILES", 10))
+    REPORT_PDF_DPI: int = int(os.getenv("REPORT_PDF_DPI", 150))
+    REPORT_MAX_PAGES: int = int(os.getenv("REPORT_MAX_PAGES", 20))
+    REPORT_PAGE_MAX_CONCURRENCY: int = int(os.getenv("REPORT_PAGE_MAX_CONCURRENCY", 4))
+    REPORT_WORKER_COUNT: int = int(os.getenv("REPORT_WORKER_COUNT", 4))
+    REPORT_QUEUE_MAX_DEPTH: int = int(os.getenv("REPORT_QUEUE_MAX_DEPTH", 100))
+    REPORT_BATCH_MAX_CONCURRENCY: int = int(os.getenv("REPORT_BATCH_MAX_CONCURRENCY", 2))
+    REPORT_BATCH_MAX_FILES: int = int(os.getenv("REPORT_BATCH_MAX_FILES", 100))
+    REPORT_JOB_MAX_ATTEMPTS: int = int(os.getenv("REPORT_JOB_MAX_ATTEMPTS", 3))
+    REPORT_JOB_RETRY_BACKOFF_SECONDS: float = float(
+        os.getenv("REPORT_JOB_RETRY_BACKOFF_SECONDS", 5)
+    )
+    REPORT_EVENTS_HISTORY_SIZE: int = int(os.getenv("REPORT_EVENTS_HISTORY_SIZE", 100))
+    REPORT_EVENTS_HEARTBEAT_SECONDS: float = float(
+        os.getenv("REPORT_EVENTS_HEARTBEAT_SECONDS", 15)
+    )
+    REPORT_EVENTS_SUBSCRIBER_QUEUE_SIZE: int = int(
+        os.getenv("REPORT_EVENTS_SUBSCRIBER_QUEUE_SIZE", 100)
+    )
+    REPORT_EVENTS_REDIS_URL: str = os.getenv("REPORT_EVENTS_REDIS_URL", "")
+    REPORT_EVENTS_STREAM_MAX_LEN: int = int(
+        os.getenv("REPORT_EVENTS_STREAM_MAX_LEN", 10000)
+    )
 
     model_config = SettingsConfigDict(env_file=".env", extra="ignore")
 
@@ -1,16 +1,107 @@
-import os
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker, declarative_base
 from .config import settings
+from .utils.db.pool import (
+    InstrumentedAsyncQueuePool,
+    InstrumentedQueuePool,
+    pool_stats,
+)
 
 SQLALCHEMY_DATABASE_URL = settings.DATABASE_URL
 
-engine = create_engine(
-    SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False}
-)
+ASYNC_DRIVERS = {
+    "sqlite": "sqlite+aiosqlite",
+    "postgres": "postgresql+asyncpg",
+    "postgresql": "postgresql+asyncpg",
+    "postgresql+psycopg2": "postgresql+asyncpg",
+}
+
+
+def async_database_url(url: str) -> str:
+    """
+    Swaps the driver of a sync database URL for its asyncio counterpart
+    (aiosqlite for SQLite, asyncpg for Postgres).
+    """
+    scheme, separator, rest = url.partition("://")
+    if scheme not in ASYNC_DRIVERS:
+        raise ValueError(
+            f"No async driver for {scheme!r} URLs; set DATABASE_ASYNC_URL explicitly"
+        )
+    return f"{ASYNC_DRIVERS[scheme]}{separator}{rest}"
+
+
+def set_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+    # WAL lets readers run alongside the single writer; busy_timeout makes a
+    # writer wait for the lock instead of failing with "database is locked".
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute(f"PRAGMA busy_timeout={settings.SQLITE_BUSY_TIMEOUT_MS}")
+    cursor.execute(f"PRAGMA mmap_size={settings.SQLITE_MMAP_SIZE}")
+    cursor.close()
+
+
+def engine_options(url: str, is_async: bool = False) -> dict:
+    """
+    create_engine arguments for the URL's dialect. SQLite connections can be
+    shared across threads and in-memory databases keep SQLAlchemy's default
+    pool; everything else gets an instrumented QueuePool sized from Settings.
+    """
+    database_url = make_url(url)
+    options = {}
+    if database_url.get_backend_name() == "sqlite":
+        options["connect_args"] = {"check_same_thread": False}
+        if database_url.database in (None, "", ":memory:"):
+            return options
+    else:
+        options["pool_pre_ping"] = settings.DATABASE_POOL_PRE_PING
+        options["pool_recycle"] = settings.DATABASE_POOL_RECYCLE_SECONDS
+    options.update(
+        poolclass=InstrumentedAsyncQueuePool if is_async else InstrumentedQueuePool,
+        pool_size=settings.DATABASE_POOL_SIZE,
+        max_overflow=settings.DATABASE_MAX_OVERFLOW,
+        pool_timeout=settings.DATABASE_POOL_TIMEOUT_SECONDS,
+    )
+    return options
+
+
+def create_database_engine(url: str):
+    engine = create_engine(url, **engine_options(url))
+    if engine.dialect.name == "sqlite":
+        event.listen(engine, "connect", set_sqlite_pragmas)
+    return engine
+
+
+def create_async_database_engine(url: str):
+    engine = create_async_engine(url, **engine_options(url, is_async=True))
+    if engine.dialect.name == "sqlite":
+        event.listen(engine.sync_engine, "connect", set_sqlite_pragmas)
+    return engine
+
+
+engine = create_database_engine(SQLALCHEMY_DATABASE_URL)
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Background workers (report analysis jobs, summaries, reconciliation) get an
+# engine of their own, so long-running jobs can't exhaust the connection pool
+# that serves requests.
+worker_engine = create_database_engine(SQLALCHEMY_DATABASE_URL)
+
+WorkerSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=worker_engine)
+
+async_engine = create_async_database_engine(
+    settings.DATABASE_ASYNC_URL or async_database_url(SQLALCHEMY_DATABASE_URL)
+)
+
+# expire_on_commit=False: attributes stay loaded after commit, since lazy
+# loading is not possible on an AsyncSession.
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine, autoflush=False, expire_on_commit=False
+)
+
 Base = declarative_base()
 
 
@@ -25,3 +116,25 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+async def get_async_db():
+    """
+    Dependency to get an AsyncSession, whose queries don't block the event
+    loop. Used by the read-heavy and chat routes. Report uploads, deletes and
+    the analysis workers still write through sync sessions, with their
+    queries run in the threadpool.
+    """
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+def database_stats() -> dict:
+    return {
+        "dialect": engine.dialect.name,
+        "pools": {
+            "requests": pool_stats(engine),
+            "requests_async": pool_stats(async_engine.sync_engine),
+            "workers": pool_stats(worker_engine),
+        },
+    }
@@ -1,19 +1,60 @@
+import time
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
+from fastapi.logger import logger
 from fastapi.middleware.cors import CORSMiddleware
+from app.config import settings
 from app.logging_config import configure_logging
 
+from .routes.admin import router as admin_router
 from .routes.report import router as report_router
 from .routes.chat import router as chat_router
-from .database import Base, engine
+from .database import WorkerSessionLocal, async_engine
+from .services.image_preprocessing import image_preprocessor
+from .services.job_queue import report_job_queue
+from .services.report import ReportService
+from .services.report_events import report_event_bus
+from .services.vector_storage import vector_storage_service
+from .utils.db.migrations import upgrade_database
 
 configure_logging()
 
-Base.metadata.create_all(bind=engine)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    started = time.perf_counter()
+    if settings.DATABASE_MIGRATE_ON_STARTUP:
+        upgrade_database(settings.DATABASE_URL)
+    await report_event_bus.start()
+    await vector_storage_service.start()
+    vector_storage_service.start_reconciliation(
+        settings.VECTOR_RECONCILE_INTERVAL_SECONDS
+    )
+    await report_job_queue.start(
+        handler=ReportService.run_analysis_job,
+        on_failure=ReportService.fail_analysis_job,
+    )
+    db = WorkerSessionLocal()
+    try:
+        await ReportService.recover_pending_reports(db=db)
+    finally:
+        db.close()
+    logger.info(f"Startup completed in {(time.perf_counter() - started) * 1000:.0f} ms")
+
+    yield
+
+    await report_job_queue.stop()
+    image_preprocessor.shutdown()
+    await report_event_bus.stop()
+    await vector_storage_service.close()
+    await async_engine.dispose()
+
 
 app = FastAPI(
     title="MedSutra Backed API",
     description="A REST API for managing medical reports with AI",
     version="0.0.1",
+    lifespan=lifespan,
 )
 
 origins = [
@@ -34,3 +75,4 @@ app.add_middleware(
 
 app.include_router(router=report_router)
 app.include_router(router=chat_router)
+app.include_router(router=admin_router)
@@ -0,0 +1,63 @@
+from logging.config import fileConfig
+from alembic import context
+from sqlalchemy import create_engine
+from app.config import settings
+from app.database import Base
+# Importing the models registers their tables on Base.metadata.
+from app.models import (  # noqa: F401
+    chat,
+    job,
+    message,
+    report,
+    report_batch,
+    report_fingerprint,
+    user,
+)
+
+config = context.config
+
+# upgrade_database() runs migrations inside the application, which has its
+# own logging setup.
+if config.config_file_name is not None and config.attributes.get(
+    "configure_logger", True
+):
+    fileConfig(config.config_file_name)
+
+target_metadata = Base.metadata
+
+
+def database_url() -> str:
+    return config.attributes.get("database_url") or settings.DATABASE_URL
+
+
+def run_migrations_offline() -> None:
+    url = database_url()
+    context.configure(
+        url=url,
+        target_metadata=target_metadata,
+        literal_binds=True,
+        render_as_batch=url.startswith("sqlite"),
+    )
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+def run_migrations_online() -> None:
+    url = database_url()
+    engine = create_engine(url)
+    with engine.connect() as connection:
+        context.configure(
+            connection=connection,
+            target_metadata=target_metadata,
+            # SQLite can't ALTER most things; batch mode recreates the table.
+            render_as_batch=connection.dialect.name == "sqlite",
+        )
+        with context.begin_transaction():
+            context.run_migrations()
+    engine.dispose()
+
+
+if context.is_offline_mode():
+    run_migrations_offline()
+else:
+    run_migrations_online()
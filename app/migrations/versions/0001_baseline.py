@@ -0,0 +1,92 @@
+"""baseline schema: USERS, REPORTS, CHATS and MESSAGES as first deployed
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-17
+
+Databases created before migrations existed already have these tables;
+upgrade_database() stamps them at this revision instead of running it.
+Tables and columns that create_all added later (JOBS, ANALYSIS, the chat
+summaries, batches, fingerprints) come from their own revisions, which
+skip whatever such a database already has.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0001"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def timestamps():
+    return [
+        sa.Column("created_at", sa.DateTime(), nullable=True),
+        sa.Column("updated_at", sa.DateTime(), nullable=True),
+    ]
+
+
+def upgrade() -> None:
+    op.create_table(
+        "USERS",
+        sa.Column("ID", sa.String(), nullable=False),
+        sa.Column("EMAIL", sa.String(), nullable=True),
+        sa.Column("HASHED_PASSWORD", sa.String(), nullable=True),
+        sa.Column("IS_ACTIVE", sa.Boolean(), nullable=True),
+        *timestamps(),
+        sa.PrimaryKeyConstraint("ID"),
+    )
+    op.create_index("ix_USERS_ID", "USERS", ["ID"])
+    op.create_index("ix_USERS_EMAIL", "USERS", ["EMAIL"], unique=True)
+
+    op.create_table(
+        "REPORTS",
+        sa.Column("ID", sa.String(36), nullable=False),
+        sa.Column("TITLE", sa.String(), nullable=True),
+        sa.Column("DESCRIPTION", sa.Text(), nullable=True),
+        sa.Column("STATUS", sa.String(), nullable=True),
+        sa.Column("USER_ID", sa.String(), nullable=False),
+        *timestamps(),
+        sa.PrimaryKeyConstraint("ID"),
+    )
+    op.create_index("ix_REPORTS_ID", "REPORTS", ["ID"])
+    op.create_index("ix_REPORTS_TITLE", "REPORTS", ["TITLE"])
+    op.create_index("ix_REPORTS_USER_ID", "REPORTS", ["USER_ID"])
+
+    op.create_table(
+        "CHATS",
+        sa.Column("ID", sa.String(36), nullable=False),
+        sa.Column("TITLE", sa.String(), nullable=True),
+        sa.Column("STATUS", sa.String(), nullable=True),
+        sa.Column("USER_ID", sa.String(), nullable=False),
+        sa.Column("REPORT_ID", sa.String(), nullable=True),
+        *timestamps(),
+        sa.PrimaryKeyConstraint("ID"),
+    )
+    op.create_index("ix_CHATS_ID", "CHATS", ["ID"])
+    op.create_index("ix_CHATS_TITLE", "CHATS", ["TITLE"])
+    op.create_index("ix_CHATS_USER_ID", "CHATS", ["USER_ID"])
+
+    op.create_table(
+        "MESSAGES",
+        sa.Column("ID", sa.String(36), nullable=False),
+        sa.Column("MESSAGE", sa.Text(), nullable=False),
+        sa.Column("USER_ID", sa.String(), nullable=False),
+        sa.Column("CHAT_ID", sa.String(), nullable=True),
+        sa.Column("OWNER", sa.String(), nullable=True),
+        *timestamps(),
+        sa.PrimaryKeyConstraint("ID"),
+    )
+    op.create_index("ix_MESSAGES_ID", "MESSAGES", ["ID"])
+    op.create_index("ix_MESSAGES_USER_ID", "MESSAGES", ["USER_ID"])
+
+
+def downgrade() -> None:
+    for table in (
+        "MESSAGES",
+        "CHATS",
+        "REPORTS",
+        "USERS",
+    ):
+        op.drop_table(table)
@@ -0,0 +1,45 @@
+"""composite indexes for the chat, message and report list queries
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-17
+
+MESSAGES had no index on CHAT_ID although every chat turn filters on it and
+orders by created_at. The report and chat lists filter on USER_ID and STATUS
+and order by created_at. The single-column USER_ID indexes on REPORTS and
+CHATS are dropped: the new indexes lead with USER_ID and serve the same
+lookups.
+"""
+
+from alembic import op
+
+revision = "0002"
+down_revision = "0001"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_MESSAGES_CHAT_ID_created_at", "MESSAGES", ["CHAT_ID", "created_at"]
+    )
+    op.create_index(
+        "ix_REPORTS_USER_ID_STATUS_created_at",
+        "REPORTS",
+        ["USER_ID", "STATUS", "created_at"],
+    )
+    op.create_index(
+        "ix_CHATS_USER_ID_STATUS_created_at",
+        "CHATS",
+        ["USER_ID", "STATUS", "created_at"],
+    )
+    op.drop_index("ix_REPORTS_USER_ID", table_name="REPORTS")
+    op.drop_index("ix_CHATS_USER_ID", table_name="CHATS")
+
+
+def downgrade() -> None:
+    op.create_index("ix_CHATS_USER_ID", "CHATS", ["USER_ID"])
+    op.create_index("ix_REPORTS_USER_ID", "REPORTS", ["USER_ID"])
+    op.drop_index("ix_CHATS_USER_ID_STATUS_created_at", table_name="CHATS")
+    op.drop_index("ix_REPORTS_USER_ID_STATUS_created_at", table_name="REPORTS")
+    op.drop_index("ix_MESSAGES_CHAT_ID_created_at", table_name="MESSAGES")
@@ -0,0 +1,92 @@
+"""full-text search over report title and description
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-17
+
+SQLite: an FTS5 external-content table REPORTS_FTS over REPORTS, keyed by
+rowid and maintained by insert/update/delete triggers. There is no stemmer,
+since searches match word prefixes and stemmed tokens would break those.
+REPORTS has no INTEGER PRIMARY KEY, so VACUUM may renumber its rowids, and a
+batch-mode migration that recreates REPORTS drops the triggers. After either
+one, re-create the triggers if needed and run
+INSERT INTO REPORTS_FTS(REPORTS_FTS) VALUES('rebuild'). Revision 0009 replaces
+this index with one keyed on REPORTS.ID.
+
+Postgres: a stored generated tsvector column SEARCH_VECTOR (title weighted
+A, description B) with a GIN index, which Postgres keeps up to date itself.
+"""
+
+from alembic import op
+
+revision = "0003"
+down_revision = "0002"
+branch_labels = None
+depends_on = None
+
+SQLITE_UPGRADE = [
+    """
+    CREATE VIRTUAL TABLE REPORTS_FTS USING fts5(
+        TITLE, DESCRIPTION,
+        content='REPORTS', content_rowid='rowid',
+        tokenize='unicode61 remove_diacritics 2'
+    )
+    """,
+    """
+    CREATE TRIGGER REPORTS_FTS_AFTER_INSERT AFTER INSERT ON REPORTS BEGIN
+        INSERT INTO REPORTS_FTS(rowid, TITLE, DESCRIPTION)
+        VALUES (new.rowid, new.TITLE, new.DESCRIPTION);
+    END
+    """,
+    """
+    CREATE TRIGGER REPORTS_FTS_AFTER_DELETE AFTER DELETE ON REPORTS BEGIN
+        INSERT INTO REPORTS_FTS(REPORTS_FTS, rowid, TITLE, DESCRIPTION)
+        VALUES ('delete', old.rowid, old.TITLE, old.DESCRIPTION);
+    END
+    """,
+    """
+    CREATE TRIGGER REPORTS_FTS_AFTER_UPDATE AFTER UPDATE OF TITLE, DESCRIPTION
+    ON REPORTS BEGIN
+        INSERT INTO REPORTS_FTS(REPORTS_FTS, rowid, TITLE, DESCRIPTION)
+        VALUES ('delete', old.rowid, old.TITLE, old.DESCRIPTION);
+        INSERT INTO REPORTS_FTS(rowid, TITLE, DESCRIPTION)
+        VALUES (new.rowid, new.TITLE, new.DESCRIPTION);
+    END
+    """,
+    "INSERT INTO REPORTS_FTS(REPORTS_FTS) VALUES ('rebuild')",
+]
+
+SQLITE_DOWNGRADE = [
+    "DROP TRIGGER IF EXISTS REPORTS_FTS_AFTER_UPDATE",
+    "DROP TRIGGER IF EXISTS REPORTS_FTS_AFTER_DELETE",
+    "DROP TRIGGER IF EXISTS REPORTS_FTS_AFTER_INSERT",
+    "DROP TABLE IF EXISTS REPORTS_FTS",
+]
+
+POSTGRES_UPGRADE = [
+    """
+    ALTER TABLE "REPORTS" ADD COLUMN "SEARCH_VECTOR" tsvector GENERATED ALWAYS AS (
+        setweight(to_tsvector('english', coalesce("TITLE", '')), 'A')
+        || setweight(to_tsvector('english', coalesce("DESCRIPTION", '')), 'B')
+    ) STORED
+    """,
+    'CREATE INDEX "ix_REPORTS_SEARCH_VECTOR" ON "REPORTS" USING GIN ("SEARCH_VECTOR")',
+]
+
+POSTGRES_DOWNGRADE = [
+    'DROP INDEX IF EXISTS "ix_REPORTS_SEARCH_VECTOR"',
+    'ALTER TABLE "REPORTS" DROP COLUMN IF EXISTS "SEARCH_VECTOR"',
+]
+
+
+def run(statements_by_dialect) -> None:
+    for statement in statements_by_dialect.get(op.get_bind().dialect.name, []):
+        op.execute(statement)
+
+
+def upgrade() -> None:
+    run({"sqlite": SQLITE_UPGRADE, "postgresql": POSTGRES_UPGRADE})
+
+
+def downgrade() -> None:
+    run({"sqlite": SQLITE_DOWNGRADE, "postgresql": POSTGRES_DOWNGRADE})
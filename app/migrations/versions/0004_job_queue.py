@@ -0,0 +1,46 @@
+"""JOBS table for the report analysis queue
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-18
+
+Databases that ran the queue before migrations existed already have the
+table from create_all; it is only created when missing.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from app.utils.db.migrations import has_table
+
+revision = "0004"
+down_revision = "0003"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    if has_table("JOBS"):
+        return
+    op.create_table(
+        "JOBS",
+        sa.Column("ID", sa.String(36), nullable=False),
+        sa.Column("REPORT_ID", sa.String(36), nullable=False),
+        sa.Column("USER_ID", sa.String(), nullable=False),
+        sa.Column("STATUS", sa.String(), nullable=True),
+        sa.Column("ATTEMPTS", sa.Integer(), nullable=False),
+        sa.Column("MAX_ATTEMPTS", sa.Integer(), nullable=False),
+        sa.Column("UPLOAD_PATH", sa.String(), nullable=False),
+        sa.Column("LAST_ERROR", sa.Text(), nullable=True),
+        sa.Column("STARTED_AT", sa.DateTime(), nullable=True),
+        sa.Column("FINISHED_AT", sa.DateTime(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=True),
+        sa.Column("updated_at", sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint("ID"),
+    )
+    op.create_index("ix_JOBS_ID", "JOBS", ["ID"])
+    op.create_index("ix_JOBS_REPORT_ID", "JOBS", ["REPORT_ID"])
+    op.create_index("ix_JOBS_STATUS", "JOBS", ["STATUS"])
+
+
+def downgrade() -> None:
+    op.drop_table("JOBS")
@@ -0,0 +1,38 @@
+"""rolling summary columns on CHATS
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-18
+
+Columns that already exist (databases created by create_all after the
+chat summaries shipped) are left alone.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from app.utils.db.migrations import has_column
+
+revision = "0005"
+down_revision = "0004"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    if not has_column("CHATS", "SUMMARY"):
+        op.add_column("CHATS", sa.Column("SUMMARY", sa.Text(), nullable=True))
+    if not has_column("CHATS", "SUMMARIZED_MESSAGE_COUNT"):
+        op.add_column(
+            "CHATS",
+            sa.Column(
+                "SUMMARIZED_MESSAGE_COUNT",
+                sa.Integer(),
+                nullable=False,
+                server_default=sa.text("0"),
+            ),
+        )
+
+
+def downgrade() -> None:
+    op.drop_column("CHATS", "SUMMARIZED_MESSAGE_COUNT")
+    op.drop_column("CHATS", "SUMMARY")
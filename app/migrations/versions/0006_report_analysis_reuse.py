@@ -0,0 +1,63 @@
+"""stored analyses and upload fingerprints for report reuse
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-18
+
+REPORTS.ANALYSIS and REPORT_FINGERPRINTS may already exist on databases
+created by create_all; only what is missing is added. The
+(USER_ID, PERCEPTUAL_HASH) index serves the perceptual prefix lookup.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from app.utils.db.migrations import has_column, has_index, has_table
+
+revision = "0006"
+down_revision = "0005"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    if not has_column("REPORTS", "ANALYSIS"):
+        op.add_column("REPORTS", sa.Column("ANALYSIS", sa.Text(), nullable=True))
+
+    if not has_table("REPORT_FINGERPRINTS"):
+        op.create_table(
+            "REPORT_FINGERPRINTS",
+            sa.Column("ID", sa.String(36), nullable=False),
+            sa.Column("USER_ID", sa.String(), nullable=False),
+            sa.Column("REPORT_ID", sa.String(36), nullable=False),
+            sa.Column("CONTENT_HASH", sa.String(64), nullable=False),
+            sa.Column("PERCEPTUAL_HASH", sa.String(16), nullable=True),
+            sa.Column("created_at", sa.DateTime(), nullable=True),
+            sa.Column("updated_at", sa.DateTime(), nullable=True),
+            sa.PrimaryKeyConstraint("ID"),
+        )
+        op.create_index("ix_REPORT_FINGERPRINTS_ID", "REPORT_FINGERPRINTS", ["ID"])
+        op.create_index(
+            "ix_REPORT_FINGERPRINTS_USER_ID", "REPORT_FINGERPRINTS", ["USER_ID"]
+        )
+        op.create_index(
+            "ix_REPORT_FINGERPRINTS_REPORT_ID", "REPORT_FINGERPRINTS", ["REPORT_ID"]
+        )
+        op.create_index(
+            "ix_REPORT_FINGERPRINTS_CONTENT_HASH",
+            "REPORT_FINGERPRINTS",
+            ["CONTENT_HASH"],
+        )
+
+    if not has_index(
+        "REPORT_FINGERPRINTS", "ix_REPORT_FINGERPRINTS_USER_ID_PERCEPTUAL_HASH"
+    ):
+        op.create_index(
+            "ix_REPORT_FINGERPRINTS_USER_ID_PERCEPTUAL_HASH",
+            "REPORT_FINGERPRINTS",
+            ["USER_ID", "PERCEPTUAL_HASH"],
+        )
+
+
+def downgrade() -> None:
+    op.drop_table("REPORT_FINGERPRINTS")
+    op.drop_column("REPORTS", "ANALYSIS")
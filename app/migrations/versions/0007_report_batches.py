@@ -0,0 +1,48 @@
+"""batch uploads: REPORT_BATCHES and the BATCH_ID columns
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-18
+
+Databases created by create_all after batch uploads shipped already have
+these; only what is missing is added.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from app.utils.db.migrations import has_column, has_index, has_table
+
+revision = "0007"
+down_revision = "0006"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    if not has_table("REPORT_BATCHES"):
+        op.create_table(
+            "REPORT_BATCHES",
+            sa.Column("ID", sa.String(36), nullable=False),
+            sa.Column("USER_ID", sa.String(), nullable=False),
+            sa.Column("TOTAL", sa.Integer(), nullable=False),
+            sa.Column("created_at", sa.DateTime(), nullable=True),
+            sa.Column("updated_at", sa.DateTime(), nullable=True),
+            sa.PrimaryKeyConstraint("ID"),
+        )
+        op.create_index("ix_REPORT_BATCHES_ID", "REPORT_BATCHES", ["ID"])
+        op.create_index("ix_REPORT_BATCHES_USER_ID", "REPORT_BATCHES", ["USER_ID"])
+
+    if not has_column("REPORTS", "BATCH_ID"):
+        op.add_column("REPORTS", sa.Column("BATCH_ID", sa.String(36), nullable=True))
+    if not has_index("REPORTS", "ix_REPORTS_BATCH_ID"):
+        op.create_index("ix_REPORTS_BATCH_ID", "REPORTS", ["BATCH_ID"])
+
+    if not has_column("JOBS", "BATCH_ID"):
+        op.add_column("JOBS", sa.Column("BATCH_ID", sa.String(36), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("JOBS", "BATCH_ID")
+    op.drop_index("ix_REPORTS_BATCH_ID", table_name="REPORTS")
+    op.drop_column("REPORTS", "BATCH_ID")
+    op.drop_table("REPORT_BATCHES")
@@ -0,0 +1,60 @@
+"""indexes in keyset order for the report, chat and message lists
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2026-10-18
+
+The lists order by (created_at DESC, ID DESC), but the 0002 indexes end at
+created_at, so SQLite still sorted the ID tie-break in a temp B-tree. The
+report list filters on STATUS != DELETED, which a STATUS column in the
+middle of the index can't serve in order; it gets (USER_ID, created_at, ID)
+and the STATUS index stays for the STATUS = COMPLETED lookups. The chat and
+message indexes gain ID and replace their 0002 versions.
+"""
+
+from alembic import op
+from app.utils.db.migrations import has_index
+
+revision = "0008"
+down_revision = "0007"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    if not has_index("REPORTS", "ix_REPORTS_USER_ID_created_at_ID"):
+        op.create_index(
+            "ix_REPORTS_USER_ID_created_at_ID",
+            "REPORTS",
+            ["USER_ID", "created_at", "ID"],
+        )
+    if not has_index("CHATS", "ix_CHATS_USER_ID_STATUS_created_at_ID"):
+        op.create_index(
+            "ix_CHATS_USER_ID_STATUS_created_at_ID",
+            "CHATS",
+            ["USER_ID", "STATUS", "created_at", "ID"],
+        )
+    if has_index("CHATS", "ix_CHATS_USER_ID_STATUS_created_at"):
+        op.drop_index("ix_CHATS_USER_ID_STATUS_created_at", table_name="CHATS")
+    if not has_index("MESSAGES", "ix_MESSAGES_CHAT_ID_created_at_ID"):
+        op.create_index(
+            "ix_MESSAGES_CHAT_ID_created_at_ID",
+            "MESSAGES",
+            ["CHAT_ID", "created_at", "ID"],
+        )
+    if has_index("MESSAGES", "ix_MESSAGES_CHAT_ID_created_at"):
+        op.drop_index("ix_MESSAGES_CHAT_ID_created_at", table_name="MESSAGES")
+
+
+def downgrade() -> None:
+    op.create_index(
+        "ix_MESSAGES_CHAT_ID_created_at", "MESSAGES", ["CHAT_ID", "created_at"]
+    )
+    op.drop_index("ix_MESSAGES_CHAT_ID_created_at_ID", table_name="MESSAGES")
+    op.create_index(
+        "ix_CHATS_USER_ID_STATUS_created_at",
+        "CHATS",
+        ["USER_ID", "STATUS", "created_at"],
+    )
+    op.drop_index("ix_CHATS_USER_ID_STATUS_created_at_ID", table_name="CHATS")
+    op.drop_index("ix_REPORTS_USER_ID_created_at_ID", table_name="REPORTS")
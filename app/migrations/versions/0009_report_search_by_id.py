@@ -0,0 +1,111 @@
+"""key the SQLite report search index on REPORTS.ID
+
+Revision ID: 0009
+Revises: 0008
+Create Date: 2026-10-18
+
+0003 made REPORTS_FTS an external-content table keyed by REPORTS.rowid.
+REPORTS has no INTEGER PRIMARY KEY, so VACUUM may renumber those rowids and
+silently point the index at the wrong reports. REPORTS_FTS becomes a
+regular FTS5 table that stores its own copy of TITLE and DESCRIPTION next to
+an UNINDEXED ID column, and the triggers match rows on ID. Searches join
+back on ID through the primary key. Deleting or retitling a report scans
+REPORTS_FTS for the ID, which only happens when a report is first analysed
+or hard-deleted.
+
+Postgres is unchanged: its SEARCH_VECTOR column lives on REPORTS itself.
+"""
+
+from alembic import op
+
+revision = "0009"
+down_revision = "0008"
+branch_labels = None
+depends_on = None
+
+DROP_ROWID_INDEX = [
+    "DROP TRIGGER IF EXISTS REPORTS_FTS_AFTER_UPDATE",
+    "DROP TRIGGER IF EXISTS REPORTS_FTS_AFTER_DELETE",
+    "DROP TRIGGER IF EXISTS REPORTS_FTS_AFTER_INSERT",
+    "DROP TABLE IF EXISTS REPORTS_FTS",
+]
+
+CREATE_ID_INDEX = [
+    """
+    CREATE VIRTUAL TABLE REPORTS_FTS USING fts5(
+        ID UNINDEXED, TITLE, DESCRIPTION,
+        tokenize='unicode61 remove_diacritics 2'
+    )
+    """,
+    """
+    CREATE TRIGGER REPORTS_FTS_AFTER_INSERT AFTER INSERT ON REPORTS BEGIN
+        INSERT INTO REPORTS_FTS(ID, TITLE, DESCRIPTION)
+        VALUES (new.ID, new.TITLE, new.DESCRIPTION);
+    END
+    """,
+    """
+    CREATE TRIGGER REPORTS_FTS_AFTER_DELETE AFTER DELETE ON REPORTS BEGIN
+        DELETE FROM REPORTS_FTS WHERE ID = old.ID;
+    END
+    """,
+    """
+    CREATE TRIGGER REPORTS_FTS_AFTER_UPDATE AFTER UPDATE OF ID, TITLE, DESCRIPTION
+    ON REPORTS BEGIN
+        DELETE FROM REPORTS_FTS WHERE ID = old.ID;
+        INSERT INTO REPORTS_FTS(ID, TITLE, DESCRIPTION)
+        VALUES (new.ID, new.TITLE, new.DESCRIPTION);
+    END
+    """,
+    """
+    INSERT INTO REPORTS_FTS(ID, TITLE, DESCRIPTION)
+    SELECT ID, TITLE, DESCRIPTION FROM REPORTS
+    """,
+]
+
+# The 0003 index, for downgrades.
+CREATE_ROWID_INDEX = [
+    """
+    CREATE VIRTUAL TABLE REPORTS_FTS USING fts5(
+        TITLE, DESCRIPTION,
+        content='REPORTS', content_rowid='rowid',
+        tokenize='unicode61 remove_diacritics 2'
+    )
+    """,
+    """
+    CREATE TRIGGER REPORTS_FTS_AFTER_INSERT AFTER INSERT ON REPORTS BEGIN
+        INSERT INTO REPORTS_FTS(rowid, TITLE, DESCRIPTION)
+        VALUES (new.rowid, new.TITLE, new.DESCRIPTION);
+    END
+    """,
+    """
+    CREATE TRIGGER REPORTS_FTS_AFTER_DELETE AFTER DELETE ON REPORTS BEGIN
+        INSERT INTO REPORTS_FTS(REPORTS_FTS, rowid, TITLE, DESCRIPTION)
+        VALUES ('delete', old.rowid, old.TITLE, old.DESCRIPTION);
+    END
+    """,
+    """
+    CREATE TRIGGER REPORTS_FTS_AFTER_UPDATE AFTER UPDATE OF TITLE, DESCRIPTION
+    ON REPORTS BEGIN
+        INSERT INTO REPORTS_FTS(REPORTS_FTS, rowid, TITLE, DESCRIPTION)
+        VALUES ('delete', old.rowid, old.TITLE, old.DESCRIPTION);
+        INSERT INTO REPORTS_FTS(rowid, TITLE, DESCRIPTION)
+        VALUES (new.rowid, new.TITLE, new.DESCRIPTION);
+    END
+    """,
+    "INSERT INTO REPORTS_FTS(REPORTS_FTS) VALUES ('rebuild')",
+]
+
+
+def run(statements) -> None:
+    if op.get_bind().dialect.name != "sqlite":
+        return
+    for statement in statements:
+        op.execute(statement)
+
+
+def upgrade() -> None:
+    run(DROP_ROWID_INDEX + CREATE_ID_INDEX)
+
+
+def downgrade() -> None:
+    run(DROP_ROWID_INDEX + CREATE_ROWID_INDEX)
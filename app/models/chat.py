@@ -1,5 +1,5 @@
 import uuid
-from sqlalchemy import Column, String
+from sqlalchemy import Column, Index, Integer, String, Text
 from .base import BaseModel
 from app.query_models.chat import ChatStatus
 from ..utils.db.enum_decorator import EnumType
@@ -7,6 +7,16 @@ from ..utils.db.enum_decorator import EnumType
 
 class Chat(BaseModel):
     __tablename__ = "CHATS"
+    __table_args__ = (
+        Index(
+            "ix_CHATS_USER_ID_STATUS_created_at_ID",
+            "USER_ID",
+            "STATUS",
+            "created_at",
+            "ID",
+        ),
+        {"extend_existing": True},
+    )
 
     id = Column(
         "ID",
@@ -17,7 +27,10 @@ class Chat(BaseModel):
     )
     title = Column("TITLE", String, nullable=True, index=True)
     status = Column("STATUS", EnumType(ChatStatus), default=ChatStatus.ACTIVE.value)
-    user_id = Column(
-        "USER_ID", String, nullable=False, index=True, foreign_key="USERS.ID"
-    )
+    # Looked up through the leading column of the (USER_ID, STATUS, created_at) index.
+    user_id = Column("USER_ID", String, nullable=False, foreign_key="USERS.ID")
     report_id = Column("REPORT_ID", String, nullable=True)
+    summary = Column("SUMMARY", Text, nullable=True)
+    summarized_message_count = Column(
+        "SUMMARIZED_MESSAGE_COUNT", Integer, default=0, nullable=False
+    )
@@ -0,0 +1,29 @@
+import uuid
+from sqlalchemy import Column, DateTime, Integer, String, Text
+from app.query_models.job import JobStatus
+from ..utils.db.enum_decorator import EnumType
+from .base import BaseModel
+
+
+class Job(BaseModel):
+    __tablename__ = "JOBS"
+
+    id = Column(
+        "ID",
+        String(36),
+        primary_key=True,
+        index=True,
+        default=lambda: str(uuid.uuid4()),
+    )
+    report_id = Column("REPORT_ID", String(36), nullable=False, index=True)
+    user_id = Column("USER_ID", String, nullable=False)
+    batch_id = Column("BATCH_ID", String(36), nullable=True)
+    status = Column(
+        "STATUS", EnumType(JobStatus), default=JobStatus.QUEUED.value, index=True
+    )
+    attempts = Column("ATTEMPTS", Integer, default=0, nullable=False)
+    max_attempts = Column("MAX_ATTEMPTS", Integer, default=1, nullable=False)
+    upload_path = Column("UPLOAD_PATH", String, nullable=False)
+    last_error = Column("LAST_ERROR", Text, nullable=True)
+    started_at = Column("STARTED_AT", DateTime, nullable=True)
+    finished_at = Column("FINISHED_AT", DateTime, nullable=True)
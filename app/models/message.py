@@ -1,5 +1,5 @@
 import uuid
-from sqlalchemy import Column, String, Text
+from sqlalchemy import Column, Index, String, Text
 from app.query_models.message import MessageOwner
 from app.utils.db.enum_decorator import EnumType
 from .base import BaseModel
@@ -7,6 +7,10 @@ from .base import BaseModel
 
 class Message(BaseModel):
     __tablename__ = "MESSAGES"
+    __table_args__ = (
+        Index("ix_MESSAGES_CHAT_ID_created_at_ID", "CHAT_ID", "created_at", "ID"),
+        {"extend_existing": True},
+    )
 
     id = Column(
         "ID",
@@ -1,5 +1,5 @@
 import uuid
-from sqlalchemy import Column, String, Text
+from sqlalchemy import Column, Index, String, Text
 from app.query_models.report import ReportStatus
 from ..utils.db.enum_decorator import EnumType
 from .base import BaseModel
@@ -7,6 +7,11 @@ from .base import BaseModel
 
 class Report(BaseModel):
     __tablename__ = "REPORTS"
+    __table_args__ = (
+        Index("ix_REPORTS_USER_ID_STATUS_created_at", "USER_ID", "STATUS", "created_at"),
+        Index("ix_REPORTS_USER_ID_created_at_ID", "USER_ID", "created_at", "ID"),
+        {"extend_existing": True},
+    )
 
     id = Column(
         "ID",
@@ -20,6 +25,7 @@ class Report(BaseModel):
     status = Column(
         "STATUS", EnumType(ReportStatus), default=ReportStatus.PROCESSING.value
     )
-    user_id = Column(
-        "USER_ID", String, nullable=False, index=True, foreign_key="USERS.ID"
-    )
+    # Looked up through the leading column of the (USER_ID, STATUS, created_at) index.
+    user_id = Column("USER_ID", String, nullable=False, foreign_key="USERS.ID")
+    analysis = Column("ANALYSIS", Text, nullable=True)
+    batch_id = Column("BATCH_ID", String(36), nullable=True, index=True)
@@ -0,0 +1,17 @@
+import uuid
+from sqlalchemy import Column, Integer, String
+from .base import BaseModel
+
+
+class ReportBatch(BaseModel):
+    __tablename__ = "REPORT_BATCHES"
+
+    id = Column(
+        "ID",
+        String(36),
+        primary_key=True,
+        index=True,
+        default=lambda: str(uuid.uuid4()),
+    )
+    user_id = Column("USER_ID", String, nullable=False, index=True)
+    total = Column("TOTAL", Integer, nullable=False, default=0)
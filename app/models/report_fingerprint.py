@@ -0,0 +1,27 @@
+import uuid
+from sqlalchemy import Column, Index, String
+from .base import BaseModel
+
+
+class ReportFingerprint(BaseModel):
+    __tablename__ = "REPORT_FINGERPRINTS"
+    __table_args__ = (
+        Index(
+            "ix_REPORT_FINGERPRINTS_USER_ID_PERCEPTUAL_HASH",
+            "USER_ID",
+            "PERCEPTUAL_HASH",
+        ),
+        {"extend_existing": True},
+    )
+
+    id = Column(
+        "ID",
+        String(36),
+        primary_key=True,
+        index=True,
+        default=lambda: str(uuid.uuid4()),
+    )
+    user_id = Column("USER_ID", String, nullable=False, index=True)
+    report_id = Column("REPORT_ID", String(36), nullable=False, index=True)
+    content_hash = Column("CONTENT_HASH", String(64), nullable=False, index=True)
+    perceptual_hash = Column("PERCEPTUAL_HASH", String(16), nullable=True)
@@ -1,10 +1,19 @@
-from typing import List
+from typing import List, Optional
 
 from app.models.chat import Chat
 from app.query_models.chat import ChatStatus
 from ..schemas.message import Message as MessageSchema
-from ..schemas.chat import Chat as ChatSchema
+from ..schemas.chat import Chat as ChatSchema, ChatSummary
 from ..models.message import Message
+from ..utils.db.pagination import (
+    Page,
+    build_page,
+    ensure_cursor_row_async,
+    keyset_after,
+    keyset_order,
+)
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 
@@ -17,6 +26,24 @@ class ChatRepository:
         )
         return list(map(lambda report: ChatSchema.model_validate(report), reports))
 
+    @classmethod
+    def user_chats_query(cls, user_id, limit, cursor=None):
+        query = select(Chat).where(
+            Chat.user_id == user_id, Chat.status == ChatStatus.ACTIVE
+        )
+        if cursor:
+            query = query.where(keyset_after(Chat, cursor))
+        return query.order_by(*keyset_order(Chat)).limit(limit + 1)
+
+    @classmethod
+    async def get_chats_page_async(
+        cls, db: AsyncSession, user_id, limit, cursor=None
+    ) -> Page[ChatSchema]:
+        if cursor:
+            await ensure_cursor_row_async(db, Chat, cursor, Chat.user_id == user_id)
+        result = await db.scalars(cls.user_chats_query(user_id, limit, cursor))
+        return build_page(result.all(), limit, ChatSchema.model_validate)
+
     @classmethod
     def create_chat(cls, db: Session, user_id, title):
         chat = Chat(user_id=user_id, title=title, status=ChatStatus.ACTIVE)
@@ -24,3 +51,51 @@ class ChatRepository:
         db.commit()
         db.refresh(chat)
         return ChatSchema.model_validate(chat)
+
+    @classmethod
+    async def create_chat_async(cls, db: AsyncSession, user_id, title):
+        chat = Chat(user_id=user_id, title=title, status=ChatStatus.ACTIVE)
+        db.add(chat)
+        await db.commit()
+        await db.refresh(chat)
+        return ChatSchema.model_validate(chat)
+
+    @classmethod
+    async def get_chat_by_id_async(cls, db: AsyncSession, chat_id):
+        return await db.scalar(select(Chat).where(Chat.id == chat_id))
+
+    @classmethod
+    async def get_chat_summary_async(
+        cls, db: AsyncSession, chat_id
+    ) -> Optional[ChatSummary]:
+        chat = await cls.get_chat_by_id_async(db, chat_id)
+        return ChatSummary.model_validate(chat) if chat else None
+
+    @classmethod
+    async def update_summary_async(
+        cls,
+        db: AsyncSession,
+        chat_id,
+        summary,
+        summarized_message_count,
+        previous_message_count,
+    ) -> bool:
+        """
+        Stores the extended summary unless another writer has moved the chat's
+        summary on since `previous_message_count` was read.
+        """
+        result = await db.execute(
+            update(Chat)
+            .where(
+                Chat.id == chat_id,
+                Chat.summarized_message_count == previous_message_count,
+            )
+            .values(
+                {
+                    Chat.summary: summary,
+                    Chat.summarized_message_count: summarized_message_count,
+                }
+            )
+        )
+        await db.commit()
+        return result.rowcount > 0
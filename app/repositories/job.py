@@ -0,0 +1,83 @@
+import datetime
+from typing import List, Optional
+from app.query_models.job import JobStatus
+from ..models.job import Job
+from ..schemas.job import Job as JobSchema
+
+
+class JobRepository:
+
+    @classmethod
+    def add_job(
+        cls, db, report_id, user_id, upload_path, max_attempts, batch_id=None
+    ):
+        job = Job(
+            report_id=report_id,
+            user_id=user_id,
+            batch_id=batch_id,
+            upload_path=upload_path,
+            max_attempts=max_attempts,
+            status=JobStatus.QUEUED,
+        )
+        db.add(job)
+        db.commit()
+        db.refresh(job)
+        return JobSchema.model_validate(job)
+
+    @classmethod
+    def get_job_by_id(cls, db, job_id):
+        return db.query(Job).filter(Job.id == job_id).first()
+
+    @classmethod
+    def get_unfinished_jobs(cls, db) -> List[JobSchema]:
+        jobs = (
+            db.query(Job)
+            .filter(Job.status.in_([JobStatus.QUEUED, JobStatus.RUNNING]))
+            .order_by(Job.created_at)
+        )
+        return list(map(lambda job: JobSchema.model_validate(job), jobs))
+
+    @classmethod
+    def get_active_report_ids(cls, db) -> List[str]:
+        rows = (
+            db.query(Job.report_id)
+            .filter(Job.status.in_([JobStatus.QUEUED, JobStatus.RUNNING]))
+            .all()
+        )
+        return [row[0] for row in rows]
+
+    @classmethod
+    def mark_running(cls, db, job_id) -> Optional[JobSchema]:
+        job = cls.get_job_by_id(db, job_id)
+        if job and job.status == JobStatus.QUEUED:
+            job.status = JobStatus.RUNNING
+            job.attempts = job.attempts + 1
+            job.started_at = datetime.datetime.now()
+            db.commit()
+            db.refresh(job)
+            return JobSchema.model_validate(job)
+        return None
+
+    @classmethod
+    def mark_queued(cls, db, job_id, error=None):
+        job = cls.get_job_by_id(db, job_id)
+        if job:
+            job.status = JobStatus.QUEUED
+            if error is not None:
+                job.last_error = error
+            db.commit()
+            db.refresh(job)
+            return job
+        return None
+
+    @classmethod
+    def mark_finished(cls, db, job_id, status: JobStatus, error=None):
+        job = cls.get_job_by_id(db, job_id)
+        if job:
+            job.status = status
+            job.last_error = error
+            job.finished_at = datetime.datetime.now()
+            db.commit()
+            db.refresh(job)
+            return job
+        return None
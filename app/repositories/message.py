@@ -1,6 +1,15 @@
-from typing import List
+from typing import List, Optional
 from ..schemas.message import Message as MessageSchema
 from ..models.message import Message
+from ..utils.db.pagination import (
+    Page,
+    build_page,
+    ensure_cursor_row_async,
+    keyset_after,
+    keyset_order,
+)
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 
@@ -17,10 +26,114 @@ class MessageRepository:
         return MessageSchema.model_validate(message)
 
     @classmethod
-    def get_messages_by_chat_id(cls, db: Session, chat_id) -> List[MessageSchema]:
+    async def add_message_async(
+        cls, db: AsyncSession, user_id, message, owner, chat_id
+    ):
+        message = Message(
+            user_id=user_id, message=message, owner=owner, chat_id=chat_id
+        )
+        db.add(message)
+        await db.commit()
+        await db.refresh(message)
+        return MessageSchema.model_validate(message)
+
+    @classmethod
+    def get_messages_by_chat_id(
+        cls, db: Session, chat_id, limit: Optional[int] = None
+    ) -> List[MessageSchema]:
+        """
+        Returns the chat's messages oldest first. With `limit`, only the most
+        recent `limit` messages are fetched.
+        """
+        if limit is None:
+            messages = (
+                db.query(Message)
+                .filter(Message.chat_id == chat_id)
+                .order_by(Message.created_at, Message.id)
+            )
+            return list(
+                map(lambda report: MessageSchema.model_validate(report), messages)
+            )
+
         messages = (
             db.query(Message)
             .filter(Message.chat_id == chat_id)
-            .order_by(Message.created_at)
+            .order_by(Message.created_at.desc(), Message.id.desc())
+            .limit(limit)
+            .all()
+        )
+        return list(
+            map(lambda report: MessageSchema.model_validate(report), reversed(messages))
+        )
+
+    @classmethod
+    async def get_messages_by_chat_id_async(
+        cls, db: AsyncSession, chat_id, limit: Optional[int] = None
+    ) -> List[MessageSchema]:
+        if limit is None:
+            result = await db.scalars(
+                select(Message)
+                .where(Message.chat_id == chat_id)
+                .order_by(Message.created_at, Message.id)
+            )
+            return [MessageSchema.model_validate(message) for message in result]
+
+        result = await db.scalars(
+            select(Message)
+            .where(Message.chat_id == chat_id)
+            .order_by(Message.created_at.desc(), Message.id.desc())
+            .limit(limit)
+        )
+        return [MessageSchema.model_validate(message) for message in reversed(result.all())]
+
+    @classmethod
+    def chat_messages_query(cls, chat_id, limit, cursor=None):
+        query = select(Message).where(Message.chat_id == chat_id)
+        if cursor:
+            query = query.where(keyset_after(Message, cursor))
+        return query.order_by(*keyset_order(Message)).limit(limit + 1)
+
+    @classmethod
+    async def get_messages_page_async(
+        cls, db: AsyncSession, chat_id, limit, cursor=None
+    ) -> Page[MessageSchema]:
+        """
+        Pages backwards from the newest message: the first page holds the
+        latest `limit` messages and `next_cursor` leads to older ones. Each
+        page is returned oldest first.
+        """
+        if cursor:
+            await ensure_cursor_row_async(db, Message, cursor, Message.chat_id == chat_id)
+        result = await db.scalars(cls.chat_messages_query(chat_id, limit, cursor))
+        page = build_page(result.all(), limit, MessageSchema.model_validate)
+        page.items.reverse()
+        return page
+
+    @classmethod
+    async def get_messages_slice_async(
+        cls, db: AsyncSession, chat_id, offset: int, limit: int
+    ) -> List[MessageSchema]:
+        """
+        Messages `offset` to `offset + limit` oldest first. created_at has
+        one-second precision on SQLite, so the id breaks ties and the order
+        is the same on every call.
+        """
+        result = await db.scalars(
+            select(Message)
+            .where(Message.chat_id == chat_id)
+            .order_by(Message.created_at, Message.id)
+            .offset(offset)
+            .limit(limit)
+        )
+        return [MessageSchema.model_validate(message) for message in result]
+
+    @classmethod
+    def count_messages_by_chat_id(cls, db: Session, chat_id) -> int:
+        return db.query(Message).filter(Message.chat_id == chat_id).count()
+
+    @classmethod
+    async def count_messages_by_chat_id_async(cls, db: AsyncSession, chat_id) -> int:
+        count = await db.scalar(
+            select(func.count(Message.id)).where(Message.chat_id == chat_id)
         )
-        return list(map(lambda report: MessageSchema.model_validate(report), messages))
+        return count or 0
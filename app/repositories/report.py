@@ -1,15 +1,42 @@
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from app.query_models.report import ReportStatus
 from ..models.report import Report
 from ..schemas.report import Report as ReportSchema
+from ..utils.db.pagination import (
+    Page,
+    build_page,
+    ensure_cursor_row_async,
+    keyset_after,
+    keyset_order,
+)
 
 
 class ReportRepository:
 
     @classmethod
-    def add_report(cls, db, user_id):
+    def add_report(cls, db, user_id, batch_id=None):
         report = Report(
             status=ReportStatus.PROCESSING,
             user_id=user_id,
+            batch_id=batch_id,
+        )
+        db.add(report)
+        db.commit()
+        db.refresh(report)
+        return ReportSchema.model_validate(report)
+
+    @classmethod
+    def add_completed_report(
+        cls, db, user_id, title, description, analysis, batch_id=None
+    ):
+        report = Report(
+            status=ReportStatus.COMPLETED,
+            user_id=user_id,
+            batch_id=batch_id,
+            title=title,
+            description=description,
+            analysis=analysis,
         )
         db.add(report)
         db.commit()
@@ -31,34 +58,155 @@ class ReportRepository:
         return db.query(Report).filter(Report.id == report_id).first()
 
     @classmethod
-    def get_reports_by_title(cls, db, title, user_id):
-        reports = db.query(Report).filter(
-            Report.title.icontains(title),
-            Report.status.is_not(ReportStatus.DELETED),
-            Report.user_id == user_id,
+    def user_reports_query(cls, user_id, limit, cursor=None):
+        query = select(Report).where(
+            Report.user_id == user_id, Report.status.is_not(ReportStatus.DELETED)
         )
+        if cursor:
+            query = query.where(keyset_after(Report, cursor))
+        return query.order_by(*keyset_order(Report)).limit(limit + 1)
+
+    @classmethod
+    async def get_reports_page_async(
+        cls, db: AsyncSession, user_id, limit, cursor=None
+    ) -> Page[ReportSchema]:
+        if cursor:
+            await ensure_cursor_row_async(db, Report, cursor, Report.user_id == user_id)
+        result = await db.scalars(cls.user_reports_query(user_id, limit, cursor))
+        return build_page(result.all(), limit, ReportSchema.model_validate)
+
+    @classmethod
+    def get_reports_by_status(cls, db, status):
+        reports = db.query(Report).filter(Report.status == status).all()
         return list(map(lambda report: ReportSchema.model_validate(report), reports))
 
     @classmethod
-    def get_reports_by_user_id(cls, db, user_id):
-        reports = (
+    async def get_analysed_reports_by_ids_async(
+        cls, db: AsyncSession, report_ids, user_id
+    ):
+        result = await db.execute(
+            select(Report.id, Report.analysis).where(
+                Report.id.in_(report_ids),
+                Report.user_id == user_id,
+                Report.status == ReportStatus.COMPLETED,
+                Report.analysis.is_not(None),
+            )
+        )
+        return result.all()
+
+    @classmethod
+    def get_live_report_ids(cls, db, report_ids):
+        rows = (
+            db.query(Report.id)
+            .filter(
+                Report.id.in_(report_ids),
+                Report.status.in_([ReportStatus.PROCESSING, ReportStatus.COMPLETED]),
+            )
+            .all()
+        )
+        return [row.id for row in rows]
+
+    @classmethod
+    def get_reports_by_content(cls, db, user_id, title, description):
+        """
+        Reports indexed before points carried a report_id are only linked to
+        their vector by these fields, which populate_report copied from the
+        analysis (title and summary).
+        """
+        return (
             db.query(Report)
             .filter(
-                Report.user_id == user_id, Report.status.is_not(ReportStatus.DELETED)
+                Report.user_id == user_id,
+                Report.title == title,
+                Report.description == description,
             )
+            .order_by(Report.created_at.desc())
             .all()
         )
-        return list(map(lambda report: ReportSchema.model_validate(report), reports))
+
+    @classmethod
+    def set_report_analysis(cls, db, report_id, analysis):
+        report = cls.get_report_by_id(db, report_id)
+        if report:
+            report.analysis = analysis
+            db.commit()
+            db.refresh(report)
+        return report
+
+    @classmethod
+    def get_analysed_reports_page(cls, db, after_id, limit, updated_since=None):
+        """
+        Completed reports with an analysis in report id order, starting after
+        `after_id`; used to stream the whole table in chunks.
+        """
+        query = db.query(Report.id, Report.user_id, Report.analysis).filter(
+            Report.status == ReportStatus.COMPLETED,
+            Report.analysis.is_not(None),
+        )
+        if after_id is not None:
+            query = query.filter(Report.id > after_id)
+        if updated_since is not None:
+            query = query.filter(Report.updated_at >= updated_since)
+        return query.order_by(Report.id.asc()).limit(limit).all()
+
+    @classmethod
+    def get_latest_update(cls, db):
+        return db.query(func.max(Report.updated_at)).scalar()
+
+    @classmethod
+    def get_report_with_same_analysis(cls, db, user_id, analysis, exclude_report_id):
+        return (
+            db.query(Report)
+            .filter(
+                Report.user_id == user_id,
+                Report.id != exclude_report_id,
+                Report.status == ReportStatus.COMPLETED,
+                Report.analysis == analysis,
+            )
+            .order_by(Report.created_at.asc())
+            .first()
+        )
+
+    @classmethod
+    def get_reports_by_batch_id(cls, db, batch_id):
+        return db.query(Report).filter(Report.batch_id == batch_id).all()
+
+    @classmethod
+    def count_reports_by_status(cls, db, batch_id):
+        rows = (
+            db.query(Report.status, func.count(Report.id))
+            .filter(Report.batch_id == batch_id)
+            .group_by(Report.status)
+            .all()
+        )
+        return {status: count for status, count in rows}
+
+    @classmethod
+    async def count_reports_by_status_async(cls, db: AsyncSession, batch_id):
+        result = await db.execute(
+            select(Report.status, func.count(Report.id))
+            .where(Report.batch_id == batch_id)
+            .group_by(Report.status)
+        )
+        return {status: count for status, count in result.all()}
 
     @classmethod
     def populate_report(
-        cls, db, report_id, title, description, status=ReportStatus.PROCESSING
+        cls,
+        db,
+        report_id,
+        title,
+        description,
+        status=ReportStatus.PROCESSING,
+        analysis=None,
     ):
         report = cls.get_report_by_id(db, report_id)
         if report:
             report.title = title
             report.description = description
             report.status = status
+            if analysis is not None:
+                report.analysis = analysis
             db.commit()
             db.refresh(report)
             return report
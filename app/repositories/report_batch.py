@@ -0,0 +1,29 @@
+from typing import Optional
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from ..models.report_batch import ReportBatch
+from ..schemas.report_batch import ReportBatch as ReportBatchSchema
+
+
+class ReportBatchRepository:
+
+    @classmethod
+    def add_batch(cls, db: Session, user_id, total):
+        batch = ReportBatch(user_id=user_id, total=total)
+        db.add(batch)
+        db.commit()
+        db.refresh(batch)
+        return ReportBatchSchema.model_validate(batch)
+
+    @classmethod
+    def get_batch_by_id(cls, db: Session, batch_id) -> Optional[ReportBatchSchema]:
+        batch = db.query(ReportBatch).filter(ReportBatch.id == batch_id).first()
+        return ReportBatchSchema.model_validate(batch) if batch else None
+
+    @classmethod
+    async def get_batch_by_id_async(
+        cls, db: AsyncSession, batch_id
+    ) -> Optional[ReportBatchSchema]:
+        batch = await db.scalar(select(ReportBatch).where(ReportBatch.id == batch_id))
+        return ReportBatchSchema.model_validate(batch) if batch else None
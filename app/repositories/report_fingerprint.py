@@ -0,0 +1,73 @@
+from typing import Optional
+from sqlalchemy.orm import Session
+from app.query_models.report import ReportStatus
+from ..models.report import Report
+from ..models.report_fingerprint import ReportFingerprint
+
+
+class ReportFingerprintRepository:
+    # Perceptual matches must agree on the leading hex digits of the hash,
+    # which turns the lookup into a range scan of the user's fingerprints on
+    # ix_REPORT_FINGERPRINTS_USER_ID_PERCEPTUAL_HASH. Near-duplicates that
+    # differ inside the prefix are missed and simply get analysed again.
+    PERCEPTUAL_PREFIX_LENGTH = 4
+
+    @classmethod
+    def add_fingerprint(
+        cls, db: Session, user_id, report_id, content_hash, perceptual_hash=None
+    ):
+        fingerprint = ReportFingerprint(
+            user_id=user_id,
+            report_id=report_id,
+            content_hash=content_hash,
+            perceptual_hash=perceptual_hash,
+        )
+        db.add(fingerprint)
+        db.commit()
+        db.refresh(fingerprint)
+        return fingerprint
+
+    @classmethod
+    def _reusable_reports(cls, db: Session, user_id):
+        return (
+            db.query(ReportFingerprint, Report)
+            .join(Report, Report.id == ReportFingerprint.report_id)
+            .filter(
+                ReportFingerprint.user_id == user_id,
+                Report.status == ReportStatus.COMPLETED,
+                Report.analysis.is_not(None),
+            )
+            .order_by(Report.created_at.desc())
+        )
+
+    @classmethod
+    def find_report_by_content_hash(
+        cls, db: Session, user_id, content_hash
+    ) -> Optional[Report]:
+        row = (
+            cls._reusable_reports(db, user_id)
+            .filter(ReportFingerprint.content_hash == content_hash)
+            .first()
+        )
+        return row[1] if row else None
+
+    @classmethod
+    def find_report_by_perceptual_hash(
+        cls, db: Session, user_id, perceptual_hash, max_distance
+    ) -> Optional[Report]:
+        target = int(perceptual_hash, 16)
+        prefix = perceptual_hash[: cls.PERCEPTUAL_PREFIX_LENGTH]
+        # Hashes are lowercase hex, so "g" sorts after every hash with the prefix.
+        rows = cls._reusable_reports(db, user_id).filter(
+            ReportFingerprint.perceptual_hash >= prefix,
+            ReportFingerprint.perceptual_hash < prefix + "g",
+        )
+        for fingerprint, report in rows:
+            distance = bin(int(fingerprint.perceptual_hash, 16) ^ target).count("1")
+            if distance <= max_distance:
+                return report
+        return None
+
+    @classmethod
+    def count_fingerprints(cls, db: Session) -> int:
+        return db.query(ReportFingerprint).count()
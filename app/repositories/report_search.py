@@ -0,0 +1,104 @@
+import re
+from typing import List
+from sqlalchemy import column, func, literal_column, or_, select, table
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.query_models.report import ReportStatus
+from ..models.report import Report
+from ..schemas.report import Report as ReportSchema, ReportSearchResult
+
+SEARCH_TOKEN_PATTERN = re.compile(r"\w+", re.UNICODE)
+
+HIGHLIGHT_START = "<mark>"
+HIGHLIGHT_END = "</mark>"
+
+# FTS5 index over REPORTS title and description (migration 0009), kept in
+# sync by triggers; joined back to REPORTS on its UNINDEXED ID column.
+reports_fts = table("REPORTS_FTS", column("ID"))
+
+
+class ReportSearchRepository:
+    """
+    Full-text search over report title and description: FTS5 on SQLite,
+    the generated SEARCH_VECTOR tsvector column with a GIN index on Postgres,
+    and a LIKE scan on anything else. Title matches rank above description
+    matches. Deleted reports stay in the index and are filtered out here.
+    """
+
+    @classmethod
+    def fts5_match(cls, query: str) -> str:
+        """
+        Turns free text into an FTS5 query: every word must match as a
+        prefix, so "elevat" finds "elevated" and partially typed words match.
+        Words are quoted so FTS5 operators and punctuation in the input are
+        never interpreted.
+        """
+        tokens = SEARCH_TOKEN_PATTERN.findall(query.lower())
+        return " ".join(f'"{token}"*' for token in tokens)
+
+    @classmethod
+    def search_query(cls, dialect: str, user_id: str, query: str, limit: int):
+        visible = (
+            Report.user_id == user_id,
+            Report.status.is_not(ReportStatus.DELETED),
+        )
+        if dialect == "sqlite":
+            fts = literal_column('"REPORTS_FTS"')
+            # bm25() is lower for better matches; weights follow the columns
+            # (ID, TITLE, DESCRIPTION), with the title weighted 10x.
+            rank = (-func.bm25(fts, 0.0, 10.0, 1.0)).label("rank")
+            snippet = func.snippet(
+                fts, -1, HIGHLIGHT_START, HIGHLIGHT_END, "…", 16
+            ).label("snippet")
+            return (
+                select(Report, rank, snippet)
+                .join(reports_fts, reports_fts.c.ID == Report.id)
+                .where(fts.op("MATCH")(cls.fts5_match(query)), *visible)
+                .order_by(rank.desc())
+                .limit(limit)
+            )
+        if dialect == "postgresql":
+            tsquery = func.websearch_to_tsquery("english", query)
+            vector = literal_column('"REPORTS"."SEARCH_VECTOR"')
+            rank = func.ts_rank_cd(vector, tsquery).label("rank")
+            snippet = func.ts_headline(
+                "english",
+                func.concat_ws(" — ", Report.title, Report.description),
+                tsquery,
+                f"StartSel={HIGHLIGHT_START}, StopSel={HIGHLIGHT_END}, "
+                "MaxFragments=2, MaxWords=24, MinWords=8",
+            ).label("snippet")
+            return (
+                select(Report, rank, snippet)
+                .where(vector.op("@@")(tsquery), *visible)
+                .order_by(rank.desc())
+                .limit(limit)
+            )
+        return (
+            select(Report)
+            .where(
+                or_(Report.title.icontains(query), Report.description.icontains(query)),
+                *visible,
+            )
+            .order_by(Report.created_at.desc())
+            .limit(limit)
+        )
+
+    @classmethod
+    def to_results(cls, rows) -> List[ReportSearchResult]:
+        results = []
+        for row in rows:
+            report = ReportSchema.model_validate(row[0]).model_dump()
+            if len(row) > 1:
+                report.update(rank=row.rank, snippet=row.snippet)
+            results.append(ReportSearchResult.model_validate(report))
+        return results
+
+    @classmethod
+    async def search_async(
+        cls, db: AsyncSession, user_id: str, query: str, limit: int
+    ) -> List[ReportSearchResult]:
+        if not SEARCH_TOKEN_PATTERN.search(query):
+            return []
+        dialect = db.bind.dialect.name
+        result = await db.execute(cls.search_query(dialect, user_id, query, limit))
+        return cls.to_results(result.all())
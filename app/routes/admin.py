@@ -0,0 +1,80 @@
+import secrets
+from typing import Optional
+from fastapi import APIRouter, Depends, Header, HTTPException, status
+from sqlalchemy.orm import Session
+
+from ..config import settings
+from ..database import database_stats, get_db
+from ..services.embedding_cache import query_embedding_cache
+from ..services.job_queue import report_job_queue
+from ..services.llm_client import llm_gateway
+from ..services.report import ReportService
+from ..services.report_dedup import report_dedup_cache
+from ..services.report_events import report_event_bus
+from ..services.vector_storage import vector_storage_service
+
+
+def require_admin_key(x_admin_key: Optional[str] = Header(default=None)):
+    if not settings.ADMIN_API_KEY:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Admin API is disabled; set ADMIN_API_KEY",
+        )
+    if x_admin_key is None or not secrets.compare_digest(
+        x_admin_key, settings.ADMIN_API_KEY
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid admin key"
+        )
+
+
+router = APIRouter(
+    prefix="/admin",
+    dependencies=[Depends(require_admin_key)],
+    responses={404: {"description": "Not found"}},
+)
+
+
+@router.get("/jobs/stats", status_code=status.HTTP_200_OK)
+async def get_job_stats():
+    return {"data": report_job_queue.stats()}
+
+
+@router.get("/embedding-cache/stats", status_code=status.HTTP_200_OK)
+async def get_embedding_cache_stats():
+    return {"data": query_embedding_cache.stats()}
+
+
+@router.get("/report-cache/stats", status_code=status.HTTP_200_OK)
+def get_report_cache_stats(db: Session = Depends(get_db)):
+    return {"data": report_dedup_cache.stats(db)}
+
+
+@router.get("/database/stats", status_code=status.HTTP_200_OK)
+async def get_database_stats():
+    return {"data": database_stats()}
+
+
+@router.get("/llm/stats", status_code=status.HTTP_200_OK)
+async def get_llm_stats():
+    return {"data": llm_gateway.stats()}
+
+
+@router.get("/report-analysis/stats", status_code=status.HTTP_200_OK)
+async def get_report_analysis_stats():
+    return {"data": ReportService.parse_stats()}
+
+
+@router.get("/report-events/stats", status_code=status.HTTP_200_OK)
+async def get_report_event_stats():
+    return {"data": report_event_bus.stats()}
+
+
+@router.get("/vector-storage/health", status_code=status.HTTP_200_OK)
+async def get_vector_storage_health():
+    return {"data": await vector_storage_service.health()}
+
+
+@router.post("/vector-storage/reconcile", status_code=status.HTTP_200_OK)
+async def reconcile_vector_storage(dry_run: bool = False):
+    return {"data": await vector_storage_service.reconcile(dry_run=dry_run)}
@@ -1,12 +1,18 @@
-from fastapi import APIRouter, Depends, HTTPException
+from typing import Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from fastapi.logger import logger
+from fastapi.responses import StreamingResponse
 from app.repositories.chat import ChatRepository
 from app.response.chat import ChatRequest, ChatResponse, CreateChatRequest
 from app.services.chat import ChatService
+from app.services.chat_pipeline import ChatPipeline
 from app.services.doctor_agent import DoctorAgent
-from sqlalchemy.orm import Session
-from app.query_models.message import MessageOwner
+from app.config import settings
+from app.utils.common.sse import format_sse
+from app.utils.db.pagination import InvalidCursorError
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from ..database import get_db
+from ..database import AsyncSessionLocal, get_async_db
 
 
 router = APIRouter(
@@ -16,64 +22,133 @@ router = APIRouter(
 
 
 @router.post("")
-async def chat_with_doctor(request: ChatRequest, db: Session = Depends(get_db)):
+async def chat_with_doctor(
+    request: ChatRequest,
+    response: Response,
+    db: AsyncSession = Depends(get_async_db),
+):
     """
     Handles conversational chat requests with the Doctor Agent,
     with RAG support for previous reports.
     """
     try:
-        history_for_agent = []
-        if request.chat_id is not None:
-            messages = await ChatService.get_messages(chat_id=request.chat_id, db=db)
-            history_for_agent = [msg.model_dump() for msg in messages]
-
-        message = await ChatService.create_message(
-            chat_id=request.chat_id,
+        turn, response_content = await ChatPipeline.run(
             db=db,
-            message=request.user_message,
-            owner=MessageOwner.USER,
             user_id=request.user_id,
+            user_message=request.user_message,
+            chat_id=request.chat_id,
         )
+        response.headers["Server-Timing"] = turn.timer.server_timing_header()
 
-        request.chat_id = message.chat_id
+        chat_response = ChatResponse(data=response_content, chat_id=turn.chat_id)
 
-        response_content = await DoctorAgent.get_chat_response(
-            user_id=request.user_id,
-            user_message=request.user_message,
-            chat_history=history_for_agent,
-        )
+        return {"data": chat_response}
+    except Exception as e:
+        print(f"Error in /chat endpoint: {e}")
+        raise HTTPException(status_code=500, detail=f"Internal server error: {e}")
 
-        await ChatService.create_message(
-            chat_id=request.chat_id,
+
+@router.post("/stream")
+async def stream_chat_with_doctor(
+    request: ChatRequest,
+    http_request: Request,
+    db: AsyncSession = Depends(get_async_db),
+):
+    """
+    Streams the Doctor Agent's reply as Server-Sent Events.
+
+    Emits a `chat` event with the chat id first, then `token` events as text
+    arrives, and `done` once the reply has been saved. The MODEL message is only
+    persisted when generation completes; a client disconnect cancels the
+    upstream generation and nothing is stored.
+    """
+    try:
+        turn = await ChatPipeline.prepare(
             db=db,
-            message=response_content,
-            owner=MessageOwner.MODEL,
             user_id=request.user_id,
+            user_message=request.user_message,
+            chat_id=request.chat_id,
         )
-
-        response = ChatResponse(data=response_content, chat_id=request.chat_id)
-
-        return {"data": response}
     except Exception as e:
-        print(f"Error in /chat endpoint: {e}")
+        logger.error(f"Error in /chat/stream endpoint: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail=f"Internal server error: {e}")
 
+    async def event_stream():
+        yield format_sse("chat", {"chatId": turn.chat_id})
+
+        response_parts = []
+        try:
+            async for text in DoctorAgent.stream_chat_response(turn.full_prompt):
+                if await http_request.is_disconnected():
+                    return
+                response_parts.append(text)
+                yield format_sse("token", {"text": text})
+        except Exception as e:
+            logger.error(f"Error streaming chat response from LLM: {e}", exc_info=True)
+            yield format_sse("error", {"detail": "Failed to generate a response."})
+            return
+
+        # The request-scoped session is released before the body is streamed,
+        # so the reply is saved with a session of its own.
+        async with AsyncSessionLocal() as stream_db:
+            model_message = await ChatPipeline.complete(
+                db=stream_db, turn=turn, response_content="".join(response_parts)
+            )
+
+        yield format_sse(
+            "done", {"chatId": turn.chat_id, "messageId": model_message.id}
+        )
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
 
 @router.get("/{chat_id}")
-async def get_messages(chat_id: str, db: Session = Depends(get_db)):
-    messages = await ChatService.get_messages(chat_id=chat_id, db=db)
-    return {"data": messages}
+async def get_messages(
+    chat_id: str,
+    limit: int = Query(
+        settings.CHAT_MESSAGES_PAGE_DEFAULT_LIMIT, ge=1, le=settings.PAGE_MAX_LIMIT
+    ),
+    cursor: Optional[str] = None,
+    db: AsyncSession = Depends(get_async_db),
+):
+    """
+    The chat's latest messages, oldest first within the page. `next_cursor`
+    pages further back in the conversation and is null at its start.
+    """
+    try:
+        page = await ChatService.get_messages(
+            chat_id=chat_id, db=db, limit=limit, cursor=cursor
+        )
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    return {"data": page.items, "next_cursor": page.next_cursor}
 
 
 @router.get("")
-async def get_chats(user_id: str, db: Session = Depends(get_db)):
-    messages = await ChatService.get_chats(user_id=user_id, db=db)
-    return {"data": messages}
+async def get_chats(
+    user_id: str,
+    limit: int = Query(settings.PAGE_DEFAULT_LIMIT, ge=1, le=settings.PAGE_MAX_LIMIT),
+    cursor: Optional[str] = None,
+    db: AsyncSession = Depends(get_async_db),
+):
+    try:
+        page = await ChatService.get_chats(
+            user_id=user_id, db=db, limit=limit, cursor=cursor
+        )
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    return {"data": page.items, "next_cursor": page.next_cursor}
 
 
 @router.post("/create")
-async def create_chat(request: CreateChatRequest, db: Session = Depends(get_db)):
-    created_chat = ChatRepository.create_chat(
+async def create_chat(
+    request: CreateChatRequest, db: AsyncSession = Depends(get_async_db)
+):
+    created_chat = await ChatRepository.create_chat_async(
         db=db,
         title=request.title,
         user_id=request.user_id,
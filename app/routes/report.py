@@ -1,8 +1,32 @@
-from fastapi import APIRouter, Depends, File, UploadFile, status
+import asyncio
+from typing import List, Optional
+from fastapi import (
+    APIRouter,
+    Depends,
+    File,
+    Header,
+    HTTPException,
+    Query,
+    Request,
+    UploadFile,
+    status,
+)
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from ..database import get_db
+from ..config import settings
+from ..database import get_async_db, get_db
+from ..services.job_queue import QueueFullError
 from ..services.report import ReportService
+from ..services.report_events import event_id_key, report_event_bus
+from ..services.upload_storage import (
+    TooManyFilesError,
+    UnsupportedUploadError,
+    UploadTooLargeError,
+)
+from ..utils.common.sse import format_sse
+from ..utils.db.pagination import InvalidCursorError
 
 
 router = APIRouter(
@@ -12,17 +36,101 @@ router = APIRouter(
 
 
 @router.get("", status_code=status.HTTP_200_OK)
-async def get_reports(user_id: str, db: Session = Depends(get_db)):
-    results = await ReportService.get_reports(db=db, user_id=user_id)
-    return {"data": results}
+async def get_reports(
+    user_id: str,
+    limit: int = Query(settings.PAGE_DEFAULT_LIMIT, ge=1, le=settings.PAGE_MAX_LIMIT),
+    cursor: Optional[str] = None,
+    db: AsyncSession = Depends(get_async_db),
+):
+    """
+    The user's reports, newest first, one page at a time. Pass the returned
+    `next_cursor` as `cursor` for the next page; it is null on the last one.
+    """
+    try:
+        page = await ReportService.get_reports(
+            db=db, user_id=user_id, limit=limit, cursor=cursor
+        )
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    return {"data": page.items, "next_cursor": page.next_cursor}
 
 
 @router.get("/search", status_code=status.HTTP_200_OK)
-async def search_reports(q: str = "", user_id: str = "", db: Session = Depends(get_db)):
-    results = await ReportService.get_reports_by_title(db=db, title=q, user_id=user_id)
+async def search_reports(
+    q: str = "",
+    user_id: str = "",
+    limit: int = Query(settings.PAGE_DEFAULT_LIMIT, ge=1, le=settings.PAGE_MAX_LIMIT),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """
+    Full-text search over the user's report titles and descriptions, best
+    match first. Each result has a `rank` and a `snippet` of the matching
+    text with matches wrapped in <mark>...</mark>.
+    """
+    results = await ReportService.search_reports(
+        db=db, query=q, user_id=user_id, limit=limit
+    )
     return {"data": results}
 
 
+@router.get("/events")
+async def stream_report_events(
+    user_id: str,
+    http_request: Request,
+    last_event_id: Optional[str] = Header(default=None, alias="Last-Event-ID"),
+):
+    """
+    Pushes the user's report status transitions as Server-Sent Events.
+
+    Each `status` event carries the report id, status and batch id; its SSE id
+    can be sent back as Last-Event-ID on reconnect to replay missed events.
+    If the missed events are no longer retained a `resync` event is sent and
+    the client should reload GET /report once. Comment lines are sent as
+    heartbeats while idle.
+    """
+    subscription = report_event_bus.subscribe(user_id)
+
+    async def event_stream():
+        try:
+            yield "retry: 3000\n\n"
+            last_sent = None
+            if last_event_id:
+                missed = await report_event_bus.replay(user_id, last_event_id)
+                if missed is None:
+                    yield format_sse("resync", {"reason": "history unavailable"})
+                else:
+                    for event in missed:
+                        last_sent = event.id
+                        yield format_sse("status", event.to_payload(), event.id)
+
+            while not subscription.lagged:
+                try:
+                    event = await asyncio.wait_for(
+                        subscription.queue.get(),
+                        timeout=settings.REPORT_EVENTS_HEARTBEAT_SECONDS,
+                    )
+                except asyncio.TimeoutError:
+                    if await http_request.is_disconnected():
+                        return
+                    yield ": heartbeat\n\n"
+                    continue
+                # Events published while replaying are both replayed and queued.
+                if last_sent is not None and event_id_key(event.id) <= event_id_key(
+                    last_sent
+                ):
+                    continue
+                last_sent = event.id
+                yield format_sse("status", event.to_payload(), event.id)
+        finally:
+            report_event_bus.unsubscribe(subscription)
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @router.delete("/{report_id}", status_code=status.HTTP_200_OK)
 async def delete_report(report_id: str, db: Session = Depends(get_db)):
     result = await ReportService.delete_report(db=db, report_id=report_id)
@@ -32,14 +140,83 @@ async def delete_report(report_id: str, db: Session = Depends(get_db)):
 @router.post("/upload", status_code=status.HTTP_201_CREATED)
 async def upload_report(
     user_id: str,
-    uploaded_file: UploadFile = File(..., media_type="image/jpeg"),
+    uploaded_file: UploadFile = File(..., description="Report image or PDF"),
+    additional_files: List[UploadFile] = File(
+        default=[], description="Further pages of the same report"
+    ),
+    force_reanalysis: bool = False,
     db: Session = Depends(get_db),
 ):
     """
     Uploads a report file.
 
-    :param file: The file to be uploaded.
+    :param file: The file to be uploaded (JPEG/PNG image or multi-page PDF).
+    :param additional_files: More images or PDFs belonging to the same report.
+    :param force_reanalysis: Skip the duplicate-upload cache and analyse again.
     :return: A success message.
     """
 
-    return await ReportService.upload_report(db=db, file=uploaded_file, user_id=user_id)
+    try:
+        return await ReportService.upload_report(
+            db=db,
+            files=[uploaded_file, *additional_files],
+            user_id=user_id,
+            force_reanalysis=force_reanalysis,
+        )
+    except QueueFullError as e:
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=str(e))
+    except TooManyFilesError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except UploadTooLargeError as e:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE, detail=str(e)
+        )
+    except UnsupportedUploadError as e:
+        raise HTTPException(
+            status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE, detail=str(e)
+        )
+
+
+@router.post("/upload/batch", status_code=status.HTTP_202_ACCEPTED)
+async def upload_report_batch(
+    user_id: str,
+    uploaded_files: List[UploadFile] = File(
+        ..., description="One image or PDF per report"
+    ),
+    force_reanalysis: bool = False,
+    db: Session = Depends(get_db),
+):
+    """
+    Uploads many reports at once and returns a batch id immediately.
+    Progress is available from GET /report/upload/batch/{batch_id}.
+    """
+    try:
+        result = await ReportService.upload_report_batch(
+            db=db,
+            files=uploaded_files,
+            user_id=user_id,
+            force_reanalysis=force_reanalysis,
+        )
+    except QueueFullError as e:
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=str(e))
+    except TooManyFilesError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except UploadTooLargeError as e:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE, detail=str(e)
+        )
+    except UnsupportedUploadError as e:
+        raise HTTPException(
+            status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE, detail=str(e)
+        )
+    return {"data": result}
+
+
+@router.get("/upload/batch/{batch_id}", status_code=status.HTTP_200_OK)
+async def get_report_batch_progress(
+    batch_id: str, db: AsyncSession = Depends(get_async_db)
+):
+    progress = await ReportService.get_batch_progress(db=db, batch_id=batch_id)
+    if progress is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Batch not found")
+    return {"data": progress}
@@ -1,4 +1,5 @@
 import datetime
+from typing import Optional
 from app.schemas.base import BaseSchema
 
 
@@ -10,3 +11,12 @@ class Chat(BaseSchema):
     class Config:
         orm_mode = True
         from_attributes = True
+
+
+class ChatSummary(BaseSchema):
+    summary: Optional[str] = None
+    summarized_message_count: int = 0
+
+    class Config:
+        orm_mode = True
+        from_attributes = True
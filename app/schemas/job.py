@@ -0,0 +1,24 @@
+from datetime import datetime
+from typing import Optional
+
+from app.query_models.job import JobStatus
+from app.schemas.base import BaseSchema
+
+
+class Job(BaseSchema):
+    id: str
+    report_id: str
+    user_id: str
+    batch_id: Optional[str] = None
+    status: JobStatus
+    attempts: int
+    max_attempts: int
+    upload_path: str
+    last_error: Optional[str] = None
+    created_at: Optional[datetime] = None
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+
+    class Config:
+        orm_mode = True
+        from_attributes = True
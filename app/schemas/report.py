@@ -10,7 +10,14 @@ class Report(BaseSchema):
     status: ReportStatus
     title: Optional[str] = None
     description: Optional[str] = None
+    batch_id: Optional[str] = None
 
     class Config:
         orm_mode = True
         from_attributes = True
+
+
+class ReportSearchResult(Report):
+    # Higher is better; "<mark>"-highlighted excerpt of the matching text.
+    rank: float = 0.0
+    snippet: Optional[str] = None
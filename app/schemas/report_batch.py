@@ -0,0 +1,30 @@
+from datetime import datetime
+from typing import List, Optional
+
+from app.schemas.base import BaseSchema
+from app.schemas.report import Report
+
+
+class ReportBatch(BaseSchema):
+    id: str
+    user_id: str
+    total: int
+    created_at: Optional[datetime] = None
+
+    class Config:
+        orm_mode = True
+        from_attributes = True
+
+
+class ReportBatchUpload(BaseSchema):
+    batch_id: str
+    reports: List[Report]
+
+
+class ReportBatchProgress(BaseSchema):
+    batch_id: str
+    total: int
+    processing: int
+    completed: int
+    failed: int
+    done: bool
@@ -2,7 +2,10 @@ from typing import List, Optional
 from app.query_models.message import MessageOwner
 from app.repositories.chat import ChatRepository
 from app.repositories.message import MessageRepository
+from app.schemas.chat import Chat
 from app.schemas.message import Message
+from app.utils.db.pagination import Page
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 
@@ -36,9 +39,17 @@ class ChatService:
         return created_message
 
     @classmethod
-    async def get_messages(cls, db: Session, chat_id: str) -> List[Message]:
-        return MessageRepository.get_messages_by_chat_id(db=db, chat_id=chat_id)
+    async def get_messages(
+        cls, db: AsyncSession, chat_id: str, limit: int, cursor: Optional[str] = None
+    ) -> Page[Message]:
+        return await MessageRepository.get_messages_page_async(
+            db=db, chat_id=chat_id, limit=limit, cursor=cursor
+        )
 
     @classmethod
-    async def get_chats(cls, db: Session, user_id: str):
-        return ChatRepository.get_chats_by_user_id(user_id=user_id, db=db)
+    async def get_chats(
+        cls, db: AsyncSession, user_id: str, limit: int, cursor: Optional[str] = None
+    ) -> Page[Chat]:
+        return await ChatRepository.get_chats_page_async(
+            user_id=user_id, db=db, limit=limit, cursor=cursor
+        )
@@ -0,0 +1,102 @@
+import asyncio
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Set
+from fastapi.logger import logger
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.config import settings
+from app.database import AsyncSessionLocal
+from app.repositories.chat import ChatRepository
+from app.repositories.message import MessageRepository
+from .doctor_agent import DoctorAgent
+
+
+@dataclass
+class ChatHistory:
+    summary: Optional[str]
+    messages: List[Dict]
+
+
+class ChatHistoryManager:
+    """
+    Rolling chat-history window.
+
+    The last CHAT_HISTORY_VERBATIM_TURNS turns are sent verbatim; older
+    messages are folded into `Chat.summary`. The summary is extended
+    incrementally once CHAT_SUMMARY_INTERVAL_MESSAGES messages have fallen out
+    of the verbatim window, so it is never regenerated from scratch.
+    """
+
+    _summarizing: Set[str] = set()
+
+    @classmethod
+    def verbatim_message_count(cls) -> int:
+        return settings.CHAT_HISTORY_VERBATIM_TURNS * 2
+
+    @classmethod
+    async def load(cls, db: AsyncSession, chat_id: str) -> ChatHistory:
+        chat = await ChatRepository.get_chat_summary_async(db, chat_id)
+        summary = chat.summary if chat else None
+        summarized_count = chat.summarized_message_count if chat else 0
+
+        total = await MessageRepository.count_messages_by_chat_id_async(db, chat_id)
+        # Messages that are not yet in the summary are always sent, so nothing
+        # is dropped while a summary update is pending.
+        limit = max(cls.verbatim_message_count(), total - summarized_count)
+        if total == 0:
+            return ChatHistory(summary=summary, messages=[])
+
+        messages = await MessageRepository.get_messages_by_chat_id_async(
+            db=db, chat_id=chat_id, limit=limit
+        )
+        return ChatHistory(
+            summary=summary, messages=[message.model_dump() for message in messages]
+        )
+
+    @classmethod
+    def schedule_summary_update(cls, chat_id: str) -> None:
+        if chat_id in cls._summarizing:
+            return
+        cls._summarizing.add(chat_id)
+        task = asyncio.create_task(cls._update_summary(chat_id))
+        task.add_done_callback(lambda _: cls._summarizing.discard(chat_id))
+
+    @classmethod
+    async def _update_summary(cls, chat_id: str) -> None:
+        # The session is not held open across the LLM call.
+        try:
+            async with AsyncSessionLocal() as db:
+                chat = await ChatRepository.get_chat_summary_async(db, chat_id)
+                if chat is None:
+                    return
+                summarized_count = chat.summarized_message_count
+
+                total = await MessageRepository.count_messages_by_chat_id_async(
+                    db, chat_id
+                )
+                pending = total - cls.verbatim_message_count() - summarized_count
+                if pending < settings.CHAT_SUMMARY_INTERVAL_MESSAGES:
+                    return
+
+                messages = await MessageRepository.get_messages_slice_async(
+                    db=db, chat_id=chat_id, offset=summarized_count, limit=pending
+                )
+
+            summary = await DoctorAgent.summarize_conversation(
+                previous_summary=chat.summary,
+                messages=[message.model_dump() for message in messages],
+            )
+
+            async with AsyncSessionLocal() as db:
+                stored = await ChatRepository.update_summary_async(
+                    db=db,
+                    chat_id=chat_id,
+                    summary=summary,
+                    summarized_message_count=summarized_count + len(messages),
+                    previous_message_count=summarized_count,
+                )
+            if stored:
+                logger.info(
+                    f"Folded {len(messages)} messages into the summary of chat {chat_id}"
+                )
+        except Exception as e:
+            logger.error(f"Failed to update summary for chat {chat_id}: {e}", exc_info=True)
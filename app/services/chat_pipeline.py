@@ -0,0 +1,170 @@
+import asyncio
+import time
+from dataclasses import dataclass, field
+from typing import Awaitable, Dict, Optional, TypeVar
+from fastapi.logger import logger
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.database import AsyncSessionLocal
+from app.query_models.message import MessageOwner
+from app.repositories.chat import ChatRepository
+from app.repositories.message import MessageRepository
+from app.schemas.message import Message
+from .chat_history import ChatHistory, ChatHistoryManager
+from .doctor_agent import DoctorAgent
+
+T = TypeVar("T")
+
+
+class StageTimer:
+    def __init__(self) -> None:
+        self.timings: Dict[str, float] = {}
+        self._started = time.perf_counter()
+
+    async def measure(self, stage: str, awaitable: Awaitable[T]) -> T:
+        started = time.perf_counter()
+        try:
+            return await awaitable
+        finally:
+            self.timings[stage] = (time.perf_counter() - started) * 1000
+
+    def finish(self) -> Dict[str, float]:
+        self.timings["total"] = (time.perf_counter() - self._started) * 1000
+        return self.timings
+
+    def server_timing_header(self) -> str:
+        return ", ".join(
+            f"{stage};dur={duration:.1f}" for stage, duration in self.timings.items()
+        )
+
+
+@dataclass
+class ChatTurn:
+    chat_id: str
+    user_id: str
+    full_prompt: str
+    user_message_write: asyncio.Task
+    timer: StageTimer = field(default_factory=StageTimer)
+
+    async def saved_user_message(self) -> Message:
+        return await self.user_message_write
+
+
+class ChatPipeline:
+    """
+    Runs a chat turn as stages, overlapping the ones that don't depend on each
+    other (history is the rolling window from ChatHistoryManager):
+
+        retrieval (embed + vector search) ─┐
+        history load ──────────────────────┴─> prompt -> LLM -> MODEL message
+        USER message write (own session) ─────────────────────┘
+
+    The USER message is written off the critical path and only awaited before
+    the MODEL message is stored, so message order is preserved.
+    """
+
+    @classmethod
+    async def prepare(
+        cls,
+        db: AsyncSession,
+        user_id: str,
+        user_message: str,
+        chat_id: Optional[str],
+    ) -> ChatTurn:
+        timer = StageTimer()
+
+        retrieval = asyncio.create_task(
+            timer.measure(
+                "retrieval",
+                DoctorAgent.retrieve_reports(user_id=user_id, user_message=user_message),
+            )
+        )
+
+        try:
+            history = ChatHistory(summary=None, messages=[])
+            if chat_id is not None:
+                history = await timer.measure(
+                    "history", ChatHistoryManager.load(db=db, chat_id=chat_id)
+                )
+            else:
+                created_chat = await timer.measure(
+                    "create_chat",
+                    ChatRepository.create_chat_async(
+                        db=db, title=user_message, user_id=user_id
+                    ),
+                )
+                chat_id = created_chat.id
+        except BaseException:
+            retrieval.cancel()
+            raise
+
+        user_message_write = asyncio.create_task(
+            timer.measure(
+                "user_message_write",
+                cls._write_message(
+                    user_id=user_id,
+                    chat_id=chat_id,
+                    message=user_message,
+                    owner=MessageOwner.USER,
+                ),
+            )
+        )
+
+        retrieved_reports = await retrieval
+        full_prompt = await DoctorAgent.build_chat_prompt(
+            user_id=user_id,
+            user_message=user_message,
+            chat_history=history.messages,
+            retrieved_reports=retrieved_reports,
+            history_summary=history.summary,
+        )
+
+        return ChatTurn(
+            chat_id=chat_id,
+            user_id=user_id,
+            full_prompt=full_prompt,
+            user_message_write=user_message_write,
+            timer=timer,
+        )
+
+    @classmethod
+    async def complete(
+        cls, db: AsyncSession, turn: ChatTurn, response_content: str
+    ) -> Message:
+        await turn.saved_user_message()
+        model_message = await turn.timer.measure(
+            "model_message_write",
+            MessageRepository.add_message_async(
+                db=db,
+                user_id=turn.user_id,
+                message=response_content,
+                owner=MessageOwner.MODEL,
+                chat_id=turn.chat_id,
+            ),
+        )
+        logger.info(f"Chat turn timings (ms) for {turn.chat_id}: {turn.timer.finish()}")
+        ChatHistoryManager.schedule_summary_update(turn.chat_id)
+        return model_message
+
+    @classmethod
+    async def run(
+        cls,
+        db: AsyncSession,
+        user_id: str,
+        user_message: str,
+        chat_id: Optional[str],
+    ):
+        turn = await cls.prepare(
+            db=db, user_id=user_id, user_message=user_message, chat_id=chat_id
+        )
+        response_content = await turn.timer.measure(
+            "llm", DoctorAgent.generate_chat_response(turn.full_prompt)
+        )
+        await cls.complete(db=db, turn=turn, response_content=response_content)
+        return turn, response_content
+
+    @staticmethod
+    async def _write_message(user_id, chat_id, message, owner) -> Message:
+        async with AsyncSessionLocal() as db:
+            return await MessageRepository.add_message_async(
+                db=db, user_id=user_id, message=message, owner=owner, chat_id=chat_id
+            )
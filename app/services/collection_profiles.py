@@ -0,0 +1,94 @@
+from dataclasses import dataclass
+from typing import Dict, Optional
+from qdrant_client import models
+from app.config import settings
+
+
+@dataclass(frozen=True)
+class CollectionProfile:
+    """
+    Storage layout of the Qdrant collection, selected with
+    VECTOR_COLLECTION_PROFILE.
+
+    - quantized: int8 scalar quantization kept in RAM; searches rescore the
+      oversampled candidates with the original vectors.
+    - vectors_on_disk: original float32 vectors are memory-mapped instead of
+      held in RAM (only sensible together with quantization).
+    - payload_on_disk: payloads are read from disk when returned.
+    - tenant_index: `user_id` is a tenant index and HNSW graphs are built per
+      user (payload_m) instead of globally, since every query filters on it.
+    """
+
+    name: str
+    quantized: bool = False
+    vectors_on_disk: bool = False
+    payload_on_disk: bool = False
+    tenant_index: bool = False
+
+    def vectors_config(self, size: int) -> models.VectorParams:
+        return models.VectorParams(
+            size=size,
+            distance=models.Distance.COSINE,
+            on_disk=self.vectors_on_disk or None,
+        )
+
+    def quantization_config(self) -> Optional[models.ScalarQuantization]:
+        if not self.quantized:
+            return None
+        return models.ScalarQuantization(
+            scalar=models.ScalarQuantizationConfig(
+                type=models.ScalarType.INT8,
+                quantile=0.99,
+                always_ram=True,
+            )
+        )
+
+    def hnsw_config(self) -> Optional[models.HnswConfigDiff]:
+        if not self.tenant_index:
+            return None
+        return models.HnswConfigDiff(payload_m=16, m=0)
+
+    def search_params(self) -> Optional[models.SearchParams]:
+        if not self.quantized:
+            return None
+        return models.SearchParams(
+            quantization=models.QuantizationSearchParams(
+                rescore=True,
+                oversampling=settings.VECTOR_QUANTIZATION_OVERSAMPLING,
+            )
+        )
+
+    def payload_indexes(self) -> Dict[str, models.PayloadSchemaParams]:
+        return {
+            "user_id": models.KeywordIndexParams(
+                type=models.KeywordIndexType.KEYWORD,
+                is_tenant=self.tenant_index or None,
+            ),
+            "report_id": models.KeywordIndexParams(type=models.KeywordIndexType.KEYWORD),
+            "section": models.KeywordIndexParams(type=models.KeywordIndexType.KEYWORD),
+        }
+
+
+COLLECTION_PROFILES = {
+    "default": CollectionProfile(name="default"),
+    "balanced": CollectionProfile(
+        name="balanced", quantized=True, payload_on_disk=True, tenant_index=True
+    ),
+    "compact": CollectionProfile(
+        name="compact",
+        quantized=True,
+        vectors_on_disk=True,
+        payload_on_disk=True,
+        tenant_index=True,
+    ),
+}
+
+
+def get_collection_profile(name: str) -> CollectionProfile:
+    try:
+        return COLLECTION_PROFILES[name]
+    except KeyError:
+        raise ValueError(
+            f"Unknown VECTOR_COLLECTION_PROFILE {name!r}; "
+            f"expected one of {', '.join(COLLECTION_PROFILES)}"
+        ) from None
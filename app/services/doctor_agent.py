@@ -1,9 +1,11 @@
-from typing import Dict, List, Optional
+from typing import AsyncIterator, Dict, List, Optional
+from google.genai import types
 from app.config import settings
 from app.query_models.message import MessageOwner
-from app.types.report import MedicalReportAnalysis
+from app.types.report import MedicalReportAnalysis, MedicalReportAnalysisOutput
 from app.utils.common.return_as_function import returns_a_function_decorator
-from .llm_client import ai_client
+from app.utils.common.tokens import estimate_tokens
+from .llm_client import Priority, llm_gateway
 from .vector_storage import vector_storage_service
 
 
@@ -77,53 +79,103 @@ class DoctorAgent:
         Your response as a medical doctor:
     """
 
+    summary_prompt_template = """
+        You maintain a running summary of a conversation between a patient and a doctor.
+        Update the existing summary with the new messages below. Keep every medically relevant fact:
+        symptoms, reported values, reports discussed, advice given, and open questions.
+        Be concise, write in the third person, and return only the updated summary text.
+
+        Existing summary:
+        {previous_summary}
+
+        New messages:
+        {transcript}
+    """
+
+    repair_prompt_template = """
+        The text below was meant to be a single JSON object with exactly these string fields:
+        title, summary, conclusion, analysis, further_diagnosis, immediate_actions, vector_data.
+        It could not be parsed or is missing fields. Return the corrected JSON object only,
+        keeping the original content. Use an empty string for any field that is missing.
+
+        Text:
+        {raw_text}
+    """
+
+    @classmethod
+    def analysis_config(cls) -> Optional[types.GenerateContentConfig]:
+        if not settings.REPORT_STRUCTURED_OUTPUT:
+            return None
+        return types.GenerateContentConfig(
+            response_mime_type="application/json",
+            response_schema=MedicalReportAnalysisOutput,
+        )
+
     @classmethod
     def analyze_report(cls, image_data):
-        return ai_client.models.generate_content(
+        return llm_gateway.generate_content(
             model=settings.GOOGLE_GENAI_MODEL,
             contents=[cls.prompt, image_data],
+            config=cls.analysis_config(),
+            priority=Priority.BACKGROUND,
         )
 
     @classmethod
-    async def get_chat_response(
+    def repair_report_analysis(cls, raw_text: str):
+        """
+        Text-only call that fixes malformed analysis JSON without re-sending
+        the report image.
+        """
+        return llm_gateway.generate_content(
+            model=settings.GOOGLE_GENAI_MODEL,
+            contents=[cls.repair_prompt_template.format(raw_text=raw_text)],
+            config=types.GenerateContentConfig(
+                response_mime_type="application/json",
+                response_schema=MedicalReportAnalysisOutput,
+            ),
+            priority=Priority.BACKGROUND,
+        )
+
+    @classmethod
+    async def retrieve_reports(
+        cls, user_id: str, user_message: str
+    ) -> List[MedicalReportAnalysis]:
+        return await vector_storage_service.search_reports(
+            user_id=user_id,
+            query=user_message,  # Using user_message as the primary query
+            limit=5,  # Limit to last 5 relevant reports as per user's request example
+        )
+
+    @classmethod
+    async def build_chat_prompt(
         cls,
         user_id: str,
         user_message: str,
         chat_history: Optional[List[Dict[str, str]]] = None,
+        retrieved_reports: Optional[List[MedicalReportAnalysis]] = None,
+        history_summary: Optional[str] = None,
     ) -> str:
         """
-        Generates a conversational response from the doctor agent,
-        optionally augmented with retrieved medical reports.
+        Builds the full chat prompt, retrieving relevant medical reports for RAG
+        unless they were already retrieved by the caller. The chat history is
+        trimmed so the whole prompt stays within CHAT_PROMPT_TOKEN_BUDGET.
 
         Args:
             user_id: The ID of the user for whom to retrieve reports. This is crucial for RAG.
             user_message: The current message from the user.
             chat_history: A list of previous messages in the format [{"role": "user", "content": "..."}] or [{"role": "model", "content": "..."}].
+            retrieved_reports: Reports already retrieved for this message, if any.
+            history_summary: Rolling summary of messages older than chat_history.
         Returns:
-            A string containing the doctor's conversational response.
+            The prompt to send to the LLM.
         """
 
-        print(chat_history)
-
-        formatted_chat_history = ""
-        if chat_history:
-            for message in chat_history:
-                role_display = (
-                    "User" if message.get("owner") == MessageOwner.USER else "Doctor"
-                )
-                formatted_chat_history += (
-                    f"{role_display}: {message.get('message', '')}\n"
-                )
-
         retrieved_reports_context = "No relevant previous reports found for this query."
 
-        retrieved_reports: List[MedicalReportAnalysis] = (
-            await vector_storage_service.search_reports(
-                user_id=user_id,
-                query=user_message,  # Using user_message as the primary query
-                limit=5,  # Limit to last 5 relevant reports as per user's request example
+        if retrieved_reports is None:
+            retrieved_reports = await cls.retrieve_reports(
+                user_id=user_id, user_message=user_message
             )
-        )
 
         if retrieved_reports:
             print(f"Found {len(retrieved_reports)} relevant reports.")
@@ -141,34 +193,153 @@ class DoctorAgent:
         else:
             print("No relevant reports retrieved for this user and query.")
 
-        full_prompt = cls.chat_prompt_template.format(
+        history_budget = settings.CHAT_PROMPT_TOKEN_BUDGET - (
+            estimate_tokens(cls.chat_prompt_template)
+            + estimate_tokens(retrieved_reports_context)
+            + estimate_tokens(user_message)
+        )
+        formatted_chat_history = cls._format_chat_history(
+            chat_history=chat_history or [],
+            history_summary=history_summary,
+            token_budget=max(0, history_budget),
+        )
+
+        return cls.chat_prompt_template.format(
             user_id=(user_id if user_id else "N/A"),
             user_message=user_message,
             chat_history=formatted_chat_history,
             retrieved_reports_context=retrieved_reports_context,
         )
 
+    @staticmethod
+    def _format_chat_history(
+        chat_history: List[Dict[str, str]],
+        history_summary: Optional[str],
+        token_budget: int,
+    ) -> str:
+        """
+        Keeps the newest messages that fit in the budget. The summary gets at
+        most half of the budget and is truncated beyond that.
+        """
+        summary_text = ""
+        if history_summary:
+            max_summary_chars = (token_budget // 2) * 4
+            summary_text = history_summary[:max_summary_chars]
+        remaining = token_budget - estimate_tokens(summary_text)
+
+        message_lines: List[str] = []
+        for message in reversed(chat_history):
+            role_display = (
+                "User" if message.get("owner") == MessageOwner.USER else "Doctor"
+            )
+            line = f"{role_display}: {message.get('message', '')}\n"
+            cost = estimate_tokens(line)
+            if cost > remaining:
+                break
+            remaining -= cost
+            message_lines.append(line)
+        message_lines.reverse()
+
+        formatted_chat_history = ""
+        if summary_text:
+            formatted_chat_history += (
+                f"Summary of the earlier conversation: {summary_text}\n\n"
+            )
+        formatted_chat_history += "".join(message_lines)
+        return formatted_chat_history
+
+    @classmethod
+    async def summarize_conversation(
+        cls, previous_summary: Optional[str], messages: List[Dict[str, str]]
+    ) -> str:
+        """
+        Folds `messages` into the running conversation summary.
+        """
+        transcript = "".join(
+            f"{'User' if message.get('owner') == MessageOwner.USER else 'Doctor'}: {message.get('message', '')}\n"
+            for message in messages
+        )
+        response = await llm_gateway.generate_content_async(
+            model=settings.GOOGLE_GENAI_MODEL,
+            contents=[
+                cls.summary_prompt_template.format(
+                    previous_summary=previous_summary or "None yet.",
+                    transcript=transcript,
+                )
+            ],
+            priority=Priority.BACKGROUND,
+        )
+        text = cls._response_text(response)
+        if not text:
+            raise ValueError("Empty summary returned by the LLM")
+        return text.strip()
+
+    @classmethod
+    async def get_chat_response(
+        cls,
+        user_id: str,
+        user_message: str,
+        chat_history: Optional[List[Dict[str, str]]] = None,
+    ) -> str:
+        """
+        Generates a conversational response from the doctor agent,
+        optionally augmented with retrieved medical reports.
+
+        Returns:
+            A string containing the doctor's conversational response.
+        """
+
+        full_prompt = await cls.build_chat_prompt(
+            user_id=user_id, user_message=user_message, chat_history=chat_history
+        )
+        return await cls.generate_chat_response(full_prompt)
+
+    @classmethod
+    async def generate_chat_response(cls, full_prompt: str) -> str:
         try:
-            response = ai_client.models.generate_content(
+            response = await llm_gateway.generate_content_async(
                 model=settings.GOOGLE_GENAI_MODEL,
                 contents=[full_prompt],
+                priority=Priority.INTERACTIVE,
             )
 
-            if hasattr(response, "text"):
-                return str(response.text)
-            elif response.candidates is not None:
-                if (
-                    len(response.candidates) > 0
-                    and response.candidates[0].content is not None
-                    and response.candidates[0].content.parts is not None
-                ):
-                    llm_response_parts = []
-                    for part in response.candidates[0].content.parts:
-                        if part.text is not None:
-                            llm_response_parts.append(part.text)
-                    return "".join(llm_response_parts)
+            text = cls._response_text(response)
+            if text is not None:
+                return text
             return "I apologize, but I could not generate a coherent response at this moment. Please try again."
 
         except Exception as e:
             print(f"Error generating chat response from LLM: {e}")
             return "I'm sorry, I'm currently experiencing technical difficulties and cannot provide a response. Please try again later or consult a human medical professional."
+
+    @classmethod
+    async def stream_chat_response(cls, full_prompt: str) -> AsyncIterator[str]:
+        """
+        Yields the doctor's response text chunk by chunk as Gemini generates it.
+        Closing the iterator early cancels the upstream generation.
+        """
+        async for chunk in llm_gateway.generate_content_stream_async(
+            model=settings.GOOGLE_GENAI_MODEL,
+            contents=[full_prompt],
+            priority=Priority.INTERACTIVE,
+        ):
+            text = cls._response_text(chunk)
+            if text:
+                yield text
+
+    @staticmethod
+    def _response_text(response) -> Optional[str]:
+        if getattr(response, "text", None) is not None:
+            return str(response.text)
+        if response.candidates is not None:
+            if (
+                len(response.candidates) > 0
+                and response.candidates[0].content is not None
+                and response.candidates[0].content.parts is not None
+            ):
+                llm_response_parts = []
+                for part in response.candidates[0].content.parts:
+                    if part.text is not None:
+                        llm_response_parts.append(part.text)
+                return "".join(llm_response_parts)
+        return None
@@ -0,0 +1,686 @@
+import hashlib
+import json
+import math
+import os
+from threading import Lock
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+import numpy as np
+from fastapi.concurrency import run_in_threadpool
+from .vector_store import (
+    PointGroup,
+    ScoredVectorPoint,
+    SparseVector,
+    StoredPoint,
+    VectorPoint,
+    VectorStore,
+    reciprocal_rank_fusion,
+)
+
+
+class UserVectorPartition:
+    """
+    One user's points: a float32 matrix of unit vectors in `vectors.f32`
+    (memory-mapped for search) and an append-only `points.jsonl` mapping
+    rows to point ids and payloads. Re-upserting an id overwrites its row;
+    deleting one logs a tombstone (null payload) and leaves the row unused.
+    BM25 sparse vectors are kept as an in-memory inverted index rebuilt
+    from the same log. `compact` rewrites both files without the unused
+    rows and superseded log entries, renumbering the rows.
+    """
+
+    # Compact once at least this many log entries (and at least as many as
+    # there are live points) are tombstones or superseded upserts.
+    compact_min_garbage = 64
+
+    def __init__(self, directory: str, dimension: int) -> None:
+        self.directory = directory
+        self.dimension = dimension
+        self.vectors_path = os.path.join(directory, "vectors.f32")
+        self.points_path = os.path.join(directory, "points.jsonl")
+        self.lock = Lock()
+        self._matrix: Optional[np.memmap] = None
+        self._load()
+
+    def _reset(self) -> None:
+        self.ids: List[str] = []
+        self.payloads: List[Optional[Dict[str, Any]]] = []
+        self.rows: Dict[str, int] = {}
+        self.sparse: List[Optional[Dict[int, float]]] = []
+        self.postings: Dict[int, Dict[int, float]] = {}
+        self.log_entries = 0
+
+    def _load(self) -> None:
+        self._reset()
+        self._recover_compaction()
+        if not os.path.exists(self.points_path):
+            return
+        with open(self.points_path, "r", encoding="utf-8") as points_file:
+            for line in points_file:
+                if not line.strip():
+                    continue
+                self.log_entries += 1
+                entry = json.loads(line)
+                row = entry["row"]
+                while len(self.ids) <= row:
+                    self.ids.append("")
+                    self.payloads.append(None)
+                    self.sparse.append(None)
+                self.ids[row] = entry["id"]
+                self.payloads[row] = entry["payload"]
+                self.sparse[row] = self._sparse_weights(entry.get("sparse"))
+                if entry["payload"] is not None:
+                    self.rows[entry["id"]] = row
+                elif self.rows.get(entry["id"]) == row:
+                    del self.rows[entry["id"]]
+
+        # Rows without metadata were never completely written; ignore them.
+        stored_rows = 0
+        if os.path.exists(self.vectors_path):
+            stored_rows = os.path.getsize(self.vectors_path) // (self.dimension * 4)
+        del self.ids[stored_rows:]
+        del self.payloads[stored_rows:]
+        del self.sparse[stored_rows:]
+        self.rows = {point_id: row for point_id, row in self.rows.items() if row < stored_rows}
+        for row, weights in enumerate(self.sparse):
+            self._index_sparse(row, weights)
+
+    @staticmethod
+    def _sparse_weights(sparse) -> Optional[Dict[int, float]]:
+        if not sparse:
+            return None
+        indices, values = sparse
+        return dict(zip(indices, values))
+
+    def _index_sparse(self, row: int, weights: Optional[Dict[int, float]]) -> None:
+        for term, weight in (weights or {}).items():
+            self.postings.setdefault(term, {})[row] = weight
+
+    def _unindex_sparse(self, row: int) -> None:
+        for term in self.sparse[row] or {}:
+            postings = self.postings.get(term)
+            if postings is not None:
+                postings.pop(row, None)
+                if not postings:
+                    del self.postings[term]
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def matrix(self) -> Optional[np.memmap]:
+        if self._matrix is None and self.ids:
+            self._matrix = np.memmap(
+                self.vectors_path,
+                dtype=np.float32,
+                mode="r",
+                shape=(len(self.ids), self.dimension),
+            )
+        return self._matrix
+
+    @staticmethod
+    def normalize(vector) -> np.ndarray:
+        array = np.asarray(vector, dtype=np.float32)
+        norm = np.linalg.norm(array)
+        return array / norm if norm > 0 else array
+
+    def upsert(self, points: List[VectorPoint]) -> None:
+        with self.lock:
+            os.makedirs(self.directory, exist_ok=True)
+            self._matrix = None
+            if not os.path.exists(self.vectors_path):
+                open(self.vectors_path, "wb").close()
+            with open(self.vectors_path, "r+b") as vectors_file, open(
+                self.points_path, "a", encoding="utf-8"
+            ) as points_file:
+                for point in points:
+                    vector = self.normalize(point.vector)
+                    if vector.shape != (self.dimension,):
+                        raise ValueError(
+                            f"Expected a {self.dimension}-dimensional vector, got {vector.shape}"
+                        )
+                    sparse = (
+                        [point.sparse_vector.indices, point.sparse_vector.values]
+                        if point.sparse_vector is not None
+                        else None
+                    )
+                    row = self.rows.get(point.id)
+                    if row is None:
+                        row = len(self.ids)
+                        self.ids.append(point.id)
+                        self.payloads.append(point.payload)
+                        self.sparse.append(None)
+                        self.rows[point.id] = row
+                    else:
+                        self.payloads[row] = point.payload
+                        self._unindex_sparse(row)
+                    self.sparse[row] = self._sparse_weights(sparse)
+                    self._index_sparse(row, self.sparse[row])
+                    vectors_file.seek(row * self.dimension * 4)
+                    vectors_file.write(vector.astype("<f4").tobytes())
+                    points_file.write(
+                        json.dumps(
+                            {
+                                "row": row,
+                                "id": point.id,
+                                "payload": point.payload,
+                                "sparse": sparse,
+                            },
+                            default=str,
+                        )
+                        + "\n"
+                    )
+                    self.log_entries += 1
+
+    @staticmethod
+    def matches(payload: Optional[Dict[str, Any]], filters: Dict[str, Any]) -> bool:
+        if payload is None:
+            return False
+        for key, value in filters.items():
+            if isinstance(value, (list, tuple, set)):
+                if payload.get(key) not in value:
+                    return False
+            elif payload.get(key) != value:
+                return False
+        return True
+
+    def _scores(
+        self,
+        query: np.ndarray,
+        score_threshold: Optional[float],
+        filters: Optional[Dict[str, Any]],
+    ) -> Optional[np.ndarray]:
+        """
+        Cosine scores for every row; rows excluded by filters, threshold or
+        deletion score -inf.
+        """
+        matrix = self.matrix()
+        if matrix is None:
+            return None
+        scores = matrix @ query
+        allowed = np.fromiter(
+            (self.matches(payload, filters or {}) for payload in self.payloads),
+            dtype=bool,
+            count=len(self.payloads),
+        )
+        if score_threshold is not None:
+            allowed &= scores >= score_threshold
+        return np.where(allowed, scores, -np.inf)
+
+    def _sparse_scores(
+        self, sparse_vector: SparseVector, allowed: np.ndarray
+    ) -> np.ndarray:
+        """
+        BM25 scores: query weight x document term weight x IDF, with IDF
+        computed over this user's points the way Qdrant's IDF modifier does.
+        """
+        scores = np.zeros(len(self.ids), dtype=np.float32)
+        live = len(self.rows)
+        for term, query_weight in zip(sparse_vector.indices, sparse_vector.values):
+            postings = self.postings.get(term)
+            if not postings:
+                continue
+            frequency = len(postings)
+            idf = math.log(1 + (live - frequency + 0.5) / (frequency + 0.5))
+            for row, weight in postings.items():
+                scores[row] += query_weight * weight * idf
+        return np.where(allowed & (scores > 0), scores, -np.inf)
+
+    def _top(self, scores: np.ndarray, limit: int) -> List[ScoredVectorPoint]:
+        if limit <= 0 or len(scores) == 0:
+            return []
+        k = min(limit, len(scores))
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top])]
+        return [self._hit(row, scores) for row in top if np.isfinite(scores[row])]
+
+    def _hit(self, row: int, scores: np.ndarray) -> ScoredVectorPoint:
+        return ScoredVectorPoint(
+            id=self.ids[row],
+            score=float(scores[row]),
+            payload=self.payloads[row] or {},
+        )
+
+    def delete(self, point_ids: Iterable[str]) -> int:
+        with self.lock:
+            rows = [
+                self.rows[point_id]
+                for point_id in dict.fromkeys(point_ids)
+                if point_id in self.rows
+            ]
+            if not rows:
+                return 0
+            with open(self.points_path, "a", encoding="utf-8") as points_file:
+                for row in rows:
+                    self._unindex_sparse(row)
+                    self.sparse[row] = None
+                    self.payloads[row] = None
+                    del self.rows[self.ids[row]]
+                    points_file.write(
+                        json.dumps({"row": row, "id": self.ids[row], "payload": None})
+                        + "\n"
+                    )
+                    self.log_entries += 1
+            return len(rows)
+
+    def _compact_paths(self) -> Tuple[str, str]:
+        return self.vectors_path + ".compact", self.points_path + ".compact"
+
+    def _recover_compaction(self) -> None:
+        """
+        `compact` writes both compacted files, then swaps in the vectors and
+        then the log. A leftover vectors file means the swap never started
+        and the old files are intact; a leftover log alone means the vectors
+        were swapped in and the matching log still has to follow.
+        """
+        compact_vectors, compact_points = self._compact_paths()
+        if os.path.exists(compact_vectors):
+            os.remove(compact_vectors)
+            if os.path.exists(compact_points):
+                os.remove(compact_points)
+        elif os.path.exists(compact_points):
+            os.replace(compact_points, self.points_path)
+
+    def needs_compaction(self) -> bool:
+        garbage = self.log_entries - len(self.rows)
+        return garbage >= max(self.compact_min_garbage, len(self.rows))
+
+    def compact(self) -> bool:
+        """
+        Rewrites the partition with only its live points, in row order.
+        Row numbers change, so scroll offsets taken before a compaction
+        are not valid after it.
+        """
+        with self.lock:
+            if not self.needs_compaction():
+                return False
+            live_rows = sorted(self.rows.values())
+            compact_vectors, compact_points = self._compact_paths()
+            matrix = self.matrix()
+            with open(compact_vectors, "wb") as vectors_file:
+                if matrix is not None and live_rows:
+                    vectors_file.write(
+                        np.asarray(matrix[live_rows], dtype="<f4").tobytes()
+                    )
+                vectors_file.flush()
+                os.fsync(vectors_file.fileno())
+            with open(compact_points, "w", encoding="utf-8") as points_file:
+                for new_row, row in enumerate(live_rows):
+                    weights = self.sparse[row]
+                    points_file.write(
+                        json.dumps(
+                            {
+                                "row": new_row,
+                                "id": self.ids[row],
+                                "payload": self.payloads[row],
+                                "sparse": (
+                                    [list(weights), list(weights.values())]
+                                    if weights
+                                    else None
+                                ),
+                            },
+                            default=str,
+                        )
+                        + "\n"
+                    )
+                points_file.flush()
+                os.fsync(points_file.fileno())
+            self._matrix = None
+            os.replace(compact_vectors, self.vectors_path)
+            os.replace(compact_points, self.points_path)
+            self._load()
+            return True
+
+    def get(self, point_ids: Iterable[str]) -> List[StoredPoint]:
+        with self.lock:
+            return [
+                StoredPoint(
+                    id=point_id, payload=self.payloads[self.rows[point_id]] or {}
+                )
+                for point_id in dict.fromkeys(point_ids)
+                if point_id in self.rows
+            ]
+
+    def live_points(self) -> List[StoredPoint]:
+        with self.lock:
+            return [
+                StoredPoint(id=self.ids[row], payload=self.payloads[row] or {})
+                for row in sorted(self.rows.values())
+            ]
+
+    def page(self, start_row: int, limit: int) -> Tuple[List[StoredPoint], Optional[int]]:
+        """
+        Up to `limit` live points from row `start_row` on, and the row to
+        continue from (None once the partition is exhausted). Rows keep
+        their numbers when points are deleted, so deletes between pages
+        don't shift the next page.
+        """
+        with self.lock:
+            points: List[StoredPoint] = []
+            for row in range(start_row, len(self.ids)):
+                if self.rows.get(self.ids[row]) != row:
+                    continue
+                if len(points) == limit:
+                    return points, row
+                points.append(
+                    StoredPoint(id=self.ids[row], payload=self.payloads[row] or {})
+                )
+            return points, None
+
+    def search(
+        self,
+        query: np.ndarray,
+        limit: int,
+        score_threshold: Optional[float],
+        filters: Optional[Dict[str, Any]],
+    ) -> List[ScoredVectorPoint]:
+        with self.lock:
+            scores = self._scores(query, score_threshold, filters)
+            if scores is None:
+                return []
+            return self._top(scores, limit)
+
+    def hybrid_search(
+        self,
+        query: np.ndarray,
+        sparse_vector: SparseVector,
+        limit: int,
+        prefetch_limit: int,
+        weights: Sequence[float],
+        rrf_k: int,
+        score_threshold: Optional[float],
+        filters: Optional[Dict[str, Any]],
+    ) -> List[ScoredVectorPoint]:
+        with self.lock:
+            scores = self._scores(query, None, filters)
+            if scores is None:
+                return []
+            allowed = np.isfinite(scores)
+            if score_threshold is not None:
+                scores = np.where(scores >= score_threshold, scores, -np.inf)
+            dense = self._top(scores, prefetch_limit)
+            sparse = self._top(self._sparse_scores(sparse_vector, allowed), prefetch_limit)
+            return reciprocal_rank_fusion(
+                [dense, sparse], weights=weights, k=rrf_k, limit=limit
+            )
+
+    def search_groups(
+        self,
+        query: np.ndarray,
+        group_by: str,
+        limit: int,
+        group_size: int,
+        score_threshold: Optional[float],
+        filters: Optional[Dict[str, Any]],
+    ) -> List[PointGroup]:
+        with self.lock:
+            scores = self._scores(query, score_threshold, filters)
+            if scores is None or limit <= 0:
+                return []
+            groups: Dict[str, PointGroup] = {}
+            for row in np.argsort(-scores):
+                if not np.isfinite(scores[row]):
+                    break
+                group_id = self.payloads[row].get(group_by)
+                if group_id is None:
+                    continue
+                group = groups.get(str(group_id))
+                if group is None:
+                    if len(groups) == limit:
+                        if all(len(g.hits) >= group_size for g in groups.values()):
+                            break
+                        continue
+                    group = groups[str(group_id)] = PointGroup(id=str(group_id))
+                if len(group.hits) < group_size:
+                    group.hits.append(self._hit(row, scores))
+            return list(groups.values())
+
+
+class EmbeddedVectorStore(VectorStore):
+    """
+    In-process vector engine for single-node installs and CI. Points are
+    partitioned by user_id, so a search only scores that user's matrix with
+    one vectorized dot product (vectors are stored L2-normalized, making the
+    dot product the cosine similarity).
+    """
+
+    name = "embedded"
+
+    def __init__(self, directory: str, dimension: int) -> None:
+        self.directory = directory
+        self.dimension = dimension
+        self._partitions: Dict[str, UserVectorPartition] = {}
+        self._lock = Lock()
+
+    def _partition_by_digest(self, digest: str) -> UserVectorPartition:
+        with self._lock:
+            partition = self._partitions.get(digest)
+            if partition is None:
+                partition = UserVectorPartition(
+                    os.path.join(self.directory, digest), self.dimension
+                )
+                self._partitions[digest] = partition
+            return partition
+
+    def _partition(self, user_id: str) -> UserVectorPartition:
+        return self._partition_by_digest(
+            hashlib.sha256(user_id.encode("utf-8")).hexdigest()
+        )
+
+    def _digests(self) -> List[str]:
+        if not os.path.isdir(self.directory):
+            return []
+        return sorted(os.listdir(self.directory))
+
+    async def start(self) -> None:
+        os.makedirs(self.directory, exist_ok=True)
+
+    async def health(self) -> dict:
+        users = len(self._digests())
+        return {
+            "backend": self.name,
+            "status": "green",
+            "directory": self.directory,
+            "users": users,
+            "loaded_users": len(self._partitions),
+            "loaded_points": sum(len(partition) for partition in self._partitions.values()),
+        }
+
+    def _upsert(self, points: List[VectorPoint]) -> None:
+        by_user: Dict[str, List[VectorPoint]] = {}
+        for point in points:
+            user_id = point.payload.get("user_id")
+            if not user_id:
+                raise ValueError(f"Point {point.id} has no user_id in its payload")
+            by_user.setdefault(user_id, []).append(point)
+        for user_id, user_points in by_user.items():
+            self._partition(user_id).upsert(user_points)
+
+    async def upsert(self, points: List[VectorPoint]) -> None:
+        if points:
+            await run_in_threadpool(self._upsert, points)
+
+    def _search(
+        self,
+        vector: List[float],
+        user_id: str,
+        limit: int,
+        score_threshold: Optional[float],
+        filters: Optional[Dict[str, Any]],
+    ) -> List[ScoredVectorPoint]:
+        query = UserVectorPartition.normalize(vector)
+        return self._partition(user_id).search(query, limit, score_threshold, filters)
+
+    async def search(
+        self,
+        vector: List[float],
+        user_id: str,
+        limit: int,
+        score_threshold: Optional[float] = None,
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> List[ScoredVectorPoint]:
+        return await run_in_threadpool(
+            self._search, vector, user_id, limit, score_threshold, filters
+        )
+
+    def _search_groups(
+        self,
+        vector: List[float],
+        user_id: str,
+        group_by: str,
+        limit: int,
+        group_size: int,
+        score_threshold: Optional[float],
+        filters: Optional[Dict[str, Any]],
+    ) -> List[PointGroup]:
+        query = UserVectorPartition.normalize(vector)
+        return self._partition(user_id).search_groups(
+            query, group_by, limit, group_size, score_threshold, filters
+        )
+
+    async def search_groups(
+        self,
+        vector: List[float],
+        user_id: str,
+        group_by: str,
+        limit: int,
+        group_size: int,
+        score_threshold: Optional[float] = None,
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> List[PointGroup]:
+        return await run_in_threadpool(
+            self._search_groups,
+            vector,
+            user_id,
+            group_by,
+            limit,
+            group_size,
+            score_threshold,
+            filters,
+        )
+
+    def _hybrid_search(
+        self,
+        vector: List[float],
+        sparse_vector: SparseVector,
+        user_id: str,
+        limit: int,
+        prefetch_limit: int,
+        weights: Sequence[float],
+        rrf_k: int,
+        score_threshold: Optional[float],
+        filters: Optional[Dict[str, Any]],
+    ) -> List[ScoredVectorPoint]:
+        query = UserVectorPartition.normalize(vector)
+        return self._partition(user_id).hybrid_search(
+            query,
+            sparse_vector,
+            limit,
+            prefetch_limit,
+            weights,
+            rrf_k,
+            score_threshold,
+            filters,
+        )
+
+    async def hybrid_search(
+        self,
+        vector: List[float],
+        sparse_vector: SparseVector,
+        user_id: str,
+        limit: int,
+        prefetch_limit: int,
+        weights: Sequence[float] = (1.0, 1.0),
+        rrf_k: int = 60,
+        score_threshold: Optional[float] = None,
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> List[ScoredVectorPoint]:
+        return await run_in_threadpool(
+            self._hybrid_search,
+            vector,
+            sparse_vector,
+            user_id,
+            limit,
+            prefetch_limit,
+            weights,
+            rrf_k,
+            score_threshold,
+            filters,
+        )
+
+    def _delete_report_points(
+        self, user_id: str, report_ids: Iterable[str], keep_ids: Iterable[str]
+    ) -> None:
+        report_ids, keep_ids = set(report_ids), set(keep_ids)
+        partition = self._partition(user_id)
+        partition.delete(
+            [
+                point.id
+                for point in partition.live_points()
+                if point.payload.get("report_id") in report_ids
+                and point.id not in keep_ids
+            ]
+        )
+
+    async def delete_report_points(
+        self,
+        user_id: str,
+        report_ids: Iterable[str],
+        keep_ids: Iterable[str] = (),
+    ) -> None:
+        await run_in_threadpool(self._delete_report_points, user_id, report_ids, keep_ids)
+
+    def _delete_points(self, point_ids: Iterable[str]) -> None:
+        point_ids = list(point_ids)
+        for digest in self._digests():
+            self._partition_by_digest(digest).delete(point_ids)
+
+    async def delete_points(self, point_ids: Iterable[str]) -> None:
+        await run_in_threadpool(self._delete_points, point_ids)
+
+    def _scroll(
+        self, limit: int, offset: Optional[str]
+    ) -> Tuple[List[StoredPoint], Optional[str]]:
+        """
+        Offsets are "<partition digest>:<row>", a position that deletes
+        don't move (compaction does).
+        """
+        start_digest, start_row = "", 0
+        if offset:
+            start_digest, row = offset.split(":", 1)
+            start_row = int(row)
+
+        page: List[StoredPoint] = []
+        for digest in self._digests():
+            if digest < start_digest:
+                continue
+            if len(page) == limit:
+                return page, f"{digest}:0"
+            points, next_row = self._partition_by_digest(digest).page(
+                start_row if digest == start_digest else 0, limit - len(page)
+            )
+            page.extend(points)
+            if next_row is not None:
+                return page, f"{digest}:{next_row}"
+        return page, None
+
+    async def scroll(
+        self, limit: int, offset: Optional[str] = None
+    ) -> Tuple[List[StoredPoint], Optional[str]]:
+        return await run_in_threadpool(self._scroll, limit, offset)
+
+    def _retrieve(self, point_ids: Iterable[str]) -> List[StoredPoint]:
+        point_ids = list(point_ids)
+        points: List[StoredPoint] = []
+        for digest in self._digests():
+            points.extend(self._partition_by_digest(digest).get(point_ids))
+        return points
+
+    async def retrieve(self, point_ids: Iterable[str]) -> List[StoredPoint]:
+        return await run_in_threadpool(self._retrieve, point_ids)
+
+    def _compact(self) -> int:
+        return sum(
+            self._partition_by_digest(digest).compact() for digest in self._digests()
+        )
+
+    async def compact(self) -> int:
+        return await run_in_threadpool(self._compact)
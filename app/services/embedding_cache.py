@@ -0,0 +1,119 @@
+import hashlib
+import json
+import re
+from threading import Lock
+from typing import List, Optional
+from cachetools import TTLCache
+from fastapi.logger import logger
+from app.config import settings
+
+
+class EmbeddingCache:
+    """
+    Caches query embeddings keyed by normalized text, model and task type.
+
+    A bounded in-process LRU/TTL cache is always consulted first. When
+    EMBEDDING_CACHE_REDIS_URL is set, Redis is used as a shared second level so
+    workers can reuse each other's embeddings.
+    """
+
+    key_prefix = "embedding:"
+
+    def __init__(
+        self,
+        max_entries: int,
+        ttl_seconds: int,
+        redis_url: str = "",
+        enabled: bool = True,
+    ) -> None:
+        self.enabled = enabled
+        self.ttl_seconds = ttl_seconds
+        self._local: TTLCache = TTLCache(maxsize=max_entries, ttl=ttl_seconds)
+        self._lock = Lock()
+        self._shared = None
+        if enabled and redis_url:
+            try:
+                from redis import asyncio as redis_asyncio
+            except ImportError as e:
+                raise RuntimeError(
+                    "EMBEDDING_CACHE_REDIS_URL is set but the `redis` package is not installed"
+                ) from e
+            self._shared = redis_asyncio.from_url(redis_url)
+        self._counters = {"local_hits": 0, "shared_hits": 0, "misses": 0}
+
+    @staticmethod
+    def normalize(text: str) -> str:
+        normalized = " ".join(text.lower().split())
+        return re.sub(r"[\s?!.]+$", "", normalized)
+
+    @classmethod
+    def make_key(cls, text: str, model: str, task_type: str) -> str:
+        digest = hashlib.sha256(
+            f"{model}\x1f{task_type}\x1f{cls.normalize(text)}".encode("utf-8")
+        ).hexdigest()
+        return f"{cls.key_prefix}{digest}"
+
+    async def get(self, text: str, model: str, task_type: str) -> Optional[List[float]]:
+        if not self.enabled:
+            return None
+        key = self.make_key(text, model, task_type)
+
+        with self._lock:
+            vector = self._local.get(key)
+        if vector is not None:
+            self._counters["local_hits"] += 1
+            return vector
+
+        if self._shared is not None:
+            try:
+                raw = await self._shared.get(key)
+            except Exception as e:
+                logger.warning(f"Error reading shared embedding cache: {e}")
+                raw = None
+            if raw is not None:
+                vector = json.loads(raw)
+                with self._lock:
+                    self._local[key] = vector
+                self._counters["shared_hits"] += 1
+                return vector
+
+        self._counters["misses"] += 1
+        return None
+
+    async def set(
+        self, text: str, model: str, task_type: str, vector: List[float]
+    ) -> None:
+        if not self.enabled:
+            return
+        key = self.make_key(text, model, task_type)
+        vector = list(vector)
+        with self._lock:
+            self._local[key] = vector
+        if self._shared is not None:
+            try:
+                await self._shared.set(key, json.dumps(vector), ex=self.ttl_seconds)
+            except Exception as e:
+                logger.warning(f"Error writing shared embedding cache: {e}")
+
+    def stats(self) -> dict:
+        hits = self._counters["local_hits"] + self._counters["shared_hits"]
+        lookups = hits + self._counters["misses"]
+        with self._lock:
+            size = len(self._local)
+        return {
+            "enabled": self.enabled,
+            "shared_backend": self._shared is not None,
+            "size": size,
+            "max_entries": self._local.maxsize,
+            "ttl_seconds": self.ttl_seconds,
+            **self._counters,
+            "hit_rate": round(hits / lookups, 4) if lookups else None,
+        }
+
+
+query_embedding_cache = EmbeddingCache(
+    max_entries=settings.EMBEDDING_CACHE_MAX_ENTRIES,
+    ttl_seconds=settings.EMBEDDING_CACHE_TTL_SECONDS,
+    redis_url=settings.EMBEDDING_CACHE_REDIS_URL,
+    enabled=settings.EMBEDDING_CACHE_ENABLED,
+)
@@ -0,0 +1,137 @@
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from io import BytesIO
+from typing import List, Optional
+from fastapi.logger import logger
+from PIL import Image, ImageOps
+from app.config import settings
+
+
+def preprocess_image_bytes(
+    content: bytes,
+    max_edge: int,
+    grayscale: bool,
+    autocontrast: bool,
+    jpeg_quality: int,
+) -> bytes:
+    """
+    Normalizes a report photo for the model: applies the EXIF orientation,
+    optionally converts to grayscale and stretches contrast, downscales so the
+    longest edge is at most `max_edge` and re-encodes as JPEG.
+
+    Module-level so it can be pickled into a process pool.
+    """
+    with Image.open(BytesIO(content)) as original:
+        image = ImageOps.exif_transpose(original)
+        image = image.convert("L" if grayscale else "RGB")
+        if autocontrast:
+            image = ImageOps.autocontrast(image, cutoff=1)
+        image.thumbnail((max_edge, max_edge), Image.Resampling.LANCZOS)
+
+        output = BytesIO()
+        image.save(output, format="JPEG", quality=jpeg_quality, optimize=True)
+    return output.getvalue()
+
+
+def rasterize_pdf(content: bytes, dpi: int, max_pages: int) -> List[bytes]:
+    """
+    Renders up to `max_pages` pages of a PDF to JPEG bytes.
+    """
+    import pypdfium2 as pdfium
+
+    document = pdfium.PdfDocument(content)
+    try:
+        pages = []
+        for index in range(min(len(document), max_pages)):
+            page = document[index]
+            try:
+                # render() is untyped; its scale default of 1 makes pyright infer int.
+                scale = dpi / 72
+                image = page.render(scale=scale).to_pil().convert("RGB")  # pyright: ignore[reportArgumentType]
+            finally:
+                page.close()
+            output = BytesIO()
+            image.save(output, format="JPEG", quality=90)
+            pages.append(output.getvalue())
+        return pages
+    finally:
+        document.close()
+
+
+class ImagePreprocessor:
+    """
+    Runs `preprocess_image_bytes` and `rasterize_pdf` in a process pool so the
+    CPU-bound decode and resize never hold the event loop or the GIL of the
+    API process.
+    """
+
+    def __init__(
+        self,
+        enabled: bool,
+        workers: int,
+        max_edge: int,
+        grayscale: bool,
+        autocontrast: bool,
+        jpeg_quality: int,
+    ) -> None:
+        self.enabled = enabled
+        self.workers = workers
+        self._transform = partial(
+            preprocess_image_bytes,
+            max_edge=max_edge,
+            grayscale=grayscale,
+            autocontrast=autocontrast,
+            jpeg_quality=jpeg_quality,
+        )
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.workers)
+        return self._executor
+
+    async def preprocess(self, content: bytes) -> Optional[bytes]:
+        """
+        Returns the processed JPEG bytes, or None when preprocessing is
+        disabled or the image could not be processed.
+        """
+        if not self.enabled:
+            return None
+        loop = asyncio.get_running_loop()
+        try:
+            processed = await loop.run_in_executor(
+                self._get_executor(), self._transform, content
+            )
+        except Exception as e:
+            logger.warning(f"Image preprocessing failed, sending original: {e}")
+            return None
+        logger.info(
+            f"Preprocessed report image: {len(content)} -> {len(processed)} bytes"
+        )
+        return processed
+
+    async def rasterize_pdf(self, content: bytes) -> List[bytes]:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._get_executor(),
+            partial(
+                rasterize_pdf, dpi=settings.REPORT_PDF_DPI, max_pages=settings.REPORT_MAX_PAGES
+            ),
+            content,
+        )
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+image_preprocessor = ImagePreprocessor(
+    enabled=settings.IMAGE_PREPROCESSING_ENABLED,
+    workers=settings.IMAGE_PREPROCESSING_WORKERS,
+    max_edge=settings.IMAGE_MAX_EDGE,
+    grayscale=settings.IMAGE_GRAYSCALE,
+    autocontrast=settings.IMAGE_AUTOCONTRAST,
+    jpeg_quality=settings.IMAGE_JPEG_QUALITY,
+)
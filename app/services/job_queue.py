@@ -0,0 +1,251 @@
+import asyncio
+import time
+from collections import deque
+from typing import Awaitable, Callable, Deque, Dict, List, Optional
+from fastapi.concurrency import run_in_threadpool
+from fastapi.logger import logger
+from sqlalchemy.orm import Session
+from app.config import settings
+from app.database import WorkerSessionLocal
+from app.query_models.job import JobStatus
+from app.repositories.job import JobRepository
+from app.schemas.job import Job
+
+JobHandler = Callable[[Session, Job], Awaitable[None]]
+
+
+class QueueFullError(Exception):
+    pass
+
+
+class ReportJobQueue:
+    """
+    Bounded worker pool for report analysis jobs.
+
+    Job records live in the database; the in-memory queue only carries job ids,
+    so anything still QUEUED or RUNNING after a restart can be re-enqueued at
+    startup. Each job runs with its own session, never the request session.
+    """
+
+    def __init__(
+        self,
+        worker_count: int,
+        max_depth: int,
+        retry_backoff_seconds: float,
+        group_concurrency: int,
+        latency_window: int = 500,
+    ) -> None:
+        self.worker_count = worker_count
+        self.max_depth = max_depth
+        self.retry_backoff_seconds = retry_backoff_seconds
+        self.group_concurrency = group_concurrency
+        self._groups: Dict[str, str] = {}
+        self._group_running: Dict[str, int] = {}
+        self._group_waiting: Dict[str, Deque[str]] = {}
+        self._queue: Optional[asyncio.Queue] = None
+        self._workers: List[asyncio.Task] = []
+        self._retry_tasks: set = set()
+        self._handler: Optional[JobHandler] = None
+        self._on_failure: Optional[JobHandler] = None
+        self._enqueued_at: Dict[str, float] = {}
+        self._in_flight = 0
+        self._counters = {
+            "enqueued": 0,
+            "recovered": 0,
+            "completed": 0,
+            "retried": 0,
+            "failed": 0,
+            "rejected": 0,
+        }
+        self._wait_seconds: Deque[float] = deque(maxlen=latency_window)
+        self._run_seconds: Deque[float] = deque(maxlen=latency_window)
+
+    async def start(self, handler: JobHandler, on_failure: JobHandler) -> None:
+        self._handler = handler
+        self._on_failure = on_failure
+        self._queue = asyncio.Queue()
+        self._workers = [
+            asyncio.create_task(self._worker(), name=f"report-worker-{index}")
+            for index in range(self.worker_count)
+        ]
+        logger.info(f"Started {self.worker_count} report analysis workers")
+
+    async def stop(self) -> None:
+        for task in [*self._workers, *self._retry_tasks]:
+            task.cancel()
+        await asyncio.gather(*self._workers, *self._retry_tasks, return_exceptions=True)
+        self._workers = []
+        self._retry_tasks = set()
+
+    def depth(self) -> int:
+        queued = self._queue.qsize() if self._queue is not None else 0
+        return queued + sum(len(waiting) for waiting in self._group_waiting.values())
+
+    def ensure_capacity(self, count: int = 1) -> None:
+        if self.depth() + count > self.max_depth:
+            self._counters["rejected"] += 1
+            raise QueueFullError(
+                f"Report analysis queue is full ({self.max_depth} jobs waiting)"
+            )
+
+    def enqueue(
+        self,
+        job_id: str,
+        recovered: bool = False,
+        group: Optional[str] = None,
+        check_capacity: bool = True,
+    ) -> None:
+        """
+        Recovered jobs bypass the depth limit; they were admitted before the
+        restart and must not be dropped. Callers that reserved room up front
+        with `ensure_capacity(count)` pass `check_capacity=False`. Jobs sharing
+        a `group` (e.g. a batch upload) run at most `group_concurrency` at a
+        time, leaving the other workers free for everyone else.
+        """
+        if self._queue is None:
+            raise RuntimeError("Report job queue has not been started")
+        if check_capacity and not recovered:
+            self.ensure_capacity()
+        if group is not None:
+            self._groups[job_id] = group
+        self._put(job_id)
+        self._counters["recovered" if recovered else "enqueued"] += 1
+
+    def _put(self, job_id: str) -> None:
+        assert self._queue is not None
+        self._enqueued_at[job_id] = time.monotonic()
+        self._queue.put_nowait(job_id)
+
+    def stats(self) -> dict:
+        return {
+            "workers": self.worker_count,
+            "max_depth": self.max_depth,
+            "queue_depth": self.depth(),
+            "in_flight": self._in_flight,
+            **self._counters,
+            "wait_seconds": self._summarize(self._wait_seconds),
+            "run_seconds": self._summarize(self._run_seconds),
+        }
+
+    @staticmethod
+    def _summarize(samples: Deque[float]) -> dict:
+        if not samples:
+            return {"count": 0, "avg": None, "p95": None, "max": None}
+        ordered = sorted(samples)
+        p95_index = min(len(ordered) - 1, int(len(ordered) * 0.95))
+        return {
+            "count": len(ordered),
+            "avg": round(sum(ordered) / len(ordered), 3),
+            "p95": round(ordered[p95_index], 3),
+            "max": round(ordered[-1], 3),
+        }
+
+    async def _worker(self) -> None:
+        assert self._queue is not None
+        while True:
+            job_id = await self._queue.get()
+            group = self._groups.get(job_id)
+            if group is not None and not self._acquire_group(group, job_id):
+                self._queue.task_done()
+                continue
+            try:
+                await self._run(job_id)
+            except Exception as e:
+                logger.error(f"Report job {job_id} crashed: {e}", exc_info=True)
+            finally:
+                if group is not None:
+                    self._release_group(group)
+                self._queue.task_done()
+
+    def _acquire_group(self, group: str, job_id: str) -> bool:
+        running = self._group_running.get(group, 0)
+        if running >= self.group_concurrency:
+            self._group_waiting.setdefault(group, deque()).append(job_id)
+            return False
+        self._group_running[group] = running + 1
+        return True
+
+    def _release_group(self, group: str) -> None:
+        assert self._queue is not None
+        self._group_running[group] -= 1
+        waiting = self._group_waiting.get(group)
+        if waiting:
+            self._queue.put_nowait(waiting.popleft())
+        if not waiting:
+            self._group_waiting.pop(group, None)
+            if self._group_running[group] == 0:
+                del self._group_running[group]
+
+    async def _run(self, job_id: str) -> None:
+        assert self._handler is not None and self._on_failure is not None
+        enqueued_at = self._enqueued_at.pop(job_id, None)
+        if enqueued_at is not None:
+            self._wait_seconds.append(time.monotonic() - enqueued_at)
+
+        # Job bookkeeping uses a sync session; its queries run in the
+        # threadpool so they never block the event loop the workers share.
+        db = WorkerSessionLocal()
+        self._in_flight += 1
+        started = time.monotonic()
+        finished = True
+        try:
+            job = await run_in_threadpool(JobRepository.mark_running, db, job_id)
+            if job is None:
+                return
+
+            try:
+                await self._handler(db, job)
+            except Exception as e:
+                logger.error(
+                    f"Report job {job.id} failed on attempt {job.attempts}/{job.max_attempts}: {e}",
+                    exc_info=True,
+                )
+                await run_in_threadpool(db.rollback)
+                if job.attempts < job.max_attempts:
+                    await run_in_threadpool(
+                        JobRepository.mark_queued, db, job.id, error=str(e)
+                    )
+                    self._counters["retried"] += 1
+                    finished = False
+                    self._schedule_retry(job.id, job.attempts)
+                else:
+                    await run_in_threadpool(
+                        JobRepository.mark_finished,
+                        db,
+                        job.id,
+                        status=JobStatus.FAILED,
+                        error=str(e),
+                    )
+                    self._counters["failed"] += 1
+                    await self._on_failure(db, job)
+                return
+
+            await run_in_threadpool(
+                JobRepository.mark_finished, db, job.id, status=JobStatus.COMPLETED
+            )
+            self._counters["completed"] += 1
+        finally:
+            if finished:
+                self._groups.pop(job_id, None)
+            self._run_seconds.append(time.monotonic() - started)
+            self._in_flight -= 1
+            await run_in_threadpool(db.close)
+
+    def _schedule_retry(self, job_id: str, attempts: int) -> None:
+        delay = self.retry_backoff_seconds * (2 ** (attempts - 1))
+
+        async def requeue():
+            await asyncio.sleep(delay)
+            self._put(job_id)
+
+        task = asyncio.create_task(requeue())
+        self._retry_tasks.add(task)
+        task.add_done_callback(self._retry_tasks.discard)
+
+
+report_job_queue = ReportJobQueue(
+    worker_count=settings.REPORT_WORKER_COUNT,
+    max_depth=settings.REPORT_QUEUE_MAX_DEPTH,
+    retry_backoff_seconds=settings.REPORT_JOB_RETRY_BACKOFF_SECONDS,
+    group_concurrency=settings.REPORT_BATCH_MAX_CONCURRENCY,
+)
@@ -1,5 +1,459 @@
-import google.generativeai as gemini_client
+import asyncio
+import random
+import threading
+import time
+from enum import IntEnum
+from typing import Dict, Optional, Tuple
 from google import genai
+from google.genai import types
 from app.config import settings
 
-ai_client = genai.Client(api_key=settings.GOOGLE_GENAI_API_KEY)
+ai_client = genai.Client(
+    api_key=settings.GOOGLE_GENAI_API_KEY,
+    http_options=types.HttpOptions(timeout=int(settings.LLM_TIMEOUT_SECONDS * 1000)),
+)
+
+
+class Priority(IntEnum):
+    INTERACTIVE = 0
+    BACKGROUND = 1
+
+
+class CircuitOpenError(Exception):
+    pass
+
+
+class AdaptiveTokenBucket:
+    """
+    Token bucket whose refill rate adapts to the provider's quota: halved on
+    every 429, raised additively on success up to the configured rate.
+
+    Background callers only take a token when no interactive caller is
+    waiting, so chat traffic goes first when the bucket is drained.
+    """
+
+    def __init__(self, rate: float, burst: int, min_rate: float) -> None:
+        if rate <= 0 or min_rate <= 0:
+            raise ValueError(
+                f"LLM rate limits must be positive (rate={rate}, min_rate={min_rate})"
+            )
+        self.max_rate = rate
+        self.min_rate = min(min_rate, rate)
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated_at = time.monotonic()
+        self.interactive_waiting = 0
+        self.throttled = 0
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        self.tokens = min(self.burst, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+
+    def try_acquire(self, priority: Priority) -> float:
+        """
+        Takes a token and returns 0, or returns how long to wait before trying
+        again.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            if priority == Priority.BACKGROUND and self.interactive_waiting > 0:
+                return max(1.0 / self.rate, 0.05)
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return 0.0
+            return (1 - self.tokens) / self.rate
+
+    def waiting(self, priority: Priority, delta: int) -> None:
+        if priority == Priority.INTERACTIVE:
+            with self._lock:
+                self.interactive_waiting += delta
+
+    def on_throttle(self) -> None:
+        with self._lock:
+            self.throttled += 1
+            self.rate = max(self.min_rate, self.rate / 2)
+            self.tokens = min(self.tokens, 0.0)
+
+    def on_success(self) -> None:
+        with self._lock:
+            if self.rate < self.max_rate:
+                self.rate = min(self.max_rate, self.rate + self.max_rate * 0.05)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "rate": round(self.rate, 3),
+                "max_rate": self.max_rate,
+                "tokens": round(self.tokens, 2),
+                "interactive_waiting": self.interactive_waiting,
+                "throttled": self.throttled,
+            }
+
+
+class CircuitBreaker:
+    """
+    Opens after `failure_threshold` consecutive failures and fails fast for
+    `reset_seconds`; then lets a single trial call through (half-open).
+    """
+
+    def __init__(self, failure_threshold: int, reset_seconds: float) -> None:
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self.trial_in_flight = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return "CLOSED"
+        if time.monotonic() - self.opened_at < self.reset_seconds:
+            return "OPEN"
+        return "HALF_OPEN"
+
+    def allow(self) -> None:
+        with self._lock:
+            state = self.state
+            if state == "OPEN" or (state == "HALF_OPEN" and self.trial_in_flight):
+                raise CircuitOpenError("LLM circuit breaker is open; failing fast")
+            if state == "HALF_OPEN":
+                self.trial_in_flight = True
+
+    def record_success(self) -> None:
+        with self._lock:
+            self.failures = 0
+            self.opened_at = None
+            self.trial_in_flight = False
+
+    def release_trial(self) -> None:
+        """
+        Frees the half-open trial when the trial call ended without an
+        outcome (e.g. it was cancelled), so the next call can be the trial.
+        """
+        with self._lock:
+            self.trial_in_flight = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self.failures += 1
+            self.trial_in_flight = False
+            if self.opened_at is not None or self.failures >= self.failure_threshold:
+                self.opened_at = time.monotonic()
+
+
+class LLMGateway:
+    """
+    Single entry point for Gemini calls.
+
+    Every call takes a token from a per-model adaptive bucket, is retried on
+    429/5xx/timeouts with exponential backoff and full jitter, and is guarded by
+    a per-model circuit breaker. `client` only needs `models` and `aio.models`
+    with the google-genai method names, so a local fake can stand in for tests.
+    """
+
+    retryable_codes = {408, 429, 500, 502, 503, 504}
+
+    def __init__(
+        self,
+        client,
+        rate: float,
+        burst: int,
+        min_rate: float,
+        model_rates: Dict[str, float],
+        max_retries: int,
+        retry_base_seconds: float,
+        retry_max_seconds: float,
+        breaker_failure_threshold: int,
+        breaker_reset_seconds: float,
+        timeout_seconds: float,
+        embedding_timeout_seconds: float,
+        max_concurrency: int,
+        embedding_max_concurrency: int,
+    ) -> None:
+        self.client = client
+        self.rate = rate
+        self.burst = burst
+        self.min_rate = min_rate
+        self.model_rates = model_rates
+        self.max_retries = max_retries
+        self.retry_base_seconds = retry_base_seconds
+        self.retry_max_seconds = retry_max_seconds
+        self.breaker_failure_threshold = breaker_failure_threshold
+        self.breaker_reset_seconds = breaker_reset_seconds
+        self.timeout_seconds = timeout_seconds
+        self.embedding_timeout_seconds = embedding_timeout_seconds
+        self.concurrency = {
+            "generation": max_concurrency,
+            "embedding": embedding_max_concurrency,
+        }
+        # Created on first use, on the loop that uses them.
+        self._limits: Dict[
+            str, Tuple[asyncio.AbstractEventLoop, asyncio.Semaphore]
+        ] = {}
+        self._buckets: Dict[str, AdaptiveTokenBucket] = {}
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+        # Updated from threadpool calls and the event loop alike.
+        self._counters_lock = threading.Lock()
+        self._counters = {"calls": 0, "retries": 0, "failures": 0, "fast_failures": 0}
+
+    def _count(self, counter: str) -> None:
+        with self._counters_lock:
+            self._counters[counter] += 1
+
+    def _limit(self, kind: str) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            limit = self._limits.get(kind)
+            if limit is None or limit[0] is not loop:
+                limit = self._limits[kind] = (
+                    loop,
+                    asyncio.Semaphore(self.concurrency[kind]),
+                )
+            return limit[1]
+
+    def _bucket(self, model: str) -> AdaptiveTokenBucket:
+        with self._lock:
+            if model not in self._buckets:
+                self._buckets[model] = AdaptiveTokenBucket(
+                    rate=self.model_rates.get(model, self.rate),
+                    burst=self.burst,
+                    min_rate=self.min_rate,
+                )
+            return self._buckets[model]
+
+    def _breaker(self, model: str) -> CircuitBreaker:
+        with self._lock:
+            if model not in self._breakers:
+                self._breakers[model] = CircuitBreaker(
+                    failure_threshold=self.breaker_failure_threshold,
+                    reset_seconds=self.breaker_reset_seconds,
+                )
+            return self._breakers[model]
+
+    @classmethod
+    def _status_code(cls, error: Exception) -> Optional[int]:
+        for attribute in ("code", "status_code"):
+            value = getattr(error, attribute, None)
+            if isinstance(value, int):
+                return value
+        return None
+
+    @classmethod
+    def _is_retryable(cls, error: Exception) -> bool:
+        if isinstance(error, (asyncio.TimeoutError, TimeoutError, ConnectionError)):
+            return True
+        return cls._status_code(error) in cls.retryable_codes
+
+    def _backoff(self, attempt: int) -> float:
+        ceiling = min(self.retry_max_seconds, self.retry_base_seconds * (2**attempt))
+        return random.uniform(0, ceiling)
+
+    def _record_outcome(self, model: str, error: Optional[Exception]) -> None:
+        bucket, breaker = self._bucket(model), self._breaker(model)
+        if error is None:
+            bucket.on_success()
+            breaker.record_success()
+            return
+        if self._status_code(error) == 429:
+            bucket.on_throttle()
+        if self._is_retryable(error):
+            breaker.record_failure()
+        else:
+            # The service answered (e.g. a 400); that says nothing about its health.
+            breaker.record_success()
+
+    def _call(self, model: str, priority: Priority, func, **kwargs):
+        bucket, breaker = self._bucket(model), self._breaker(model)
+        attempt = 0
+        while True:
+            try:
+                breaker.allow()
+            except CircuitOpenError:
+                self._count("fast_failures")
+                raise
+
+            try:
+                bucket.waiting(priority, 1)
+                try:
+                    while (wait := bucket.try_acquire(priority)) > 0:
+                        time.sleep(wait)
+                finally:
+                    bucket.waiting(priority, -1)
+
+                self._count("calls")
+                result = func(model=model, **kwargs)
+            except Exception as e:
+                self._record_outcome(model, e)
+                if not self._is_retryable(e) or attempt >= self.max_retries:
+                    self._count("failures")
+                    raise
+                self._count("retries")
+                time.sleep(self._backoff(attempt))
+                attempt += 1
+                continue
+            except BaseException:
+                # Cancelled or interrupted: no verdict on the service's health.
+                breaker.release_trial()
+                raise
+            self._record_outcome(model, None)
+            return result
+
+    async def _call_async(
+        self, model: str, priority: Priority, func, limit: str, timeout, **kwargs
+    ):
+        bucket, breaker = self._bucket(model), self._breaker(model)
+        attempt = 0
+        while True:
+            try:
+                breaker.allow()
+            except CircuitOpenError:
+                self._count("fast_failures")
+                raise
+
+            try:
+                bucket.waiting(priority, 1)
+                try:
+                    while (wait := bucket.try_acquire(priority)) > 0:
+                        await asyncio.sleep(wait)
+                finally:
+                    bucket.waiting(priority, -1)
+
+                self._count("calls")
+                async with self._limit(limit):
+                    result = await asyncio.wait_for(
+                        func(model=model, **kwargs), timeout=timeout
+                    )
+            except Exception as e:
+                self._record_outcome(model, e)
+                if not self._is_retryable(e) or attempt >= self.max_retries:
+                    self._count("failures")
+                    raise
+                self._count("retries")
+                await asyncio.sleep(self._backoff(attempt))
+                attempt += 1
+                continue
+            except BaseException:
+                # Cancelled or interrupted: no verdict on the service's health.
+                breaker.release_trial()
+                raise
+            self._record_outcome(model, None)
+            return result
+
+    def generate_content(
+        self, model: str, priority: Priority = Priority.BACKGROUND, **kwargs
+    ):
+        return self._call(model, priority, self.client.models.generate_content, **kwargs)
+
+    def embed_content(
+        self, model: str, priority: Priority = Priority.BACKGROUND, **kwargs
+    ):
+        return self._call(model, priority, self.client.models.embed_content, **kwargs)
+
+    async def generate_content_async(
+        self, model: str, priority: Priority = Priority.INTERACTIVE, **kwargs
+    ):
+        return await self._call_async(
+            model,
+            priority,
+            self.client.aio.models.generate_content,
+            "generation",
+            self.timeout_seconds,
+            **kwargs,
+        )
+
+    async def embed_content_async(
+        self, model: str, priority: Priority = Priority.INTERACTIVE, **kwargs
+    ):
+        return await self._call_async(
+            model,
+            priority,
+            self.client.aio.models.embed_content,
+            "embedding",
+            self.embedding_timeout_seconds,
+            **kwargs,
+        )
+
+    async def generate_content_stream_async(
+        self, model: str, priority: Priority = Priority.INTERACTIVE, **kwargs
+    ):
+        """
+        Streams `generate_content` chunks. Opening the stream is retried like
+        any other call; once chunks have been yielded, errors are raised as-is.
+        The timeout applies to the wait for each chunk, and the upstream stream
+        is closed if the consumer stops early.
+        """
+        stream = await self._call_async(
+            model,
+            priority,
+            self.client.aio.models.generate_content_stream,
+            "generation",
+            self.timeout_seconds,
+            **kwargs,
+        )
+        try:
+            while True:
+                try:
+                    chunk = await asyncio.wait_for(
+                        stream.__anext__(), timeout=self.timeout_seconds
+                    )
+                except StopAsyncIteration:
+                    break
+                yield chunk
+        finally:
+            aclose = getattr(stream, "aclose", None)
+            if aclose is not None:
+                await aclose()
+
+    def stats(self) -> dict:
+        with self._lock:
+            buckets = dict(self._buckets)
+            breakers = dict(self._breakers)
+        with self._counters_lock:
+            counters = dict(self._counters)
+        return {
+            **counters,
+            "models": {
+                model: {
+                    **bucket.stats(),
+                    "breaker": breakers[model].state if model in breakers else "CLOSED",
+                }
+                for model, bucket in buckets.items()
+            },
+        }
+
+
+def parse_model_rates(value: str) -> Dict[str, float]:
+    """
+    Parses "model-a=2,model-b=0.5" into per-model requests per second.
+    """
+    rates = {}
+    for item in value.split(","):
+        if "=" in item:
+            model, rate = item.split("=", 1)
+            if float(rate) <= 0:
+                raise ValueError(f"LLM rate limit for {model.strip()} must be positive")
+            rates[model.strip()] = float(rate)
+    return rates
+
+
+llm_gateway = LLMGateway(
+    client=ai_client,
+    rate=settings.LLM_RATE_LIMIT_RPS,
+    burst=settings.LLM_RATE_LIMIT_BURST,
+    min_rate=settings.LLM_RATE_LIMIT_MIN_RPS,
+    model_rates=parse_model_rates(settings.LLM_MODEL_RATE_LIMITS),
+    max_retries=settings.LLM_MAX_RETRIES,
+    retry_base_seconds=settings.LLM_RETRY_BASE_SECONDS,
+    retry_max_seconds=settings.LLM_RETRY_MAX_SECONDS,
+    breaker_failure_threshold=settings.LLM_BREAKER_FAILURE_THRESHOLD,
+    breaker_reset_seconds=settings.LLM_BREAKER_RESET_SECONDS,
+    timeout_seconds=settings.LLM_TIMEOUT_SECONDS,
+    embedding_timeout_seconds=settings.EMBEDDING_TIMEOUT_SECONDS,
+    max_concurrency=settings.LLM_MAX_CONCURRENCY,
+    embedding_max_concurrency=settings.EMBEDDING_MAX_CONCURRENCY,
+)
@@ -0,0 +1,522 @@
+import asyncio
+import time
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+from fastapi.logger import logger
+from qdrant_client import AsyncQdrantClient, models
+from qdrant_client.models import PointStruct
+from app.config import settings
+from .collection_profiles import CollectionProfile
+from .vector_store import (
+    PointGroup,
+    ScoredVectorPoint,
+    SparseVector,
+    StoredPoint,
+    VectorPoint,
+    VectorStore,
+    reciprocal_rank_fusion,
+)
+
+
+class QdrantVectorStore(VectorStore):
+    """
+    Qdrant access through one long-lived AsyncQdrantClient.
+
+    Nothing connects at import time: the client is created on first use and
+    the collection is bootstrapped from the FastAPI lifespan (or lazily by
+    the first operation if Qdrant was unavailable at startup).
+    """
+
+    name = "qdrant"
+
+    sparse_vector_name = "bm25"
+
+    def __init__(self, collection_name: str, profile: CollectionProfile) -> None:
+        self.collection_name = collection_name
+        self.profile = profile
+        self.sparse_enabled = True
+        self._client: Optional[AsyncQdrantClient] = None
+        self._ready = False
+        self._bootstrap_lock = asyncio.Lock()
+
+    @property
+    def client(self) -> AsyncQdrantClient:
+        if self._client is None:
+            self._client = AsyncQdrantClient(
+                url=settings.VECTOR_STORAGE_URL,
+                api_key=settings.VECTOR_STORAGE_API_KEY or None,
+                prefer_grpc=settings.VECTOR_STORAGE_PREFER_GRPC,
+                grpc_port=settings.VECTOR_STORAGE_GRPC_PORT,
+                timeout=settings.VECTOR_STORAGE_TIMEOUT_SECONDS,
+            )
+        return self._client
+
+    async def bootstrap(self) -> None:
+        """
+        Creates the collection and any missing payload indexes.
+        Safe to call repeatedly; only the first successful call does work.
+        """
+        if self._ready:
+            return
+        async with self._bootstrap_lock:
+            if self._ready:
+                return
+            if await self.alias_target(self.collection_name) is None and not (
+                await self.client.collection_exists(collection_name=self.collection_name)
+            ):
+                await self.create_collection(self.collection_name)
+            collection = await self.client.get_collection(
+                collection_name=self.collection_name
+            )
+            sparse_vectors = collection.config.params.sparse_vectors or {}
+            if self.sparse_vector_name not in sparse_vectors:
+                try:
+                    await self.client.update_collection(
+                        collection_name=self.collection_name,
+                        sparse_vectors_config=self.sparse_vectors_config(),
+                    )
+                except Exception as e:
+                    self.sparse_enabled = False
+                    logger.warning(
+                        f"Collection {self.collection_name} has no sparse vectors and "
+                        f"they could not be added ({e}); hybrid search is disabled "
+                        "until the collection is rebuilt"
+                    )
+            await self.create_payload_indexes(
+                self.collection_name, existing=collection.payload_schema or {}
+            )
+            for problem in self.profile_drift(collection):
+                logger.warning(f"Collection {self.collection_name}: {problem}")
+            self._ready = True
+
+    async def create_collection(self, collection_name: str) -> None:
+        await self.client.create_collection(
+            collection_name=collection_name,
+            vectors_config=self.profile.vectors_config(settings.VECTOR_SIZE),
+            sparse_vectors_config=self.sparse_vectors_config(),
+            quantization_config=self.profile.quantization_config(),
+            hnsw_config=self.profile.hnsw_config(),
+            on_disk_payload=self.profile.payload_on_disk,
+        )
+
+    async def create_payload_indexes(
+        self, collection_name: str, existing: Optional[Dict[str, Any]] = None
+    ) -> None:
+        for field_name, field_schema in self.profile.payload_indexes().items():
+            if field_name not in (existing or {}):
+                await self.client.create_payload_index(
+                    collection_name=collection_name,
+                    field_name=field_name,
+                    field_schema=field_schema,
+                )
+
+    async def alias_target(self, alias: str) -> Optional[str]:
+        """
+        The collection an alias points to, or None if `alias` is not an alias
+        (it may still be a plain collection).
+        """
+        response = await self.client.get_aliases()
+        for description in response.aliases:
+            if description.alias_name == alias:
+                return description.collection_name
+        return None
+
+    async def switch_alias(self, alias: str, collection_name: str) -> Optional[str]:
+        """
+        Points `alias` at `collection_name` and returns the collection it
+        pointed to before. Re-pointing an existing alias is one atomic
+        update_collection_aliases call, so searches never see a missing
+        collection. A plain collection named like the alias (from before
+        aliases were used) has to be deleted first; searches fail for the
+        moment between that delete and the alias creation.
+        """
+        previous = await self.alias_target(alias)
+        operations: List[models.AliasOperations] = [
+            models.CreateAliasOperation(
+                create_alias=models.CreateAlias(
+                    collection_name=collection_name, alias_name=alias
+                )
+            )
+        ]
+        if previous is not None:
+            operations.insert(
+                0,
+                models.DeleteAliasOperation(
+                    delete_alias=models.DeleteAlias(alias_name=alias)
+                ),
+            )
+        elif await self.client.collection_exists(collection_name=alias):
+            await self.client.delete_collection(collection_name=alias)
+            previous = alias
+        await self.client.update_collection_aliases(
+            change_aliases_operations=operations
+        )
+        return previous
+
+    def profile_drift(self, collection) -> List[str]:
+        """
+        Differences between an existing collection and the configured profile.
+        Layout differences can be fixed in place with apply_profile; a
+        different vector size needs a reindex into a new collection.
+        """
+        params = collection.config.params
+        vectors = params.vectors
+        problems = []
+        if getattr(vectors, "size", settings.VECTOR_SIZE) != settings.VECTOR_SIZE:
+            problems.append(
+                f"vector size is {vectors.size}, VECTOR_SIZE is {settings.VECTOR_SIZE}; "
+                "reindex into a new collection"
+            )
+        layout = {
+            "quantization": collection.config.quantization_config is not None,
+            "vectors_on_disk": bool(getattr(vectors, "on_disk", False)),
+            "payload_on_disk": bool(params.on_disk_payload),
+        }
+        expected = {
+            "quantization": self.profile.quantized,
+            "vectors_on_disk": self.profile.vectors_on_disk,
+            "payload_on_disk": self.profile.payload_on_disk,
+        }
+        for key, value in expected.items():
+            if layout[key] != value:
+                problems.append(
+                    f"{key} is {layout[key]} but profile {self.profile.name!r} "
+                    f"expects {value}; run scripts.apply_collection_profile"
+                )
+        return problems
+
+    async def apply_profile(self) -> List[str]:
+        """
+        Migrates an existing collection to the configured profile in place:
+        quantization, on-disk vectors and payloads, HNSW layout and the tenant
+        index. Qdrant applies the changes as it re-optimizes segments, so the
+        collection stays searchable meanwhile. Returns the drift found before.
+        """
+        collection = await self.client.get_collection(
+            collection_name=self.collection_name
+        )
+        drift = self.profile_drift(collection)
+        await self.client.update_collection(
+            collection_name=self.collection_name,
+            vectors_config={
+                "": models.VectorParamsDiff(on_disk=self.profile.vectors_on_disk)
+            },
+            collection_params=models.CollectionParamsDiff(
+                on_disk_payload=self.profile.payload_on_disk
+            ),
+            quantization_config=(
+                self.profile.quantization_config() or models.Disabled.DISABLED
+            ),
+            hnsw_config=self.profile.hnsw_config() or models.HnswConfigDiff(m=16),
+        )
+        # Re-create the user_id index so its tenant flag matches the profile.
+        if "user_id" in (collection.payload_schema or {}):
+            await self.client.delete_payload_index(
+                collection_name=self.collection_name, field_name="user_id"
+            )
+        await self.create_payload_indexes(
+            self.collection_name,
+            existing={
+                key: value
+                for key, value in (collection.payload_schema or {}).items()
+                if key != "user_id"
+            },
+        )
+        return drift
+
+    def sparse_vectors_config(self) -> Dict[str, models.SparseVectorParams]:
+        # Documents store BM25 term-frequency weights; Qdrant applies IDF.
+        return {
+            self.sparse_vector_name: models.SparseVectorParams(
+                modifier=models.Modifier.IDF
+            )
+        }
+
+    async def start(self) -> None:
+        """
+        Bootstraps with a few retries. A Qdrant outage doesn't block startup;
+        the next vector operation retries the bootstrap.
+        """
+        attempts = max(1, settings.VECTOR_STORAGE_STARTUP_RETRIES)
+        for attempt in range(1, attempts + 1):
+            try:
+                await self.bootstrap()
+                return
+            except Exception as e:
+                logger.warning(
+                    f"Vector storage bootstrap attempt {attempt}/{attempts} failed: {e}"
+                )
+                if attempt < attempts:
+                    await asyncio.sleep(min(2 ** (attempt - 1), 10))
+        logger.error("Vector storage is unavailable; continuing without it")
+
+    async def close(self) -> None:
+        if self._client is not None:
+            await self._client.close()
+            self._client = None
+            self._ready = False
+
+    async def health(self) -> dict:
+        started = time.perf_counter()
+        try:
+            await self.bootstrap()
+            collection = await self.client.get_collection(
+                collection_name=self.collection_name
+            )
+        except Exception as e:
+            return {
+                "backend": self.name,
+                "status": "unavailable",
+                "error": str(e),
+                "latency_ms": round((time.perf_counter() - started) * 1000, 1),
+            }
+        return {
+            "backend": self.name,
+            "status": str(getattr(collection.status, "value", collection.status)),
+            "points_count": collection.points_count,
+            "transport": "grpc" if settings.VECTOR_STORAGE_PREFER_GRPC else "http",
+            "profile": self.profile.name,
+            "latency_ms": round((time.perf_counter() - started) * 1000, 1),
+        }
+
+    async def upsert(self, points: List[VectorPoint]) -> None:
+        if not points:
+            return
+        await self.bootstrap()
+        await self.client.upsert(
+            collection_name=self.collection_name,
+            points=[
+                PointStruct(id=point.id, vector=self._vectors(point), payload=point.payload)
+                for point in points
+            ],
+        )
+
+    def _vectors(self, point: VectorPoint):
+        if point.sparse_vector is None or not self.sparse_enabled:
+            return point.vector
+        return {
+            "": point.vector,
+            self.sparse_vector_name: models.SparseVector(
+                indices=point.sparse_vector.indices, values=point.sparse_vector.values
+            ),
+        }
+
+    @staticmethod
+    def _filter(user_id: str, filters: Optional[Dict[str, Any]]) -> models.Filter:
+        conditions: List[models.Condition] = [
+            models.FieldCondition(key="user_id", match=models.MatchValue(value=user_id))
+        ]
+        for key, value in (filters or {}).items():
+            match = (
+                models.MatchAny(any=list(value))
+                if isinstance(value, (list, tuple, set))
+                else models.MatchValue(value=value)
+            )
+            conditions.append(models.FieldCondition(key=key, match=match))
+        return models.Filter(must=conditions)
+
+    @staticmethod
+    def _scored(scored_point) -> ScoredVectorPoint:
+        return ScoredVectorPoint(
+            id=str(scored_point.id),
+            score=scored_point.score,
+            payload=scored_point.payload or {},
+        )
+
+    async def search(
+        self,
+        vector: List[float],
+        user_id: str,
+        limit: int,
+        score_threshold: Optional[float] = None,
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> List[ScoredVectorPoint]:
+        await self.bootstrap()
+        search_result = await self.client.search(
+            collection_name=self.collection_name,
+            query_vector=vector,
+            query_filter=self._filter(user_id, filters),
+            limit=limit,
+            with_payload=True,
+            score_threshold=score_threshold,
+            search_params=self.profile.search_params(),
+        )
+        return [self._scored(scored_point) for scored_point in search_result]
+
+    async def search_groups(
+        self,
+        vector: List[float],
+        user_id: str,
+        group_by: str,
+        limit: int,
+        group_size: int,
+        score_threshold: Optional[float] = None,
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> List[PointGroup]:
+        await self.bootstrap()
+        result = await self.client.query_points_groups(
+            collection_name=self.collection_name,
+            group_by=group_by,
+            query=vector,
+            query_filter=self._filter(user_id, filters),
+            limit=limit,
+            group_size=group_size,
+            with_payload=True,
+            score_threshold=score_threshold,
+            search_params=self.profile.search_params(),
+        )
+        return [
+            PointGroup(
+                id=str(group.id),
+                hits=[self._scored(scored_point) for scored_point in group.hits],
+            )
+            for group in result.groups
+        ]
+
+    async def hybrid_search(
+        self,
+        vector: List[float],
+        sparse_vector: SparseVector,
+        user_id: str,
+        limit: int,
+        prefetch_limit: int,
+        weights: Sequence[float] = (1.0, 1.0),
+        rrf_k: int = 60,
+        score_threshold: Optional[float] = None,
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> List[ScoredVectorPoint]:
+        """
+        With equal weights the fusion runs server-side (prefetch + RRF, using
+        Qdrant's own RRF constant). Otherwise both candidate lists are fetched
+        in one batch request and fused here with the weighted formula.
+        """
+        await self.bootstrap()
+        if not self.sparse_enabled or not sparse_vector.indices:
+            return await self.search(
+                vector=vector,
+                user_id=user_id,
+                limit=limit,
+                score_threshold=score_threshold,
+                filters=filters,
+            )
+
+        query_filter = self._filter(user_id, filters)
+        sparse_query = models.SparseVector(
+            indices=sparse_vector.indices, values=sparse_vector.values
+        )
+
+        if len(set(weights)) == 1:
+            result = await self.client.query_points(
+                collection_name=self.collection_name,
+                prefetch=[
+                    models.Prefetch(
+                        query=vector,
+                        filter=query_filter,
+                        limit=prefetch_limit,
+                        score_threshold=score_threshold,
+                        params=self.profile.search_params(),
+                    ),
+                    models.Prefetch(
+                        query=sparse_query,
+                        using=self.sparse_vector_name,
+                        filter=query_filter,
+                        limit=prefetch_limit,
+                    ),
+                ],
+                query=models.FusionQuery(fusion=models.Fusion.RRF),
+                limit=limit,
+                with_payload=True,
+            )
+            return [self._scored(scored_point) for scored_point in result.points]
+
+        dense_result, sparse_result = await self.client.query_batch_points(
+            collection_name=self.collection_name,
+            requests=[
+                models.QueryRequest(
+                    query=vector,
+                    filter=query_filter,
+                    limit=prefetch_limit,
+                    score_threshold=score_threshold,
+                    params=self.profile.search_params(),
+                    with_payload=True,
+                ),
+                models.QueryRequest(
+                    query=sparse_query,
+                    using=self.sparse_vector_name,
+                    filter=query_filter,
+                    limit=prefetch_limit,
+                    with_payload=True,
+                ),
+            ],
+        )
+        return reciprocal_rank_fusion(
+            [
+                [self._scored(scored_point) for scored_point in dense_result.points],
+                [self._scored(scored_point) for scored_point in sparse_result.points],
+            ],
+            weights=weights,
+            k=rrf_k,
+            limit=limit,
+        )
+
+    async def delete_report_points(
+        self,
+        user_id: str,
+        report_ids: Iterable[str],
+        keep_ids: Iterable[str] = (),
+    ) -> None:
+        report_ids = list(report_ids)
+        keep: List[models.ExtendedPointId] = list(keep_ids)
+        if not report_ids:
+            return
+        await self.bootstrap()
+        await self.client.delete(
+            collection_name=self.collection_name,
+            points_selector=models.FilterSelector(
+                filter=models.Filter(
+                    must=self._filter(user_id, {"report_id": report_ids}).must,
+                    must_not=models.HasIdCondition(has_id=keep) if keep else None,
+                )
+            ),
+        )
+
+    async def delete_points(self, point_ids: Iterable[str]) -> None:
+        points: List[models.ExtendedPointId] = list(point_ids)
+        if not points:
+            return
+        await self.bootstrap()
+        await self.client.delete(
+            collection_name=self.collection_name,
+            points_selector=models.PointIdsList(points=points),
+        )
+
+    async def scroll(
+        self, limit: int, offset: Optional[str] = None
+    ) -> Tuple[List[StoredPoint], Optional[str]]:
+        await self.bootstrap()
+        records, next_offset = await self.client.scroll(
+            collection_name=self.collection_name,
+            limit=limit,
+            offset=offset,
+            with_payload=["user_id", "report_id"],
+            with_vectors=False,
+        )
+        return (
+            [StoredPoint(id=str(record.id), payload=record.payload or {}) for record in records],
+            str(next_offset) if next_offset is not None else None,
+        )
+
+    async def retrieve(self, point_ids: Iterable[str]) -> List[StoredPoint]:
+        ids: List[models.ExtendedPointId] = list(point_ids)
+        if not ids:
+            return []
+        await self.bootstrap()
+        records = await self.client.retrieve(
+            collection_name=self.collection_name,
+            ids=ids,
+            with_payload=True,
+            with_vectors=False,
+        )
+        return [
+            StoredPoint(id=str(record.id), payload=record.payload or {})
+            for record in records
+        ]
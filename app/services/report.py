@@ -1,138 +1,644 @@
 import asyncio
-import json
-import re
-from typing import List, Optional
+from typing import Dict, List, Optional, Set, Tuple, Union
 from fastapi.concurrency import run_in_threadpool
-from PIL import Image
 from io import BytesIO
+from PIL import Image
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from fastapi import UploadFile
 from fastapi.logger import logger
+from google.genai import types
+from pydantic import ValidationError
 from app.config import settings
-from app.schemas.report import Report
+from app.schemas.job import Job
+from app.schemas.report import Report, ReportSearchResult
 from app.query_models.report import ReportStatus
+from app.repositories.job import JobRepository
 from app.repositories.report import ReportRepository
+from app.repositories.report_batch import ReportBatchRepository
+from app.repositories.report_search import ReportSearchRepository
+from app.schemas.report_batch import ReportBatchProgress, ReportBatchUpload
 from app.services.doctor_agent import DoctorAgent
-from app.types.report import MedicalReportAnalysis
+from app.types.report import MedicalReportAnalysis, MedicalReportAnalysisOutput
+from app.utils.common.json_extract import extract_json_object
+from app.utils.db.pagination import Page
+from .image_preprocessing import image_preprocessor
+from .job_queue import report_job_queue
+from .report_dedup import report_dedup_cache
+from .report_events import report_event_bus
+from .upload_storage import SpooledUpload, TooManyFilesError, upload_storage
 from .vector_storage import vector_storage_service
 
 
+class ReportAnalysisError(Exception):
+    pass
+
+
 class ReportService:
 
+    _batch_locks: Dict[str, asyncio.Lock] = {}
+
+    parse_metrics: Dict[str, int] = {
+        "analyses": 0,
+        "structured": 0,
+        "extracted": 0,
+        "parse_failures": 0,
+        "repairs": 0,
+        "repaired": 0,
+        "unrecoverable": 0,
+    }
+
     @classmethod
     def analyze_image_with_ai(
         cls,
         genai_model_name: str,
-        image_data: Image.Image,
-        report: Report,
-        db: Session,
-    ) -> Optional[MedicalReportAnalysis]:
+        image_data: Union[Image.Image, types.Part],
+    ) -> MedicalReportAnalysis:
+        """
+        Runs the multimodal analysis for one report image or page.
+
+        The model is asked for schema-constrained JSON. If the output still
+        can't be validated, a tolerant extractor is tried and then a cheap
+        text-only repair call, instead of re-sending the image.
+        Raises ReportAnalysisError on failure; the job queue decides whether
+        the report is retried or marked FAILED.
+        """
         logger.info(
             f"Initiating AI analysis for medical report using model: {genai_model_name}"
         )
+        cls.parse_metrics["analyses"] += 1
         try:
             response = DoctorAgent.analyze_report(image_data=image_data)
+        except Exception as e:
+            logger.error(
+                f"An unexpected error occurred during Gemini AI analysis: {e}",
+                exc_info=True,
+            )
+            raise ReportAnalysisError(str(e)) from e
 
-            if (
-                response.candidates
-                and len(response.candidates) > 0
-                and response.candidates[0].content
-                and response.candidates[0].content.parts
-            ):
-                raw_gemini_text = response.candidates[0].content.parts[0].text
-
-                if not raw_gemini_text:
-                    logger.error(
-                        "Gemini AI response is None. No content received for analysis."
-                    )
-                    ReportRepository.set_report_failed(db=db, report_id=report.id)
-                    return None
+        if isinstance(getattr(response, "parsed", None), MedicalReportAnalysisOutput):
+            cls.parse_metrics["structured"] += 1
+            return MedicalReportAnalysis(**response.parsed.model_dump())
 
-                logger.info(
-                    f"Gemini AI analysis raw response (first 200 chars): {raw_gemini_text[:200]}..."
-                )
+        raw_gemini_text = cls._first_text(response)
+        if not raw_gemini_text:
+            raise ReportAnalysisError(
+                "No valid response candidates or content received from Gemini for image analysis."
+            )
 
-                json_string_to_parse = raw_gemini_text
+        logger.info(
+            f"Gemini AI analysis raw response (first 200 chars): {raw_gemini_text[:200]}..."
+        )
 
-                json_match = re.search(
-                    r"```json\n(.*)\n```", raw_gemini_text, re.DOTALL
-                )
-                if json_match:
-                    json_string_to_parse = json_match.group(1).strip()
-                    logger.info("Extracted JSON from markdown block for parsing.")
+        ai_analysis = cls._parse_analysis(raw_gemini_text)
+        if ai_analysis is not None:
+            cls.parse_metrics["extracted"] += 1
+            return ai_analysis
 
-                try:
-                    ai_analysis = MedicalReportAnalysis.model_validate_json(
-                        json_string_to_parse
-                    )
-                    ai_analysis.user_id = report.user_id
-                    ReportRepository.populate_report(
-                        db=db,
-                        report_id=report.id,
-                        title=ai_analysis.title,
-                        description=ai_analysis.summary,
-                        status=ReportStatus.COMPLETED,
-                    )
-                    vector_storage_service.embed_content_for_retrieval(
-                        report=ai_analysis,
-                        title=ai_analysis.title,
-                    )
-                    logger.info(
-                        f"Gemini AI analysis parsed successfully. Title: '{ai_analysis.title}'"
-                    )
-                    return ai_analysis
-                except json.JSONDecodeError as e:
-                    logger.error(
-                        f"Failed to decode JSON from Gemini response: {e}. Text attempting to parse: '{json_string_to_parse}'",
-                        exc_info=True,
-                    )
-            else:
-                logger.warning(
-                    "No valid response candidates or content received from Gemini for image analysis."
-                )
-                ReportRepository.set_report_failed(db=db, report_id=report.id)
+        cls.parse_metrics["parse_failures"] += 1
+        logger.warning("Could not parse Gemini analysis; requesting a text-only repair")
+        cls.parse_metrics["repairs"] += 1
+        try:
+            repair_response = DoctorAgent.repair_report_analysis(raw_text=raw_gemini_text)
         except Exception as e:
+            cls.parse_metrics["unrecoverable"] += 1
+            raise ReportAnalysisError(f"Analysis repair call failed: {e}") from e
+
+        if isinstance(
+            getattr(repair_response, "parsed", None), MedicalReportAnalysisOutput
+        ):
+            ai_analysis = MedicalReportAnalysis(**repair_response.parsed.model_dump())
+        else:
+            ai_analysis = cls._parse_analysis(cls._first_text(repair_response) or "")
+
+        if ai_analysis is None:
+            cls.parse_metrics["unrecoverable"] += 1
+            raise ReportAnalysisError(
+                f"Failed to parse Gemini analysis after repair. Text: '{raw_gemini_text[:500]}'"
+            )
+        cls.parse_metrics["repaired"] += 1
+        logger.info(f"Gemini AI analysis repaired. Title: '{ai_analysis.title}'")
+        return ai_analysis
+
+    @staticmethod
+    def _first_text(response) -> Optional[str]:
+        if (
+            response.candidates
+            and len(response.candidates) > 0
+            and response.candidates[0].content
+            and response.candidates[0].content.parts
+        ):
+            return response.candidates[0].content.parts[0].text
+        return None
+
+    @staticmethod
+    def _parse_analysis(text: str) -> Optional[MedicalReportAnalysis]:
+        json_string_to_parse = extract_json_object(text)
+        if json_string_to_parse is None:
+            return None
+        try:
+            return MedicalReportAnalysis.model_validate_json(json_string_to_parse)
+        except ValidationError as e:
             logger.error(
-                f"An unexpected error occurred during Gemini AI analysis: {e}",
-                exc_info=True,
+                f"Failed to validate Gemini analysis JSON: {e}",
             )
-            ReportRepository.set_report_failed(db=db, report_id=report.id)
+            return None
+
+    @classmethod
+    def parse_stats(cls) -> dict:
+        analyses = cls.parse_metrics["analyses"]
+        repairs = cls.parse_metrics["repairs"]
+        return {
+            **cls.parse_metrics,
+            "parse_failure_rate": (
+                round(cls.parse_metrics["parse_failures"] / analyses, 4)
+                if analyses
+                else None
+            ),
+            "repair_success_rate": (
+                round(cls.parse_metrics["repaired"] / repairs, 4) if repairs else None
+            ),
+        }
+
+    @classmethod
+    def merge_analyses(
+        cls, analyses: List[MedicalReportAnalysis]
+    ) -> MedicalReportAnalysis:
+        """
+        Combines per-page analyses into one. Patient-facing fields are kept per
+        page; vector_data segments are joined with the same pipe separator the
+        prompt uses between categories.
+        """
+        if len(analyses) == 1:
+            return analyses[0]
+
+        def by_page(field: str) -> str:
+            return "\n\n".join(
+                f"Page {index}: {getattr(analysis, field)}"
+                for index, analysis in enumerate(analyses, start=1)
+            )
+
+        return MedicalReportAnalysis(
+            title=analyses[0].title,
+            summary=by_page("summary"),
+            analysis=by_page("analysis"),
+            further_diagnosis=by_page("further_diagnosis"),
+            immediate_actions=by_page("immediate_actions"),
+            conclusion=by_page("conclusion"),
+            vector_data=" | ".join(analysis.vector_data for analysis in analyses),
+        )
+
+    @classmethod
+    async def store_analysis(
+        cls, db: Session, report: Report, ai_analysis: MedicalReportAnalysis
+    ) -> None:
+        ai_analysis.user_id = report.user_id
+        await run_in_threadpool(
+            ReportRepository.populate_report,
+            db=db,
+            report_id=report.id,
+            title=ai_analysis.title,
+            description=ai_analysis.summary,
+            status=ReportStatus.COMPLETED,
+            analysis=ai_analysis.model_dump_json(),
+        )
+        await vector_storage_service.embed_content_for_retrieval(
+            report_id=report.id, report=ai_analysis
+        )
+        report_event_bus.publish(
+            user_id=report.user_id, report_id=report.id, status=ReportStatus.COMPLETED
+        )
 
     @classmethod
-    async def get_reports(cls, db: Session, user_id: str) -> List[Report]:
-        return ReportRepository.get_reports_by_user_id(db=db, user_id=user_id)
+    async def get_reports(
+        cls, db: AsyncSession, user_id: str, limit: int, cursor: Optional[str] = None
+    ) -> Page[Report]:
+        return await ReportRepository.get_reports_page_async(
+            db=db, user_id=user_id, limit=limit, cursor=cursor
+        )
 
     @classmethod
-    async def get_reports_by_title(
-        cls, db: Session, title: str, user_id: str
-    ) -> List[Report]:
-        return ReportRepository.get_reports_by_title(
-            title=title, db=db, user_id=user_id
+    async def search_reports(
+        cls, db: AsyncSession, query: str, user_id: str, limit: int
+    ) -> List[ReportSearchResult]:
+        return await ReportSearchRepository.search_async(
+            db=db, user_id=user_id, query=query, limit=limit
         )
 
     @classmethod
     async def delete_report(cls, db, report_id):
-        return ReportRepository.delete_report(db=db, report_id=report_id)
+        report = await run_in_threadpool(ReportRepository.get_report_by_id, db, report_id)
+        deleted = await run_in_threadpool(
+            ReportRepository.delete_report, db=db, report_id=report_id
+        )
+        if deleted:
+            report_event_bus.publish(
+                user_id=report.user_id, report_id=report_id, status=ReportStatus.DELETED
+            )
+            try:
+                await cls.remove_from_index(db=db, report=report)
+            except Exception as e:
+                # The reconciliation job removes the points later.
+                logger.error(
+                    f"Failed to remove report {report_id} from the vector store: {e}",
+                    exc_info=True,
+                )
+        return deleted
+
+    @classmethod
+    async def remove_from_index(cls, db: Session, report) -> None:
+        """
+        Deletes the report's vector points. Uploads served from the dedup
+        cache share the original's analysis but have no points of their own,
+        so the first such copy is indexed before the original's points go.
+        """
+        if report.analysis is not None:
+            successor = await run_in_threadpool(
+                ReportRepository.get_report_with_same_analysis,
+                db,
+                user_id=report.user_id,
+                analysis=report.analysis,
+                exclude_report_id=report.id,
+            )
+            if successor is not None:
+                await vector_storage_service.embed_content_for_retrieval(
+                    report_id=successor.id,
+                    report=MedicalReportAnalysis.model_validate_json(successor.analysis),
+                )
+        await vector_storage_service.delete_reports(
+            user_id=report.user_id, report_ids=[report.id]
+        )
 
     @classmethod
-    async def upload_report(cls, db: Session, file: UploadFile, user_id: str) -> Report:
-        file_content = await file.read()
+    async def upload_report(
+        cls,
+        db: Session,
+        files: List[UploadFile],
+        user_id: str,
+        force_reanalysis: bool = False,
+    ) -> Report:
+        """
+        Accepts one report as one or more images and/or PDFs. Files are spooled
+        to disk as they stream in; the worker loads and rasterizes them later.
+        """
+        if len(files) > settings.REPORT_UPLOAD_MAX_FILES:
+            raise TooManyFilesError(
+                f"At most {settings.REPORT_UPLOAD_MAX_FILES} files can be uploaded per report"
+            )
 
-        image = Image.open(BytesIO(file_content))
+        report, job = await cls._admit_upload(
+            db=db, files=files, user_id=user_id, force_reanalysis=force_reanalysis
+        )
+        if job is not None:
+            report_job_queue.enqueue(job.id)
+        return report
 
-        report = ReportRepository.add_report(
+    @classmethod
+    async def upload_report_batch(
+        cls,
+        db: Session,
+        files: List[UploadFile],
+        user_id: str,
+        force_reanalysis: bool = False,
+    ) -> ReportBatchUpload:
+        """
+        Creates one report per file under a new batch. Analyses run at most
+        REPORT_BATCH_MAX_CONCURRENCY at a time; the batch is embedded in one go
+        once every report has been analysed.
+        """
+        if len(files) > settings.REPORT_BATCH_MAX_FILES:
+            raise TooManyFilesError(
+                f"At most {settings.REPORT_BATCH_MAX_FILES} files can be uploaded per batch"
+            )
+        report_job_queue.ensure_capacity(len(files))
+
+        batch = await run_in_threadpool(
+            ReportBatchRepository.add_batch, db=db, user_id=user_id, total=len(files)
+        )
+        reports: List[Report] = []
+        jobs: List[Job] = []
+        for file in files:
+            report, job = await cls._admit_upload(
+                db=db,
+                files=[file],
+                user_id=user_id,
+                force_reanalysis=force_reanalysis,
+                batch_id=batch.id,
+            )
+            reports.append(report)
+            if job is not None:
+                jobs.append(job)
+
+        for job in jobs:
+            report_job_queue.enqueue(job.id, group=batch.id, check_capacity=False)
+
+        return ReportBatchUpload(batch_id=batch.id, reports=reports)
+
+    @classmethod
+    async def get_batch_progress(
+        cls, db: AsyncSession, batch_id: str
+    ) -> Optional[ReportBatchProgress]:
+        batch = await ReportBatchRepository.get_batch_by_id_async(db, batch_id)
+        if batch is None:
+            return None
+        counts = await ReportRepository.count_reports_by_status_async(db, batch_id)
+        processing = counts.get(ReportStatus.PROCESSING, 0)
+        return ReportBatchProgress(
+            batch_id=batch.id,
+            total=batch.total,
+            processing=processing,
+            completed=counts.get(ReportStatus.COMPLETED, 0),
+            failed=counts.get(ReportStatus.FAILED, 0),
+            done=processing == 0,
+        )
+
+    @classmethod
+    async def _admit_upload(
+        cls,
+        db: Session,
+        files: List[UploadFile],
+        user_id: str,
+        force_reanalysis: bool,
+        batch_id: Optional[str] = None,
+    ) -> Tuple[Report, Optional[Job]]:
+        """
+        Spools the files and either completes the report from the dedup cache
+        or stores the upload and creates its analysis job.
+        """
+        uploads: List[SpooledUpload] = []
+        try:
+            for file in files:
+                uploads.append(await upload_storage.spool(file))
+
+            fingerprint = await run_in_threadpool(
+                report_dedup_cache.fingerprint, uploads
+            )
+            cached_report = await run_in_threadpool(
+                report_dedup_cache.lookup,
+                db,
+                user_id=user_id,
+                fingerprint=fingerprint,
+                force_reanalysis=force_reanalysis,
+            )
+            if cached_report is not None:
+                logger.info(
+                    f"Upload matches analysed report {cached_report.id}; reusing its analysis"
+                )
+                # The cached report's vector point already covers this content for
+                # the user, so no new embedding or point is created.
+                report = await run_in_threadpool(
+                    ReportRepository.add_completed_report,
+                    db=db,
+                    user_id=user_id,
+                    title=cached_report.title,
+                    description=cached_report.description,
+                    analysis=cached_report.analysis,
+                    batch_id=batch_id,
+                )
+                report_event_bus.publish(
+                    user_id=user_id,
+                    report_id=report.id,
+                    status=report.status,
+                    batch_id=batch_id,
+                )
+                return report, None
+
+            if batch_id is None:
+                report_job_queue.ensure_capacity()
+
+            report = await run_in_threadpool(
+                ReportRepository.add_report,
+                db=db,
+                user_id=user_id,
+                batch_id=batch_id,
+            )
+            await run_in_threadpool(
+                report_dedup_cache.record,
+                db,
+                user_id=user_id,
+                report_id=report.id,
+                fingerprint=fingerprint,
+            )
+            report_event_bus.publish(
+                user_id=user_id,
+                report_id=report.id,
+                status=report.status,
+                batch_id=batch_id,
+            )
+
+            upload_path = await run_in_threadpool(
+                upload_storage.save, report_id=report.id, uploads=uploads
+            )
+        finally:
+            for upload in uploads:
+                upload.close()
+
+        job = await run_in_threadpool(
+            JobRepository.add_job,
             db=db,
+            report_id=report.id,
             user_id=user_id,
+            upload_path=upload_path,
+            max_attempts=settings.REPORT_JOB_MAX_ATTEMPTS,
+            batch_id=batch_id,
+        )
+        return report, job
+
+    @classmethod
+    async def load_pages(cls, upload_path: str) -> List[bytes]:
+        """
+        Returns the upload as a list of page images, rasterizing PDF parts.
+        """
+        pages: List[bytes] = []
+        for part_path in upload_storage.list_parts(upload_path):
+            content = await run_in_threadpool(upload_storage.read, part_path)
+            if content.startswith(b"%PDF"):
+                pages.extend(await image_preprocessor.rasterize_pdf(content))
+            else:
+                pages.append(content)
+        if not pages:
+            raise ReportAnalysisError(f"No pages found in upload {upload_path}")
+        return pages[: settings.REPORT_MAX_PAGES]
+
+    @classmethod
+    async def analyze_page(cls, page: bytes) -> MedicalReportAnalysis:
+        processed = await image_preprocessor.preprocess(page)
+        if processed is not None:
+            image = types.Part.from_bytes(data=processed, mime_type="image/jpeg")
+        else:
+            image = await run_in_threadpool(Image.open, BytesIO(page))
+
+        return await run_in_threadpool(
+            cls.analyze_image_with_ai,
+            genai_model_name=settings.GOOGLE_GENAI_MODEL,
+            image_data=image,
+        )
+
+    @classmethod
+    async def run_analysis_job(cls, db: Session, job: Job) -> None:
+        report = await run_in_threadpool(
+            ReportRepository.get_report_by_id, db, job.report_id
         )
+        if report is None or report.status == ReportStatus.DELETED:
+            logger.info(f"Skipping analysis job {job.id}; report no longer exists")
+            upload_storage.delete(job.upload_path)
+            return
+
+        if job.batch_id is not None and report.analysis is not None:
+            # Analysed on an earlier attempt; only the batch embedding is left.
+            await cls.finalize_batch(db=db, batch_id=job.batch_id)
+            upload_storage.delete(job.upload_path)
+            return
+
+        pages = await cls.load_pages(job.upload_path)
+        page_limit = asyncio.Semaphore(settings.REPORT_PAGE_MAX_CONCURRENCY)
+
+        async def analyze(page: bytes) -> MedicalReportAnalysis:
+            async with page_limit:
+                return await cls.analyze_page(page)
+
+        analyses = await asyncio.gather(*(analyze(page) for page in pages))
+        ai_analysis = cls.merge_analyses(list(analyses))
 
-        asyncio.create_task(
-            run_in_threadpool(
-                cls.analyze_image_with_ai,
-                genai_model_name=settings.GOOGLE_GENAI_MODEL,
-                image_data=image,
-                report=report,
+        if job.batch_id is not None:
+            ai_analysis.user_id = report.user_id
+            await run_in_threadpool(
+                ReportRepository.populate_report,
                 db=db,
+                report_id=report.id,
+                title=ai_analysis.title,
+                description=ai_analysis.summary,
+                status=ReportStatus.PROCESSING,
+                analysis=ai_analysis.model_dump_json(),
             )
+            await cls.finalize_batch(db=db, batch_id=job.batch_id)
+        else:
+            await cls.store_analysis(
+                db=db,
+                report=Report.model_validate(report),
+                ai_analysis=ai_analysis,
+            )
+        upload_storage.delete(job.upload_path)
+
+    @classmethod
+    async def fail_analysis_job(cls, db: Session, job: Job) -> None:
+        await run_in_threadpool(
+            ReportRepository.set_report_failed, db=db, report_id=job.report_id
+        )
+        report_event_bus.publish(
+            user_id=job.user_id,
+            report_id=job.report_id,
+            status=ReportStatus.FAILED,
+            batch_id=job.batch_id,
         )
+        upload_storage.delete(job.upload_path)
+        if job.batch_id is not None:
+            await cls.finalize_batch(db=db, batch_id=job.batch_id)
 
-        return report
+    @classmethod
+    async def finalize_batch(cls, db: Session, batch_id: str) -> None:
+        """
+        Once no report in the batch is still waiting for analysis, embeds all
+        analysed reports with one batched request and one upsert, then marks
+        them COMPLETED.
+        """
+        lock = cls._batch_locks.setdefault(batch_id, asyncio.Lock())
+        async with lock:
+            reports = await run_in_threadpool(
+                ReportRepository.get_reports_by_batch_id, db, batch_id
+            )
+            if any(
+                report.status == ReportStatus.PROCESSING and report.analysis is None
+                for report in reports
+            ):
+                # The lock stays registered until the batch is finalized, so
+                # every finalizer of the batch queues on the same lock.
+                return
+
+            ready = [
+                report
+                for report in reports
+                if report.status == ReportStatus.PROCESSING
+                and report.analysis is not None
+            ]
+            if ready:
+                analyses = {
+                    report.id: MedicalReportAnalysis.model_validate_json(report.analysis)
+                    for report in ready
+                }
+                await vector_storage_service.embed_reports_for_retrieval(analyses)
+                for report in ready:
+                    await run_in_threadpool(
+                        ReportRepository.update_report_status,
+                        db=db,
+                        report_id=report.id,
+                        status=ReportStatus.COMPLETED,
+                    )
+                    report_event_bus.publish(
+                        user_id=report.user_id,
+                        report_id=report.id,
+                        status=ReportStatus.COMPLETED,
+                        batch_id=batch_id,
+                    )
+                logger.info(f"Embedded {len(ready)} reports for batch {batch_id}")
+            # Dropped under the lock: finalizers already waiting on it find
+            # every report settled and do nothing.
+            cls._batch_locks.pop(batch_id, None)
+
+    @classmethod
+    async def recover_pending_reports(cls, db: Session) -> None:
+        """
+        Re-enqueues jobs interrupted by a restart and fails PROCESSING reports
+        that have no job left to finish them.
+        """
+        jobs, failed_reports, unfinished_batches = await run_in_threadpool(
+            cls._recover_pending_rows, db
+        )
+        for job in jobs:
+            report_job_queue.enqueue(job.id, recovered=True, group=job.batch_id)
+        for report, batch_id in failed_reports:
+            report_event_bus.publish(
+                user_id=report.user_id,
+                report_id=report.id,
+                status=ReportStatus.FAILED,
+                batch_id=batch_id,
+            )
+
+        for batch_id in unfinished_batches:
+            try:
+                await cls.finalize_batch(db=db, batch_id=batch_id)
+            except Exception as e:
+                logger.error(f"Failed to finalize batch {batch_id}: {e}", exc_info=True)
+
+    @classmethod
+    def _recover_pending_rows(
+        cls, db: Session
+    ) -> Tuple[List[Job], List[Tuple[Report, Optional[str]]], Set[str]]:
+        """
+        The database half of recover_pending_reports, run in the threadpool:
+        requeues unfinished jobs and marks orphaned reports FAILED. Returns
+        the requeued jobs, the failed reports with their batch ids, and the
+        batches whose reports are all analysed but not yet embedded.
+        """
+        jobs = JobRepository.get_unfinished_jobs(db)
+        for job in jobs:
+            JobRepository.mark_queued(db, job.id)
+
+        active_report_ids = set(JobRepository.get_active_report_ids(db))
+        failed_reports: List[Tuple[Report, Optional[str]]] = []
+        unfinished_batches: Set[str] = set()
+        for report in ReportRepository.get_reports_by_status(
+            db, ReportStatus.PROCESSING
+        ):
+            if report.id in active_report_ids:
+                continue
+            report_row = ReportRepository.get_report_by_id(db, report.id)
+            if report_row.batch_id is not None and report_row.analysis is not None:
+                unfinished_batches.add(report_row.batch_id)
+                continue
+            logger.warning(
+                f"Report {report.id} was left in PROCESSING without a job; marking FAILED"
+            )
+            ReportRepository.set_report_failed(db=db, report_id=report.id)
+            failed_reports.append((report, report_row.batch_id))
+        return jobs, failed_reports, unfinished_batches
@@ -0,0 +1,152 @@
+import hashlib
+from dataclasses import dataclass
+from io import BytesIO
+from typing import List, Optional
+from PIL import Image
+from sqlalchemy.orm import Session
+from app.config import settings
+from app.models.report import Report
+from app.repositories.report_fingerprint import ReportFingerprintRepository
+from .upload_storage import SpooledUpload
+
+
+@dataclass
+class UploadFingerprint:
+    content_hash: str
+    perceptual_hash: Optional[str] = None
+
+
+class ReportDedupCache:
+    """
+    Content-addressed lookup of earlier analyses for the same user.
+
+    Uploads are matched by SHA-256 of their bytes and, when
+    REPORT_DEDUP_PERCEPTUAL is enabled, by a 64-bit difference hash so that
+    recompressed or resized copies of a scan also hit. The difference hash
+    only sees the page layout at 9x8 pixels: two reports from the same lab
+    template with different values can match, so it is opt-in and only
+    suitable where uploads are known re-scans.
+    """
+
+    def __init__(
+        self, enabled: bool, perceptual: bool, perceptual_max_distance: int
+    ) -> None:
+        self.enabled = enabled
+        self.perceptual = perceptual
+        self.perceptual_max_distance = perceptual_max_distance
+        self._counters = {
+            "content_hits": 0,
+            "perceptual_hits": 0,
+            "misses": 0,
+            "forced": 0,
+        }
+
+    @staticmethod
+    def content_hash(content: bytes) -> str:
+        return hashlib.sha256(content).hexdigest()
+
+    @staticmethod
+    def perceptual_hash(content: bytes) -> Optional[str]:
+        """
+        dHash: compares horizontally adjacent pixels of a 9x8 grayscale
+        thumbnail. Returns None for content PIL can't decode (e.g. PDFs).
+        """
+        try:
+            with Image.open(BytesIO(content)) as image:
+                thumbnail = image.convert("L").resize((9, 8), Image.Resampling.LANCZOS)
+        except Exception:
+            return None
+        pixels = list(thumbnail.getdata())
+        bits = 0
+        for row in range(8):
+            for column in range(8):
+                left = pixels[row * 9 + column]
+                right = pixels[row * 9 + column + 1]
+                bits = (bits << 1) | (1 if left > right else 0)
+        return f"{bits:016x}"
+
+    def fingerprint(self, uploads: List[SpooledUpload]) -> UploadFingerprint:
+        """
+        A single file is keyed by its own SHA-256; multi-file uploads by the
+        hash of the ordered file hashes. Only single images get a perceptual
+        hash.
+        """
+        if len(uploads) == 1:
+            content_hash = uploads[0].sha256
+        else:
+            content_hash = self.content_hash(
+                "".join(upload.sha256 for upload in uploads).encode("ascii")
+            )
+
+        perceptual_hash = None
+        if self.perceptual and len(uploads) == 1 and not uploads[0].is_pdf:
+            perceptual_hash = self.perceptual_hash(uploads[0].read())
+
+        return UploadFingerprint(
+            content_hash=content_hash, perceptual_hash=perceptual_hash
+        )
+
+    def lookup(
+        self,
+        db: Session,
+        user_id: str,
+        fingerprint: UploadFingerprint,
+        force_reanalysis: bool = False,
+    ) -> Optional[Report]:
+        if not self.enabled:
+            return None
+        if force_reanalysis:
+            self._counters["forced"] += 1
+            return None
+
+        report = ReportFingerprintRepository.find_report_by_content_hash(
+            db, user_id=user_id, content_hash=fingerprint.content_hash
+        )
+        if report is not None:
+            self._counters["content_hits"] += 1
+            return report
+
+        if fingerprint.perceptual_hash is not None:
+            report = ReportFingerprintRepository.find_report_by_perceptual_hash(
+                db,
+                user_id=user_id,
+                perceptual_hash=fingerprint.perceptual_hash,
+                max_distance=self.perceptual_max_distance,
+            )
+            if report is not None:
+                self._counters["perceptual_hits"] += 1
+                return report
+
+        self._counters["misses"] += 1
+        return None
+
+    def record(
+        self, db: Session, user_id: str, report_id: str, fingerprint: UploadFingerprint
+    ) -> None:
+        if not self.enabled:
+            return
+        ReportFingerprintRepository.add_fingerprint(
+            db,
+            user_id=user_id,
+            report_id=report_id,
+            content_hash=fingerprint.content_hash,
+            perceptual_hash=fingerprint.perceptual_hash,
+        )
+
+    def stats(self, db: Session) -> dict:
+        hits = self._counters["content_hits"] + self._counters["perceptual_hits"]
+        lookups = hits + self._counters["misses"]
+        return {
+            "enabled": self.enabled,
+            "perceptual": self.perceptual,
+            "fingerprints": ReportFingerprintRepository.count_fingerprints(db),
+            **self._counters,
+            "hit_rate": round(hits / lookups, 4) if lookups else None,
+        }
+
+
+report_dedup_cache = ReportDedupCache(
+    enabled=settings.REPORT_DEDUP_ENABLED,
+    perceptual=settings.REPORT_DEDUP_PERCEPTUAL,
+    perceptual_max_distance=settings.REPORT_DEDUP_PERCEPTUAL_MAX_DISTANCE,
+)
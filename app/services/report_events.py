@@ -0,0 +1,314 @@
+import asyncio
+import json
+import time
+from collections import defaultdict, deque
+from dataclasses import dataclass
+from typing import Callable, Deque, Dict, List, Optional, Set, Tuple
+from fastapi.logger import logger
+from app.config import settings
+
+
+@dataclass
+class ReportEvent:
+    id: str
+    user_id: str
+    report_id: str
+    status: str
+    batch_id: Optional[str] = None
+    created_at: float = 0.0
+
+    def to_payload(self) -> dict:
+        return {
+            "reportId": self.report_id,
+            "status": self.status,
+            "batchId": self.batch_id,
+            "createdAt": self.created_at,
+        }
+
+
+def event_id_key(event_id: str) -> Tuple[int, int]:
+    """
+    Event ids have the form "<milliseconds>-<sequence>" (the same shape as
+    Redis stream ids), so they stay ordered across restarts.
+    """
+    milliseconds, sequence = event_id.split("-", 1)
+    return int(milliseconds), int(sequence)
+
+
+def parse_event_id(event_id: str) -> Optional[Tuple[int, int]]:
+    """
+    event_id_key for ids sent by clients; None when malformed.
+    """
+    try:
+        return event_id_key(event_id)
+    except (AttributeError, ValueError):
+        return None
+
+
+class InProcessReportEventBroker:
+    """
+    Default broker: events only reach subscribers connected to this process.
+    Keeps the last `history_size` events per user for Last-Event-ID replay.
+
+    Ids start at the process's boot time, so an id older than that was
+    issued before a restart and one newer than the last issued id came from
+    another process; neither can be replayed from this history.
+    """
+
+    def __init__(self, history_size: int) -> None:
+        self.history_size = history_size
+        self._history: Dict[str, Deque[ReportEvent]] = defaultdict(
+            lambda: deque(maxlen=history_size)
+        )
+        self._evicted: Set[str] = set()
+        self._deliver: Optional[Callable[[ReportEvent], None]] = None
+        self._booted_at: Tuple[int, int] = (int(time.time() * 1000), 0)
+        self._last_id: Tuple[int, int] = self._booted_at
+
+    def _next_id(self) -> str:
+        milliseconds = int(time.time() * 1000)
+        last_milliseconds, last_sequence = self._last_id
+        if milliseconds <= last_milliseconds:
+            self._last_id = (last_milliseconds, last_sequence + 1)
+        else:
+            self._last_id = (milliseconds, 0)
+        return f"{self._last_id[0]}-{self._last_id[1]}"
+
+    async def start(self, deliver: Callable[[ReportEvent], None]) -> None:
+        self._deliver = deliver
+
+    async def stop(self) -> None:
+        self._deliver = None
+
+    async def publish(self, fields: dict) -> None:
+        event = ReportEvent(id=self._next_id(), **fields)
+        history = self._history[event.user_id]
+        if len(history) == history.maxlen:
+            self._evicted.add(event.user_id)
+        history.append(event)
+        if self._deliver is not None:
+            self._deliver(event)
+
+    async def replay(
+        self, user_id: str, last_event_id: str
+    ) -> Optional[List[ReportEvent]]:
+        """
+        Returns the events after `last_event_id`, or None if some of them may
+        already have been dropped from history.
+        """
+        last = parse_event_id(last_event_id)
+        if last is None or last < self._booted_at or last > self._last_id:
+            return None
+        history = list(self._history.get(user_id, ()))
+        if (
+            user_id in self._evicted
+            and history
+            and event_id_key(history[0].id) > last
+        ):
+            return None
+        return [event for event in history if event_id_key(event.id) > last]
+
+
+class RedisReportEventBroker:
+    """
+    Shares events between workers through a capped Redis stream. Every
+    worker tails the stream and fans events out to its own subscribers;
+    replay reads the stream directly. Requires the optional `redis` package.
+    """
+
+    stream_key = "report-events"
+
+    def __init__(self, redis_url: str, stream_max_len: int) -> None:
+        try:
+            from redis import asyncio as redis_asyncio
+        except ImportError as e:
+            raise RuntimeError(
+                "REPORT_EVENTS_REDIS_URL is set but the `redis` package is not installed"
+            ) from e
+        self.stream_max_len = stream_max_len
+        self._redis = redis_asyncio.from_url(redis_url, decode_responses=True)
+        self._listener: Optional[asyncio.Task] = None
+
+    @staticmethod
+    def _to_event(event_id: str, fields: dict) -> ReportEvent:
+        data = json.loads(fields["data"])
+        return ReportEvent(id=event_id, **data)
+
+    async def start(self, deliver: Callable[[ReportEvent], None]) -> None:
+        self._listener = asyncio.create_task(self._listen(deliver))
+
+    async def stop(self) -> None:
+        if self._listener is not None:
+            self._listener.cancel()
+            await asyncio.gather(self._listener, return_exceptions=True)
+            self._listener = None
+        await self._redis.close()
+
+    async def _listen(self, deliver: Callable[[ReportEvent], None]) -> None:
+        last_id = "$"
+        while True:
+            try:
+                response = await self._redis.xread(
+                    {self.stream_key: last_id}, block=5000, count=100
+                )
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Error reading report events from Redis: {e}")
+                await asyncio.sleep(1)
+                continue
+            for _, entries in response or []:
+                for event_id, fields in entries:
+                    last_id = event_id
+                    deliver(self._to_event(event_id, fields))
+
+    async def publish(self, fields: dict) -> None:
+        await self._redis.xadd(
+            self.stream_key,
+            {"data": json.dumps(fields)},
+            maxlen=self.stream_max_len,
+            approximate=True,
+        )
+
+    async def replay(
+        self, user_id: str, last_event_id: str
+    ) -> Optional[List[ReportEvent]]:
+        last = parse_event_id(last_event_id)
+        if last is None:
+            return None
+        oldest = await self._redis.xrange(self.stream_key, count=1)
+        if oldest and event_id_key(oldest[0][0]) > last:
+            return None
+        entries = await self._redis.xrange(self.stream_key, min=f"({last_event_id}")
+        events = [self._to_event(event_id, fields) for event_id, fields in entries]
+        return [event for event in events if event.user_id == user_id]
+
+
+class ReportEventSubscription:
+    def __init__(self, user_id: str, queue_size: int) -> None:
+        self.user_id = user_id
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        self.lagged = False
+
+
+class ReportEventBus:
+    """
+    Fans report status transitions out to per-user subscribers.
+
+    `publish` may be called from the event loop or from threadpool code. A
+    subscriber that falls more than REPORT_EVENTS_SUBSCRIBER_QUEUE_SIZE
+    events behind is marked as lagged; its stream ends and the client
+    reconnects with Last-Event-ID to catch up from history.
+    """
+
+    def __init__(self, broker, queue_size: int) -> None:
+        self.broker = broker
+        self.queue_size = queue_size
+        self._subscribers: Dict[str, Set[ReportEventSubscription]] = defaultdict(set)
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        # Publish tasks are only referenced from here until they finish.
+        self._tasks: Set[asyncio.Task] = set()
+        self._counters = {"published": 0, "delivered": 0, "lagged": 0}
+
+    async def start(self) -> None:
+        self._loop = asyncio.get_running_loop()
+        await self.broker.start(self._deliver)
+
+    async def stop(self) -> None:
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        await self.broker.stop()
+        self._loop = None
+
+    def publish(
+        self,
+        user_id: str,
+        report_id: str,
+        status,
+        batch_id: Optional[str] = None,
+    ) -> None:
+        if self._loop is None:
+            return
+        fields = {
+            "user_id": user_id,
+            "report_id": report_id,
+            "status": getattr(status, "value", status),
+            "batch_id": batch_id,
+            "created_at": time.time(),
+        }
+        self._counters["published"] += 1
+        try:
+            running_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            running_loop = None
+        if running_loop is self._loop:
+            self._start_publish(fields)
+        else:
+            self._loop.call_soon_threadsafe(self._start_publish, fields)
+
+    def _start_publish(self, fields: dict) -> None:
+        task = asyncio.get_running_loop().create_task(self.broker.publish(fields))
+        self._tasks.add(task)
+        task.add_done_callback(self._publish_done)
+
+    def _publish_done(self, task: asyncio.Task) -> None:
+        self._tasks.discard(task)
+        if task.cancelled():
+            return
+        error = task.exception()
+        if error is not None:
+            logger.error(
+                f"Failed to publish report event: {error}",
+                exc_info=(type(error), error, error.__traceback__),
+            )
+
+    def _deliver(self, event: ReportEvent) -> None:
+        for subscription in list(self._subscribers.get(event.user_id, ())):
+            if subscription.lagged:
+                continue
+            try:
+                subscription.queue.put_nowait(event)
+                self._counters["delivered"] += 1
+            except asyncio.QueueFull:
+                subscription.lagged = True
+                self._counters["lagged"] += 1
+
+    def subscribe(self, user_id: str) -> ReportEventSubscription:
+        subscription = ReportEventSubscription(user_id, self.queue_size)
+        self._subscribers[user_id].add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: ReportEventSubscription) -> None:
+        subscribers = self._subscribers.get(subscription.user_id)
+        if subscribers is None:
+            return
+        subscribers.discard(subscription)
+        if not subscribers:
+            self._subscribers.pop(subscription.user_id, None)
+
+    async def replay(
+        self, user_id: str, last_event_id: str
+    ) -> Optional[List[ReportEvent]]:
+        return await self.broker.replay(user_id, last_event_id)
+
+    def stats(self) -> dict:
+        return {
+            "broker": type(self.broker).__name__,
+            "users": len(self._subscribers),
+            "subscribers": sum(len(subs) for subs in self._subscribers.values()),
+            **self._counters,
+        }
+
+
+def _create_broker():
+    if settings.REPORT_EVENTS_REDIS_URL:
+        return RedisReportEventBroker(
+            redis_url=settings.REPORT_EVENTS_REDIS_URL,
+            stream_max_len=settings.REPORT_EVENTS_STREAM_MAX_LEN,
+        )
+    return InProcessReportEventBroker(history_size=settings.REPORT_EVENTS_HISTORY_SIZE)
+
+
+report_event_bus = ReportEventBus(
+    broker=_create_broker(),
+    queue_size=settings.REPORT_EVENTS_SUBSCRIBER_QUEUE_SIZE,
+)
@@ -0,0 +1,124 @@
+import hashlib
+import os
+import shutil
+from dataclasses import dataclass
+from tempfile import SpooledTemporaryFile
+from typing import List
+from fastapi import UploadFile
+from app.config import settings
+
+PDF_CONTENT_TYPE = "application/pdf"
+
+
+class UploadTooLargeError(Exception):
+    pass
+
+
+class UnsupportedUploadError(Exception):
+    pass
+
+
+class TooManyFilesError(Exception):
+    pass
+
+
+@dataclass
+class SpooledUpload:
+    file: SpooledTemporaryFile
+    content_type: str
+    size: int
+    sha256: str
+
+    @property
+    def is_pdf(self) -> bool:
+        return self.content_type == PDF_CONTENT_TYPE
+
+    def read(self) -> bytes:
+        self.file.seek(0)
+        return self.file.read()
+
+    def close(self) -> None:
+        self.file.close()
+
+
+class UploadStorage:
+    """
+    Keeps uploaded report files on disk until their analysis job finishes,
+    so queued work survives a restart and request handlers don't have to
+    hold file contents in memory.
+
+    Request bodies are streamed in chunks into a SpooledTemporaryFile (kept in
+    memory up to REPORT_UPLOAD_SPOOL_BYTES) and rejected past
+    REPORT_UPLOAD_MAX_BYTES. Each upload is saved as a directory of parts,
+    one per uploaded file, which the worker reads lazily.
+    """
+
+    chunk_size = 1024 * 1024
+
+    def __init__(self, base_dir: str, max_bytes: int, spool_bytes: int) -> None:
+        self.base_dir = base_dir
+        self.max_bytes = max_bytes
+        self.spool_bytes = spool_bytes
+
+    async def spool(self, file: UploadFile) -> SpooledUpload:
+        content_type = file.content_type or ""
+        if content_type != PDF_CONTENT_TYPE and not content_type.startswith("image/"):
+            raise UnsupportedUploadError(
+                f"Unsupported file type '{content_type}'; upload images or PDFs"
+            )
+
+        spooled_file = SpooledTemporaryFile(max_size=self.spool_bytes)
+        digest = hashlib.sha256()
+        size = 0
+        try:
+            while chunk := await file.read(self.chunk_size):
+                size += len(chunk)
+                if size > self.max_bytes:
+                    raise UploadTooLargeError(
+                        f"'{file.filename}' exceeds the {self.max_bytes} byte upload limit"
+                    )
+                digest.update(chunk)
+                spooled_file.write(chunk)
+        except BaseException:
+            spooled_file.close()
+            raise
+
+        return SpooledUpload(
+            file=spooled_file,
+            content_type=content_type,
+            size=size,
+            sha256=digest.hexdigest(),
+        )
+
+    def save(self, report_id: str, uploads: List[SpooledUpload]) -> str:
+        upload_dir = os.path.join(self.base_dir, report_id)
+        os.makedirs(upload_dir, exist_ok=True)
+        for index, upload in enumerate(uploads):
+            extension = "pdf" if upload.is_pdf else "img"
+            part_path = os.path.join(upload_dir, f"part-{index:03d}.{extension}")
+            upload.file.seek(0)
+            with open(part_path, "wb") as part_file:
+                shutil.copyfileobj(upload.file, part_file, self.chunk_size)
+        return upload_dir
+
+    def list_parts(self, upload_path: str) -> List[str]:
+        # "upload" is the single-file layout used before multi-part uploads.
+        return [
+            os.path.join(upload_path, name)
+            for name in sorted(os.listdir(upload_path))
+            if name.startswith("part-") or name == "upload"
+        ]
+
+    def read(self, part_path: str) -> bytes:
+        with open(part_path, "rb") as part_file:
+            return part_file.read()
+
+    def delete(self, upload_path: str) -> None:
+        shutil.rmtree(upload_path, ignore_errors=True)
+
+
+upload_storage = UploadStorage(
+    base_dir=settings.REPORT_UPLOAD_DIR,
+    max_bytes=settings.REPORT_UPLOAD_MAX_BYTES,
+    spool_bytes=settings.REPORT_UPLOAD_SPOOL_BYTES,
+)
@@ -0,0 +1,235 @@
+import asyncio
+import hashlib
+import json
+import os
+import time
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+from fastapi.concurrency import run_in_threadpool
+from app.database import WorkerSessionLocal
+from app.repositories.report import ReportRepository
+from app.types.report import MedicalReportAnalysis
+from .collection_profiles import CollectionProfile
+from .qdrant_vector_store import QdrantVectorStore
+from .vector_storage import VectorStorageService
+from .vector_store import VectorPoint
+
+
+class VectorReindexer:
+    """
+    Rebuilds the vector index into a new (shadow) Qdrant collection and then
+    points the COLLECTION_NAME alias at it, so a new embedding model,
+    VECTOR_SIZE or collection profile can be rolled out without downtime.
+
+    Completed analyses are streamed from SQL in report id order,
+    `chunk_size` reports at a time. Each chunk is embedded with batched
+    requests through the LLM gateway (so its rate limits apply) and upserted
+    in one request while the next chunk is being embedded. After every
+    upsert the last report id is written to the checkpoint file, and a rerun
+    continues from there.
+
+    Reports that change while the reindex runs are picked up by a catch-up
+    pass (reports updated since the reindex started), and points of reports
+    deleted meanwhile are removed by a reconciliation of the shadow
+    collection before the switch.
+    """
+
+    def __init__(
+        self,
+        alias: str,
+        profile: CollectionProfile,
+        checkpoint_path: str,
+        chunk_size: int = 200,
+    ) -> None:
+        self.alias = alias
+        self.profile = profile
+        self.checkpoint_path = checkpoint_path
+        self.chunk_size = chunk_size
+        self.checkpoint: Dict = {}
+        # (user_id, analysis hash) -> indexed report id. Deduplicated uploads
+        # share one analysis and, as at upload time, only one copy is indexed.
+        self._seen: Dict[Tuple[str, str], str] = {}
+
+    def load_checkpoint(self) -> Optional[Dict]:
+        if not os.path.exists(self.checkpoint_path):
+            return None
+        with open(self.checkpoint_path, "r") as f:
+            checkpoint = json.load(f)
+        if checkpoint.get("alias") != self.alias:
+            raise ValueError(
+                f"Checkpoint {self.checkpoint_path} belongs to alias "
+                f"{checkpoint.get('alias')!r}, not {self.alias!r}"
+            )
+        return checkpoint
+
+    def save_checkpoint(self) -> None:
+        temporary_path = f"{self.checkpoint_path}.tmp"
+        with open(temporary_path, "w") as f:
+            json.dump(self.checkpoint, f, indent=2)
+        os.replace(temporary_path, self.checkpoint_path)
+
+    async def run(self, swap: bool = True, drop_old: bool = False) -> Dict:
+        checkpoint = self.load_checkpoint()
+        if checkpoint is None:
+            checkpoint = {
+                "alias": self.alias,
+                "collection": f"{self.alias}_{datetime.utcnow():%Y%m%d%H%M%S}",
+                "profile": self.profile.name,
+                "started_at": await run_in_threadpool(self._latest_update),
+                "last_report_id": None,
+                "reports": 0,
+                "points": 0,
+                "indexed": False,
+            }
+        else:
+            print(
+                f"Resuming {checkpoint['collection']} after report "
+                f"{checkpoint['last_report_id']} ({checkpoint['reports']} reports done)"
+            )
+        self.checkpoint = checkpoint
+
+        store = QdrantVectorStore(
+            collection_name=checkpoint["collection"], profile=self.profile
+        )
+        service = VectorStorageService(store=store, section_weights={})
+        try:
+            await store.bootstrap()
+            if not checkpoint["indexed"]:
+                await self._rebuild_seen(checkpoint["last_report_id"])
+                await self._index(service, after_id=checkpoint["last_report_id"])
+                print("Catching up on reports updated during the reindex")
+                await self._index(
+                    service,
+                    after_id=None,
+                    updated_since=checkpoint["started_at"],
+                    resumable=False,
+                )
+                stats = await service.reconcile()
+                print(f"Removed points of reports deleted meanwhile: {stats}")
+                checkpoint["indexed"] = True
+                self.save_checkpoint()
+
+            if swap:
+                previous = await store.switch_alias(self.alias, checkpoint["collection"])
+                print(f"Alias {self.alias} now points to {checkpoint['collection']}")
+                if drop_old and previous and previous != self.alias:
+                    await store.client.delete_collection(collection_name=previous)
+                    print(f"Deleted previous collection {previous}")
+                os.remove(self.checkpoint_path)
+        finally:
+            await store.close()
+        return checkpoint
+
+    async def _index(
+        self,
+        service: VectorStorageService,
+        after_id: Optional[str],
+        updated_since: Optional[str] = None,
+        resumable: bool = True,
+    ) -> None:
+        started = time.perf_counter()
+        reports_done = 0
+        pending: Optional[asyncio.Task] = None
+        try:
+            while True:
+                rows = await run_in_threadpool(
+                    self._page, after_id, self.chunk_size, updated_since
+                )
+                if not rows:
+                    break
+                last_report_id = rows[-1].id
+                after_id = last_report_id
+                reports = self._select(rows)
+                points = await service.embed_report_points(reports)
+                if pending is not None:
+                    await pending
+                pending = asyncio.create_task(
+                    self._write(
+                        service, points, last_report_id, len(reports), resumable
+                    )
+                )
+                reports_done += len(reports)
+                elapsed = time.perf_counter() - started
+                print(
+                    f"{reports_done} reports embedded in {elapsed:.0f}s, "
+                    f"{reports_done / elapsed:.1f} reports/s"
+                )
+            if pending is not None:
+                await pending
+                pending = None
+        finally:
+            if pending is not None:
+                pending.cancel()
+                await asyncio.gather(pending, return_exceptions=True)
+
+    async def _write(
+        self,
+        service: VectorStorageService,
+        points: List[VectorPoint],
+        last_report_id: str,
+        report_count: int,
+        resumable: bool,
+    ) -> None:
+        await service.store.upsert(points)
+        self.checkpoint["points"] += len(points)
+        if resumable:
+            self.checkpoint["last_report_id"] = last_report_id
+            self.checkpoint["reports"] += report_count
+            self.save_checkpoint()
+
+    @staticmethod
+    def _analysis_key(row) -> Tuple[str, str]:
+        return (row.user_id, hashlib.sha256(row.analysis.encode("utf-8")).hexdigest())
+
+    def _select(self, rows) -> Dict[str, MedicalReportAnalysis]:
+        reports = {}
+        for row in rows:
+            key = self._analysis_key(row)
+            if self._seen.setdefault(key, row.id) != row.id:
+                continue
+            try:
+                reports[row.id] = MedicalReportAnalysis.model_validate_json(row.analysis)
+            except Exception as e:
+                print(f"Skipping report {row.id} with an unparsable analysis: {e}")
+        return reports
+
+    async def _rebuild_seen(self, last_report_id: Optional[str]) -> None:
+        """
+        Re-reads the analyses already indexed by an interrupted run so that
+        duplicates of them are still skipped after resuming.
+        """
+        after_id = None
+        while last_report_id is not None:
+            page = await run_in_threadpool(self._page, after_id, 1000, None)
+            rows = [row for row in page if row.id <= last_report_id]
+            for row in rows:
+                self._seen.setdefault(self._analysis_key(row), row.id)
+            if len(rows) < 1000:
+                break
+            after_id = rows[-1].id
+
+    @staticmethod
+    def _page(after_id, limit, updated_since):
+        db = WorkerSessionLocal()
+        try:
+            return ReportRepository.get_analysed_reports_page(
+                db,
+                after_id=after_id,
+                limit=limit,
+                updated_since=(
+                    datetime.fromisoformat(updated_since) if updated_since else None
+                ),
+            )
+        finally:
+            db.close()
+
+    @staticmethod
+    def _latest_update() -> Optional[str]:
+        # Taken from the database clock, which also sets updated_at.
+        db = WorkerSessionLocal()
+        try:
+            latest = ReportRepository.get_latest_update(db)
+        finally:
+            db.close()
+        return latest.isoformat() if latest else None
+
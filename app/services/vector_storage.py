@@ -1,147 +1,542 @@
-from typing import List
-from qdrant_client import QdrantClient, models
-from qdrant_client.models import PointStruct, VectorParams, Distance
+from typing import Dict, List, Optional, Tuple
+from fastapi.concurrency import run_in_threadpool
+from fastapi.logger import logger
+from pydantic import ValidationError
 from app.config import settings
+from app.database import AsyncSessionLocal, WorkerSessionLocal
+from app.query_models.report import ReportStatus
+from app.repositories.report import ReportRepository
 from app.types.report import MedicalReportAnalysis
-from .llm_client import ai_client
+from app.utils.common.bm25 import encode_document, encode_query
+from app.utils.common.report_sections import (
+    parse_section_weights,
+    split_vector_sections,
+)
+from .embedding_cache import query_embedding_cache
+from .llm_client import Priority, llm_gateway
+from .vector_store import (
+    PointGroup,
+    SparseVector,
+    VectorPoint,
+    VectorStore,
+    group_points,
+)
 from google.genai import types
+import asyncio
 import uuid
 
+OVERVIEW_SECTION = "OVERVIEW"
+
+# Namespace for deterministic point ids: uuid5(namespace, "<report_id>:<section>").
+POINT_ID_NAMESPACE = uuid.UUID("8d1461be-d504-4cf9-9687-18ea67419dc5")
+
 
 class VectorStorageService:
+    """
+    Embeds reports and queries and stores them in the configured
+    VectorStore backend (VECTOR_STORE_BACKEND: "qdrant" or "embedded").
+    Each report is indexed as one point per vector_data section, linked back
+    to the report by `report_id`.
+    """
 
-    def __init__(self) -> None:
-        self.vector_storage_client = QdrantClient(
-            url=settings.VECTOR_STORAGE_URL, api_key=settings.VECTOR_STORAGE_API_KEY
-        )
-        try:
-            self.vector_storage_client.get_collection(
-                collection_name=settings.COLLECTION_NAME
-            )
-        except Exception:
-            self.vector_storage_client.recreate_collection(
-                collection_name=settings.COLLECTION_NAME,
-                vectors_config=VectorParams(
-                    size=settings.VECTOR_SIZE, distance=Distance.COSINE
-                ),
-            )
+    # Upper bound on texts per batchEmbedContents request.
+    embedding_batch_size = 100
 
-            self.vector_storage_client.create_payload_index(
-                collection_name=settings.COLLECTION_NAME,
-                field_name="user_id",
-                field_schema=models.PayloadSchemaType.KEYWORD,
-            )
+    # Points per scroll page during reconciliation.
+    reconcile_page_size = 256
 
-            self.vector_storage_client.create_payload_index(
-                collection_name=settings.COLLECTION_NAME,
-                field_name="title",
-                field_schema=models.PayloadSchemaType.TEXT,
-            )
-            self.vector_storage_client.create_payload_index(
-                collection_name=settings.COLLECTION_NAME,
-                field_name="analysis",
-                field_schema=models.PayloadSchemaType.TEXT,
+    def __init__(self, store: VectorStore, section_weights: Dict[str, float]) -> None:
+        self.store = store
+        self.section_weights = section_weights
+        self._reconciler: Optional[asyncio.Task] = None
+        # Smaller embeddings (e.g. 256) cut vector memory; VECTOR_SIZE must match.
+        self.output_dimensionality = settings.EMBEDDING_OUTPUT_DIMENSIONALITY or None
+
+    async def start(self) -> None:
+        await self.store.start()
+
+    async def close(self) -> None:
+        if self._reconciler is not None:
+            self._reconciler.cancel()
+            await asyncio.gather(self._reconciler, return_exceptions=True)
+            self._reconciler = None
+        await self.store.close()
+
+    async def health(self) -> dict:
+        return await self.store.health()
+
+    @staticmethod
+    def point_id(report_id: str, section: str) -> str:
+        return str(uuid.uuid5(POINT_ID_NAMESPACE, f"{report_id}:{section}"))
+
+    def section_points_input(
+        self, reports: Dict[str, MedicalReportAnalysis]
+    ) -> List[Tuple[str, str, Dict, SparseVector]]:
+        """
+        Returns (point id, text to embed, payload, BM25 vector) for every
+        section of every report. Sections come from vector_data plus an
+        OVERVIEW built from the title, conclusion and summary.
+        """
+        entries = []
+        for report_id, report in reports.items():
+            sections = {
+                OVERVIEW_SECTION: f"{report.title}. {report.conclusion} {report.summary}",
+                **split_vector_sections(report.vector_data),
+            }
+            for section, text in sections.items():
+                indexed_text = f"{report.title} | {section}: {text}"
+                entries.append(
+                    (
+                        self.point_id(report_id, section),
+                        indexed_text,
+                        {
+                            "user_id": report.user_id,
+                            "report_id": report_id,
+                            "section": section,
+                            "title": report.title,
+                        },
+                        SparseVector(
+                            *encode_document(
+                                indexed_text,
+                                k1=settings.BM25_K1,
+                                b=settings.BM25_B,
+                                avg_length=settings.BM25_AVG_DOC_LENGTH,
+                            )
+                        ),
+                    )
+                )
+        return entries
+
+    async def embed_content_for_retrieval(
+        self, report_id: str, report: MedicalReportAnalysis
+    ):
+        await self.embed_reports_for_retrieval({report_id: report})
+
+    async def embed_reports_for_retrieval(
+        self, reports: Dict[str, MedicalReportAnalysis]
+    ):
+        """
+        Indexes reports (keyed by report id) as one point per section and
+        writes them with a single upsert.
+
+        Point ids are derived from report id and section, so re-indexing a
+        report overwrites its points; sections it no longer has are deleted
+        afterwards with one request per user.
+        """
+        points = await self.embed_report_points(reports)
+        if points:
+            await self.store.upsert(points)
+
+        kept_by_user: Dict[str, Dict[str, List[str]]] = {}
+        for point in points:
+            by_report = kept_by_user.setdefault(point.payload["user_id"], {})
+            by_report.setdefault(point.payload["report_id"], []).append(point.id)
+        for user_id, by_report in kept_by_user.items():
+            await self.store.delete_report_points(
+                user_id=user_id,
+                report_ids=by_report.keys(),
+                keep_ids=[point_id for ids in by_report.values() for point_id in ids],
             )
 
-    def embed_content_for_retrieval(self, report: MedicalReportAnalysis, title: str):
-        result = ai_client.models.embed_content(
+    async def embed_report_points(
+        self, reports: Dict[str, MedicalReportAnalysis]
+    ) -> List[VectorPoint]:
+        """
+        Embeds every section of the reports, one batched embed_content
+        request per `embedding_batch_size` texts. The requests run
+        concurrently; the gateway's rate limits and EMBEDDING_MAX_CONCURRENCY
+        bound them.
+        """
+        entries = self.section_points_input(reports)
+        chunks = [
+            entries[start : start + self.embedding_batch_size]
+            for start in range(0, len(entries), self.embedding_batch_size)
+        ]
+        results = await asyncio.gather(*(self._embed_chunk(chunk) for chunk in chunks))
+        return [point for points in results for point in points]
+
+    async def _embed_chunk(
+        self, chunk: List[Tuple[str, str, Dict, SparseVector]]
+    ) -> List[VectorPoint]:
+        result = await llm_gateway.embed_content_async(
             model=settings.GOOGLE_GENAI_EMBEDDING_MODEL,
-            contents=report.vector_data,
+            contents=[text for _, text, _, _ in chunk],
             config=types.EmbedContentConfig(
-                title=title,
                 task_type="RETRIEVAL_DOCUMENT",
+                output_dimensionality=self.output_dimensionality,
             ),
+            priority=Priority.BACKGROUND,
         )
+        if result.embeddings is None or len(result.embeddings) != len(chunk):
+            raise ValueError("Batch embedding returned an unexpected number of vectors")
 
-        if result.embeddings is None:
-            return
+        return [
+            VectorPoint(
+                id=point_id,
+                payload=payload,
+                vector=embedding.values,
+                sparse_vector=sparse_vector,
+            )
+            for (point_id, _, payload, sparse_vector), embedding in zip(
+                chunk, result.embeddings
+            )
+            if embedding.values is not None
+        ]
 
-        if len(result.embeddings) == 0:
-            return
+    async def delete_reports(self, user_id: str, report_ids: List[str]) -> None:
+        await self.store.delete_report_points(user_id=user_id, report_ids=report_ids)
+
+    async def reconcile(self, dry_run: bool = False) -> dict:
+        """
+        Removes orphaned points by diffing the vector store against SQL:
+        points whose report is missing, deleted or failed. Points written
+        before points were keyed by report (no report_id) are migrated, see
+        _adopt_legacy_points. Scrolls through the store in pages of
+        `reconcile_page_size`, then lets the store compact away the deleted
+        points.
+        """
+        stats = {
+            "scanned": 0,
+            "orphaned_reports": 0,
+            "orphaned_points": 0,
+            "legacy_points": 0,
+            "legacy_adopted": 0,
+            "legacy_orphaned": 0,
+            "legacy_kept": 0,
+            "compacted_partitions": 0,
+        }
+        offset = None
+        while True:
+            page, offset = await self.store.scroll(
+                limit=self.reconcile_page_size, offset=offset
+            )
+            stats["scanned"] += len(page)
+
+            legacy = [point for point in page if not point.payload.get("report_id")]
+            referenced: Dict[str, str] = {
+                point.payload["report_id"]: point.payload["user_id"]
+                for point in page
+                if point.payload.get("report_id") and point.payload.get("user_id")
+            }
+            live = await run_in_threadpool(self._live_report_ids, list(referenced))
+            orphans: Dict[str, List[str]] = {}
+            for report_id, user_id in referenced.items():
+                if report_id not in live:
+                    orphans.setdefault(user_id, []).append(report_id)
+                    stats["orphaned_reports"] += 1
+            stats["orphaned_points"] += sum(
+                1
+                for point in page
+                if point.payload.get("report_id") in referenced
+                and point.payload["report_id"] not in live
+            )
+            stats["legacy_points"] += len(legacy)
+            if legacy:
+                # Scrolled payloads may be projected to user_id/report_id;
+                # adopting a legacy point needs the analysis it carries.
+                legacy = await self.store.retrieve([point.id for point in legacy])
+                await self._adopt_legacy_points(legacy, stats, dry_run)
+
+            if not dry_run:
+                for user_id, report_ids in orphans.items():
+                    await self.store.delete_report_points(
+                        user_id=user_id, report_ids=report_ids
+                    )
 
-        vector = result.embeddings[0].values
+            if offset is None:
+                break
 
-        if vector is None:
+        if not dry_run:
+            stats["compacted_partitions"] = await self.store.compact()
+        return stats
+
+    async def _adopt_legacy_points(self, points, stats: dict, dry_run: bool) -> None:
+        """
+        Legacy points hold the whole analysis as their payload, and for
+        reports analysed before REPORTS.ANALYSIS existed that payload is the
+        only copy. Each one is matched to its report by user, title and
+        summary; a completed report gets ANALYSIS backfilled from the payload
+        and is re-indexed as report-keyed points before the legacy point is
+        deleted. Points of deleted or failed reports are dropped. Any other
+        point (unparseable, unmatched, or whose re-index failed) is kept and
+        counted in `legacy_kept`.
+        """
+        for point in points:
+            try:
+                analysis = MedicalReportAnalysis(**point.payload)
+            except ValidationError:
+                stats["legacy_kept"] += 1
+                continue
+            report = await run_in_threadpool(self._legacy_report, analysis)
+            if report is None:
+                stats["legacy_kept"] += 1
+                continue
+            if report.status in (ReportStatus.DELETED, ReportStatus.FAILED):
+                stats["legacy_orphaned"] += 1
+                if not dry_run:
+                    await self.store.delete_points([point.id])
+                continue
+            if report.status != ReportStatus.COMPLETED:
+                stats["legacy_kept"] += 1
+                continue
+
+            stats["legacy_adopted"] += 1
+            if dry_run:
+                continue
+            try:
+                if report.analysis is None:
+                    await run_in_threadpool(
+                        self._backfill_analysis, report.id, analysis.model_dump_json()
+                    )
+                else:
+                    analysis = MedicalReportAnalysis.model_validate_json(report.analysis)
+                analysis.user_id = report.user_id
+                await self.embed_reports_for_retrieval({report.id: analysis})
+                await self.store.delete_points([point.id])
+            except Exception as e:
+                stats["legacy_adopted"] -= 1
+                stats["legacy_kept"] += 1
+                logger.error(
+                    f"Could not migrate legacy vector point {point.id}: {e}",
+                    exc_info=True,
+                )
+
+    @staticmethod
+    def _legacy_report(analysis: MedicalReportAnalysis):
+        if not analysis.user_id:
+            return None
+        db = WorkerSessionLocal()
+        try:
+            reports = ReportRepository.get_reports_by_content(
+                db,
+                user_id=analysis.user_id,
+                title=analysis.title,
+                description=analysis.summary,
+            )
+            # Several reports can share a title and summary; a completed one
+            # is the copy worth keeping.
+            completed = [
+                report for report in reports if report.status == ReportStatus.COMPLETED
+            ]
+            return (completed or reports or [None])[0]
+        finally:
+            db.close()
+
+    @staticmethod
+    def _backfill_analysis(report_id: str, analysis: str) -> None:
+        db = WorkerSessionLocal()
+        try:
+            ReportRepository.set_report_analysis(db, report_id=report_id, analysis=analysis)
+        finally:
+            db.close()
+
+    @staticmethod
+    def _live_report_ids(report_ids: List[str]) -> set:
+        if not report_ids:
+            return set()
+        db = WorkerSessionLocal()
+        try:
+            return set(ReportRepository.get_live_report_ids(db, report_ids))
+        finally:
+            db.close()
+
+    def start_reconciliation(self, interval_seconds: float) -> None:
+        if interval_seconds <= 0 or self._reconciler is not None:
             return
+        self._reconciler = asyncio.create_task(self._reconcile_periodically(interval_seconds))
+
+    async def _reconcile_periodically(self, interval_seconds: float) -> None:
+        while True:
+            await asyncio.sleep(interval_seconds)
+            try:
+                stats = await self.reconcile()
+                logger.info(f"Vector store reconciliation: {stats}")
+            except Exception as e:
+                logger.error(f"Vector store reconciliation failed: {e}", exc_info=True)
 
-        point = PointStruct(
-            id=str(uuid.uuid4()),
-            payload=report.model_dump(),
-            vector=vector,
+    async def embed_query(self, query: str) -> Optional[List[float]]:
+        model = settings.GOOGLE_GENAI_EMBEDDING_MODEL
+        task_type = "RETRIEVAL_QUERY"
+        cache_model = (
+            f"{model}@{self.output_dimensionality}" if self.output_dimensionality else model
         )
 
-        self.vector_storage_client.upsert(
-            collection_name=settings.COLLECTION_NAME, points=[point]
+        cached_vector = await query_embedding_cache.get(query, cache_model, task_type)
+        if cached_vector is not None:
+            return cached_vector
+
+        try:
+            embed_result = await llm_gateway.embed_content_async(
+                model=model,
+                contents=query,
+                config=types.EmbedContentConfig(
+                    task_type=task_type,
+                    output_dimensionality=self.output_dimensionality,
+                ),
+                priority=Priority.INTERACTIVE,
+            )
+        except Exception as e:
+            logger.exception(f"Error embedding query: {e}")
+            return None
+
+        if not embed_result.embeddings or not embed_result.embeddings[0].values:
+            logger.warning("Query embedding result was empty.")
+            return None
+
+        query_vector = embed_result.embeddings[0].values
+        await query_embedding_cache.set(query, cache_model, task_type, query_vector)
+        return query_vector
+
+    def group_score(self, group: PointGroup) -> float:
+        return max(
+            hit.score * self.section_weights.get(hit.payload.get("section", ""), 1.0)
+            for hit in group.hits
         )
 
     async def search_reports(
-        self, user_id: str, query: str, limit: int = 5
+        self,
+        user_id: str,
+        query: str,
+        limit: int = 5,
+        sections: Optional[List[str]] = None,
     ) -> List[MedicalReportAnalysis]:
-
-        # Are my kidneys normal?
-
         """
         Searches for relevant medical reports for a specific user based on a query.
 
+        The full analyses of the matching reports are loaded from the
+        database, which also drops reports deleted since they were indexed.
+
         Args:
             user_id: The ID of the user whose reports to search.
             query: The user's natural language query (e.g., "my blood test results").
             limit: The maximum number of reports to retrieve.
+            sections: Only match these sections (e.g. ["BAD_FINDINGS"]).
 
         Returns:
             A list of MedicalReportAnalysis objects.
         """
+        report_ids = await self.search_report_ids(
+            user_id=user_id, query=query, limit=limit, sections=sections
+        )
+        return await self._load_reports(user_id, report_ids)
+
+    async def search_report_ids(
+        self,
+        user_id: str,
+        query: str,
+        limit: int = 5,
+        sections: Optional[List[str]] = None,
+        hybrid: Optional[bool] = None,
+    ) -> List[str]:
+        """
+        Ranks the user's reports for a query. Section points are grouped by
+        report; a report scores its best section hit, multiplied by that
+        section's VECTOR_SECTION_WEIGHTS entry.
+
+        With hybrid retrieval (VECTOR_HYBRID_ENABLED, or `hybrid`), dense and
+        BM25 candidates are fused with reciprocal-rank fusion before grouping,
+        so exact lab codes and drug names match even when the embedding
+        doesn't rank them highly.
+        """
         if not query:
             return []
+        if hybrid is None:
+            hybrid = settings.VECTOR_HYBRID_ENABLED
 
-        try:
-            embed_result = ai_client.models.embed_content(
-                model=settings.GOOGLE_GENAI_EMBEDDING_MODEL,
-                contents=query,
-                config=types.EmbedContentConfig(
-                    task_type="RETRIEVAL_DOCUMENT",
-                ),
-            )
-        except Exception as e:
-            print(f"Error embedding query: {e}")
+        query_vector = await self.embed_query(query)
+        if query_vector is None:
             return []
 
-        if not embed_result.embeddings or not embed_result.embeddings[0].values:
-            print("Warning: Query embedding result was empty.")
+        filters = {"section": sections} if sections else None
+        group_limit = limit * 2 if self.section_weights else limit
+        try:
+            if hybrid:
+                points = await self.store.hybrid_search(
+                    vector=query_vector,
+                    sparse_vector=SparseVector(*encode_query(query)),
+                    user_id=user_id,
+                    limit=settings.VECTOR_HYBRID_PREFETCH_LIMIT,
+                    prefetch_limit=settings.VECTOR_HYBRID_PREFETCH_LIMIT,
+                    weights=(
+                        settings.VECTOR_HYBRID_DENSE_WEIGHT,
+                        settings.VECTOR_HYBRID_SPARSE_WEIGHT,
+                    ),
+                    rrf_k=settings.VECTOR_HYBRID_RRF_K,
+                    score_threshold=0.5,
+                    filters=filters,
+                )
+                groups = group_points(
+                    points,
+                    group_by="report_id",
+                    limit=group_limit,
+                    group_size=settings.VECTOR_SECTION_GROUP_SIZE,
+                )
+            else:
+                groups = await self.store.search_groups(
+                    vector=query_vector,
+                    user_id=user_id,
+                    group_by="report_id",
+                    limit=group_limit,
+                    group_size=settings.VECTOR_SECTION_GROUP_SIZE,
+                    score_threshold=0.5,
+                    filters=filters,
+                )
+        except Exception as e:
+            logger.exception(f"Error searching vector store: {e}")
             return []
 
-        query_vector = embed_result.embeddings[0].values
+        ranked = sorted(
+            (group for group in groups if group.hits), key=self.group_score, reverse=True
+        )
+        return [group.id for group in ranked[:limit]]
 
-        try:
-            search_result = self.vector_storage_client.search(
-                collection_name=settings.COLLECTION_NAME,
-                query_vector=query_vector,
-                query_filter=models.Filter(
-                    must=[
-                        models.FieldCondition(
-                            key="user_id",
-                            match=models.MatchValue(value=user_id),
-                        )
-                    ]
-                ),
-                limit=limit,
-                with_payload=True,
-                score_threshold=0.5,
-            )
-        except Exception as e:
-            print(f"Error searching Qdrant: {e}")
+    @staticmethod
+    async def _load_reports(
+        user_id: str, report_ids: List[str]
+    ) -> List[MedicalReportAnalysis]:
+        if not report_ids:
             return []
+        async with AsyncSessionLocal() as db:
+            rows = await ReportRepository.get_analysed_reports_by_ids_async(
+                db, report_ids=report_ids, user_id=user_id
+            )
 
+        analyses = {row.id: row.analysis for row in rows}
         retrieved_reports = []
-        for scored_point in search_result:
-            if scored_point.payload:
-                try:
-                    report = MedicalReportAnalysis(**scored_point.payload)
-                    retrieved_reports.append(report)
-                except Exception as e:
-                    print(f"Error parsing retrieved report payload: {e}")
-
+        for report_id in report_ids:
+            if report_id not in analyses:
+                continue
+            try:
+                retrieved_reports.append(
+                    MedicalReportAnalysis.model_validate_json(analyses[report_id])
+                )
+            except Exception as e:
+                logger.warning(
+                    f"Error parsing stored analysis of report {report_id}: {e}"
+                )
         return retrieved_reports
 
 
-vector_storage_service = VectorStorageService()
+def create_vector_store() -> VectorStore:
+    if settings.VECTOR_STORE_BACKEND == "embedded":
+        from .embedded_vector_store import EmbeddedVectorStore
+
+        return EmbeddedVectorStore(
+            directory=settings.VECTOR_STORE_EMBEDDED_DIR,
+            dimension=settings.VECTOR_SIZE,
+        )
+    if settings.VECTOR_STORE_BACKEND == "qdrant":
+        from .collection_profiles import get_collection_profile
+        from .qdrant_vector_store import QdrantVectorStore
+
+        return QdrantVectorStore(
+            collection_name=settings.COLLECTION_NAME,
+            profile=get_collection_profile(settings.VECTOR_COLLECTION_PROFILE),
+        )
+    raise ValueError(f"Unknown VECTOR_STORE_BACKEND: {settings.VECTOR_STORE_BACKEND}")
+
+
+vector_storage_service = VectorStorageService(
+    store=create_vector_store(),
+    section_weights=parse_section_weights(settings.VECTOR_SECTION_WEIGHTS),
+)
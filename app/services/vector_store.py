@@ -0,0 +1,193 @@
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+
+@dataclass
+class SparseVector:
+    indices: List[int]
+    values: List[float]
+
+
+@dataclass
+class VectorPoint:
+    id: str
+    vector: List[float]
+    payload: Dict[str, Any] = field(default_factory=dict)
+    sparse_vector: Optional[SparseVector] = None
+
+
+@dataclass
+class ScoredVectorPoint:
+    id: str
+    score: float
+    payload: Dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass
+class StoredPoint:
+    id: str
+    payload: Dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass
+class PointGroup:
+    id: str
+    hits: List[ScoredVectorPoint] = field(default_factory=list)
+
+
+def reciprocal_rank_fusion(
+    rankings: Sequence[List[ScoredVectorPoint]],
+    weights: Sequence[float],
+    k: int,
+    limit: int,
+) -> List[ScoredVectorPoint]:
+    """
+    Weighted RRF: a point scores sum(weight / (k + rank)) over the rankings
+    it appears in (rank starting at 1).
+    """
+    fused: Dict[str, ScoredVectorPoint] = {}
+    for ranking, weight in zip(rankings, weights):
+        for rank, point in enumerate(ranking, start=1):
+            score = weight / (k + rank)
+            if point.id in fused:
+                fused[point.id].score += score
+            else:
+                fused[point.id] = ScoredVectorPoint(
+                    id=point.id, score=score, payload=point.payload
+                )
+    return sorted(fused.values(), key=lambda point: point.score, reverse=True)[:limit]
+
+
+def group_points(
+    points: List[ScoredVectorPoint], group_by: str, limit: int, group_size: int
+) -> List[PointGroup]:
+    """
+    Groups ranked points by a payload field, keeping the first `limit`
+    groups in rank order and at most `group_size` hits per group.
+    """
+    groups: Dict[str, PointGroup] = {}
+    for point in points:
+        group_id = point.payload.get(group_by)
+        if group_id is None:
+            continue
+        group = groups.get(str(group_id))
+        if group is None:
+            if len(groups) == limit:
+                continue
+            group = groups[str(group_id)] = PointGroup(id=str(group_id))
+        if len(group.hits) < group_size:
+            group.hits.append(point)
+    return list(groups.values())
+
+
+class VectorStore:
+    """
+    Storage backend behind VectorStorageService. Points are always scoped by
+    the `user_id` in their payload; `filters` are exact-match conditions on
+    other payload fields, where a list value matches any of its items.
+    """
+
+    name = "base"
+
+    async def start(self) -> None:
+        """
+        Prepares the backend during application startup. Must not raise when
+        the backend is temporarily unavailable.
+        """
+
+    async def close(self) -> None:
+        pass
+
+    async def bootstrap(self) -> None:
+        pass
+
+    async def health(self) -> dict:
+        raise NotImplementedError
+
+    async def upsert(self, points: List[VectorPoint]) -> None:
+        raise NotImplementedError
+
+    async def search(
+        self,
+        vector: List[float],
+        user_id: str,
+        limit: int,
+        score_threshold: Optional[float] = None,
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> List[ScoredVectorPoint]:
+        raise NotImplementedError
+
+    async def search_groups(
+        self,
+        vector: List[float],
+        user_id: str,
+        group_by: str,
+        limit: int,
+        group_size: int,
+        score_threshold: Optional[float] = None,
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> List[PointGroup]:
+        """
+        Returns up to `limit` groups of points sharing the same `group_by`
+        payload value, best group first, each with its `group_size` best hits.
+        """
+        raise NotImplementedError
+
+    async def hybrid_search(
+        self,
+        vector: List[float],
+        sparse_vector: SparseVector,
+        user_id: str,
+        limit: int,
+        prefetch_limit: int,
+        weights: Sequence[float] = (1.0, 1.0),
+        rrf_k: int = 60,
+        score_threshold: Optional[float] = None,
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> List[ScoredVectorPoint]:
+        """
+        Dense and sparse (BM25) candidates, `prefetch_limit` of each, fused
+        with reciprocal-rank fusion weighted (dense, sparse) by `weights`.
+        `score_threshold` applies to the dense candidates only.
+        """
+        raise NotImplementedError
+
+    async def delete_report_points(
+        self,
+        user_id: str,
+        report_ids: Iterable[str],
+        keep_ids: Iterable[str] = (),
+    ) -> None:
+        """
+        Deletes every point of the given reports except `keep_ids`, in one
+        request.
+        """
+        raise NotImplementedError
+
+    async def delete_points(self, point_ids: Iterable[str]) -> None:
+        raise NotImplementedError
+
+    async def scroll(
+        self, limit: int, offset: Optional[str] = None
+    ) -> Tuple[List[StoredPoint], Optional[str]]:
+        """
+        Pages through all points (payloads only). Returns the page and the
+        offset of the next one, or None after the last page. Backends may
+        return only the `user_id` and `report_id` payload fields; use
+        `retrieve` for full payloads.
+        """
+        raise NotImplementedError
+
+    async def retrieve(self, point_ids: Iterable[str]) -> List[StoredPoint]:
+        """
+        The given points with their full payloads; unknown ids are skipped.
+        """
+        raise NotImplementedError
+
+    async def compact(self) -> int:
+        """
+        Reclaims space left by deleted and overwritten points, where the
+        backend doesn't do that itself. Returns how many partitions were
+        rewritten.
+        """
+        return 0
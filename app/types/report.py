@@ -3,7 +3,12 @@ from typing import Optional
 from pydantic import BaseModel, Field
 
 
-class MedicalReportAnalysis(BaseModel):
+class MedicalReportAnalysisOutput(BaseModel):
+    """
+    The fields the model generates; used as the response schema for
+    structured output.
+    """
+
     title: str = Field(..., description="A concise title for the medical report.")
     summary: str = Field(
         ...,
@@ -26,5 +31,8 @@ class MedicalReportAnalysis(BaseModel):
         description="Vector data representation of the medical report, used for similarity search and retrieval.",
     )
     conclusion: str = Field(..., description="Shows a one line conclusion")
+
+
+class MedicalReportAnalysis(MedicalReportAnalysisOutput):
     report_date: datetime.datetime = datetime.datetime.now()
     user_id: Optional[str] = None
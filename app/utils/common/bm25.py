@@ -0,0 +1,52 @@
+import re
+import zlib
+from collections import Counter
+from typing import List, Tuple
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+(?:[.-][a-z0-9]+)*")
+
+STOPWORDS = frozenset(
+    "a an and are as at be by for from has have in is it its of on or that the "
+    "this to was were will with".split()
+)
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    Lowercased word tokens. Dots and hyphens inside a token are kept so lab
+    codes and values ("hba1c", "vitamin-d", "7.2") stay whole.
+    """
+    return [
+        token
+        for token in TOKEN_PATTERN.findall(text.lower())
+        if token not in STOPWORDS and (len(token) > 1 or token.isdigit())
+    ]
+
+
+def token_id(token: str) -> int:
+    return zlib.crc32(token.encode("utf-8")) & 0x7FFFFFFF
+
+
+def encode_document(
+    text: str, k1: float, b: float, avg_length: float
+) -> Tuple[List[int], List[float]]:
+    """
+    BM25 term-frequency weights for a document as a sparse vector. IDF is
+    left to the index (Qdrant's IDF modifier or the embedded store), since
+    it depends on the whole collection.
+    """
+    tokens = tokenize(text)
+    if not tokens:
+        return [], []
+    length_norm = k1 * (1 - b + b * len(tokens) / avg_length)
+    weights = {}
+    for token, frequency in Counter(tokens).items():
+        index = token_id(token)
+        weight = frequency * (k1 + 1) / (frequency + length_norm)
+        weights[index] = weights.get(index, 0.0) + weight
+    return list(weights.keys()), list(weights.values())
+
+
+def encode_query(text: str) -> Tuple[List[int], List[float]]:
+    indices = sorted({token_id(token) for token in tokenize(text)})
+    return indices, [1.0] * len(indices)
@@ -0,0 +1,34 @@
+from typing import Optional
+
+
+def extract_json_object(text: str) -> Optional[str]:
+    """
+    Returns the first balanced top-level JSON object in `text`, ignoring
+    surrounding prose or markdown fences and braces inside string literals.
+    Single pass; returns None if no complete object is found.
+    """
+    start = text.find("{")
+    if start == -1:
+        return None
+
+    depth = 0
+    in_string = False
+    escaped = False
+    for index in range(start, len(text)):
+        char = text[index]
+        if in_string:
+            if escaped:
+                escaped = False
+            elif char == "\\":
+                escaped = True
+            elif char == '"':
+                in_string = False
+        elif char == '"':
+            in_string = True
+        elif char == "{":
+            depth += 1
+        elif char == "}":
+            depth -= 1
+            if depth == 0:
+                return text[start : index + 1]
+    return None
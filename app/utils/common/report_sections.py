@@ -0,0 +1,39 @@
+import re
+from typing import Dict
+
+SECTION_PATTERN = re.compile(r"^\s*([A-Z][A-Z_]+)\s*:\s*(.*)$", re.DOTALL)
+
+GENERAL_SECTION = "GENERAL"
+
+
+def split_vector_sections(vector_data: str) -> Dict[str, str]:
+    """
+    Splits the pipe-delimited vector_data field ("MEDICAL_FINDINGS: ... |
+    BAD_FINDINGS: ...") into {section: text}. Repeated sections (from
+    multi-page reports) are joined; text without a section label goes to
+    GENERAL.
+    """
+    sections: Dict[str, str] = {}
+    for part in vector_data.split("|"):
+        match = SECTION_PATTERN.match(part)
+        if match:
+            name, text = match.group(1), match.group(2).strip()
+        else:
+            name, text = GENERAL_SECTION, part.strip()
+        if not text:
+            continue
+        sections[name] = f"{sections[name]} {text}" if name in sections else text
+    return sections
+
+
+def parse_section_weights(value: str) -> Dict[str, float]:
+    """
+    Parses "BAD_FINDINGS=1.2,LIKELY_CONDITIONS=1.1" into per-section score
+    multipliers.
+    """
+    weights = {}
+    for item in value.split(","):
+        if "=" in item:
+            section, weight = item.split("=", 1)
+            weights[section.strip().upper()] = float(weight)
+    return weights
@@ -0,0 +1,14 @@
+import json
+from typing import Any, Optional
+
+
+def format_sse(event: str, data: Any, event_id: Optional[str] = None) -> str:
+    """
+    Serializes one Server-Sent Events frame with a JSON payload.
+    """
+    lines = []
+    if event_id is not None:
+        lines.append(f"id: {event_id}")
+    lines.append(f"event: {event}")
+    lines.append(f"data: {json.dumps(data, default=str)}")
+    return "\n".join(lines) + "\n\n"
@@ -0,0 +1,6 @@
+def estimate_tokens(text: str) -> int:
+    """
+    Cheap token estimate (~4 characters per token for English text). Good
+    enough for budgeting prompts without a round trip to count_tokens.
+    """
+    return (len(text) + 3) // 4
@@ -0,0 +1,55 @@
+import os
+from alembic import command, op
+from alembic.config import Config
+from sqlalchemy import create_engine, inspect
+
+MIGRATIONS_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+    "migrations",
+)
+
+# Schema of the first deployments, before any table or column was added.
+BASELINE_REVISION = "0001"
+
+
+def alembic_config(database_url: str) -> Config:
+    config = Config()
+    config.set_main_option("script_location", MIGRATIONS_DIR)
+    config.attributes["database_url"] = database_url
+    config.attributes["configure_logger"] = False
+    return config
+
+
+def upgrade_database(database_url: str) -> None:
+    """
+    Migrates the database to the latest revision. A database created by
+    create_all (tables but no alembic_version) is stamped at the baseline
+    first, so only the later revisions run against it; those add the tables
+    and columns it is missing.
+    """
+    config = alembic_config(database_url)
+    engine = create_engine(database_url)
+    try:
+        tables = set(inspect(engine).get_table_names())
+    finally:
+        engine.dispose()
+    if "alembic_version" not in tables and "REPORTS" in tables:
+        command.stamp(config, BASELINE_REVISION)
+    command.upgrade(config, "head")
+
+
+# Tables and columns added before migrations existed were created by
+# create_all on some deployments but not others, so the revisions that add
+# them skip whatever is already there.
+def has_table(table: str) -> bool:
+    return inspect(op.get_bind()).has_table(table)
+
+
+def has_column(table: str, column: str) -> bool:
+    columns = inspect(op.get_bind()).get_columns(table)
+    return any(existing["name"] == column for existing in columns)
+
+
+def has_index(table: str, index: str) -> bool:
+    indexes = inspect(op.get_bind()).get_indexes(table)
+    return any(existing["name"] == index for existing in indexes)
@@ -0,0 +1,74 @@
+import base64
+import binascii
+from dataclasses import dataclass
+from typing import Callable, Generic, List, Optional, Sequence, TypeVar
+from sqlalchemy import and_, or_, select
+
+T = TypeVar("T")
+
+
+class InvalidCursorError(ValueError):
+    pass
+
+
+@dataclass
+class Page(Generic[T]):
+    items: List[T]
+    next_cursor: Optional[str]
+
+
+def encode_cursor(row_id: str) -> str:
+    return base64.urlsafe_b64encode(row_id.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> str:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        return base64.urlsafe_b64decode(padded.encode("ascii")).decode("utf-8")
+    except (binascii.Error, UnicodeError):
+        raise InvalidCursorError(f"Invalid cursor {cursor!r}") from None
+
+
+def keyset_order(model):
+    """
+    Newest first; the id breaks ties between rows created in the same
+    second, so the order is total and stable across pages.
+    """
+    return (model.created_at.desc(), model.id.desc())
+
+
+def keyset_after(model, cursor: str):
+    """
+    Rows after the cursor row in keyset_order. The cursor names the last
+    row of the previous page, and its created_at is read back from the
+    table, so the comparison uses the stored value as-is rather than a
+    re-serialized timestamp.
+    """
+    row_id = decode_cursor(cursor)
+    anchor = select(model.created_at).where(model.id == row_id).scalar_subquery()
+    return or_(
+        model.created_at < anchor,
+        and_(model.created_at == anchor, model.id < row_id),
+    )
+
+
+async def ensure_cursor_row_async(db, model, cursor: str, *scope) -> None:
+    """
+    keyset_after compares against the cursor row's created_at, so a cursor
+    naming a row that is gone (or never existed, or sits outside `scope`)
+    would silently match nothing and end the list early. Reject it instead.
+    """
+    row_id = decode_cursor(cursor)
+    found = await db.scalar(select(model.id).where(model.id == row_id, *scope))
+    if found is None:
+        raise InvalidCursorError(f"Invalid cursor {cursor!r}")
+
+
+def build_page(rows: Sequence, limit: int, to_item: Callable) -> Page:
+    """
+    Builds a page from up to `limit + 1` rows; the extra row only signals
+    that another page follows.
+    """
+    items = [to_item(row) for row in rows[:limit]]
+    next_cursor = encode_cursor(rows[limit - 1].id) if len(rows) > limit else None
+    return Page(items=items, next_cursor=next_cursor)
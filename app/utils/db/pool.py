@@ -0,0 +1,78 @@
+import time
+from collections import deque
+from typing import TYPE_CHECKING, Deque
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+# The mixin is only ever combined with QueuePool subclasses; let type
+# checkers see their methods without changing the runtime MRO.
+_PoolBase = QueuePool if TYPE_CHECKING else object
+
+
+class InstrumentedPoolMixin(_PoolBase):
+    """
+    Records how long checkouts wait for a connection (including opening a
+    new one), checkout timeouts and connections opened, on top of the
+    pool's own size/checked-out/overflow counters.
+    """
+
+    latency_window = 1000
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.checkouts = 0
+        self.timeouts = 0
+        self.connections_opened = 0
+        self.checkout_wait_seconds: Deque[float] = deque(maxlen=self.latency_window)
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except PoolTimeoutError:
+            self.timeouts += 1
+            raise
+        self.checkouts += 1
+        self.checkout_wait_seconds.append(time.perf_counter() - started)
+        return connection
+
+    def _create_connection(self):
+        self.connections_opened += 1
+        return super()._create_connection()
+
+    def stats(self) -> dict:
+        samples = sorted(self.checkout_wait_seconds)
+        wait = {"count": 0, "avg": None, "p95": None, "max": None}
+        if samples:
+            p95_index = min(len(samples) - 1, int(len(samples) * 0.95))
+            wait = {
+                "count": len(samples),
+                "avg": round(sum(samples) / len(samples), 4),
+                "p95": round(samples[p95_index], 4),
+                "max": round(samples[-1], 4),
+            }
+        return {
+            "size": self.size(),
+            "checked_out": self.checkedout(),
+            "checked_in": self.checkedin(),
+            "overflow": self.overflow(),
+            "checkouts": self.checkouts,
+            "timeouts": self.timeouts,
+            "connections_opened": self.connections_opened,
+            "checkout_wait_seconds": wait,
+        }
+
+
+class InstrumentedQueuePool(InstrumentedPoolMixin, QueuePool):
+    pass
+
+
+class InstrumentedAsyncQueuePool(InstrumentedPoolMixin, AsyncAdaptedQueuePool):
+    pass
+
+
+def pool_stats(engine) -> dict:
+    pool = engine.pool
+    if isinstance(pool, InstrumentedPoolMixin):
+        return pool.stats()
+    return {"status": pool.status()}
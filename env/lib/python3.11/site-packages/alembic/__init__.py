@@ -0,0 +1,4 @@
+from . import context
+from . import op
+
+__version__ = "1.16.2"
@@ -0,0 +1 @@
+from .runtime.environment import *  # noqa
@@ -0,0 +1 @@
+from .runtime.migration import *  # noqa
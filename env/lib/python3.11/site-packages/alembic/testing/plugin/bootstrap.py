@@ -0,0 +1,4 @@
+"""
+Bootstrapper for test framework plugins.
+
+"""
@@ -0,0 +1,12 @@
+# Copyright (C) 2016-present the asyncpg authors and contributors
+# <see AUTHORS file>
+#
+# This module is part of asyncpg and is released under
+# the Apache 2.0 License: http://www.apache.org/licenses/LICENSE-2.0
+
+# flake8: NOQA
+
+from __future__ import annotations
+
+from .protocol import Protocol, NO_TIMEOUT, BUILTIN_TYPE_NAME_MAP
+from .record import Record
@@ -0,0 +1 @@
+from starlette.middleware import Middleware as Middleware
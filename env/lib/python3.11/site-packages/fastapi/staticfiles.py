@@ -0,0 +1 @@
+from starlette.staticfiles import StaticFiles as StaticFiles  # noqa
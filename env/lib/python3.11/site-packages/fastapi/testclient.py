@@ -0,0 +1 @@
+from starlette.testclient import TestClient as TestClient  # noqa
@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+from .citation import CitationMetadata, CitationSource
+from .content import Blob, Content, Part
+from .generative_service import (
+    BatchEmbedContentsRequest,
+    BatchEmbedContentsResponse,
+    Candidate,
+    ContentEmbedding,
+    CountTokensRequest,
+    CountTokensResponse,
+    EmbedContentRequest,
+    EmbedContentResponse,
+    GenerateContentRequest,
+    GenerateContentResponse,
+    GenerationConfig,
+    GroundingChunk,
+    GroundingMetadata,
+    GroundingSupport,
+    LogprobsResult,
+    RetrievalMetadata,
+    SearchEntryPoint,
+    Segment,
+    TaskType,
+)
+from .model import Model
+from .model_service import GetModelRequest, ListModelsRequest, ListModelsResponse
+from .safety import HarmCategory, SafetyRating, SafetySetting
+
+__all__ = (
+    "CitationMetadata",
+    "CitationSource",
+    "Blob",
+    "Content",
+    "Part",
+    "BatchEmbedContentsRequest",
+    "BatchEmbedContentsResponse",
+    "Candidate",
+    "ContentEmbedding",
+    "CountTokensRequest",
+    "CountTokensResponse",
+    "EmbedContentRequest",
+    "EmbedContentResponse",
+    "GenerateContentRequest",
+    "GenerateContentResponse",
+    "GenerationConfig",
+    "GroundingChunk",
+    "GroundingMetadata",
+    "GroundingSupport",
+    "LogprobsResult",
+    "RetrievalMetadata",
+    "SearchEntryPoint",
+    "Segment",
+    "TaskType",
+    "Model",
+    "GetModelRequest",
+    "ListModelsRequest",
+    "ListModelsResponse",
+    "SafetyRating",
+    "SafetySetting",
+    "HarmCategory",
+)
@@ -0,0 +1,509 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Iterator,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+from google.api_core import gapic_v1
+from google.api_core import retry as retries
+from google.api_core import retry_async as retries_async
+
+try:
+    OptionalRetry = Union[retries.Retry, gapic_v1.method._MethodDefault, None]
+    OptionalAsyncRetry = Union[
+        retries_async.AsyncRetry, gapic_v1.method._MethodDefault, None
+    ]
+except AttributeError:  # pragma: NO COVER
+    OptionalRetry = Union[retries.Retry, object, None]  # type: ignore
+    OptionalAsyncRetry = Union[retries_async.AsyncRetry, object, None]  # type: ignore
+
+from google.ai.generativelanguage_v1alpha.types import retriever, retriever_service
+
+
+class ListCorporaPager:
+    """A pager for iterating through ``list_corpora`` requests.
+
+    This class thinly wraps an initial
+    :class:`google.ai.generativelanguage_v1alpha.types.ListCorporaResponse` object, and
+    provides an ``__iter__`` method to iterate through its
+    ``corpora`` field.
+
+    If there are more pages, the ``__iter__`` method will make additional
+    ``ListCorpora`` requests and continue to iterate
+    through the ``corpora`` field on the
+    corresponding responses.
+
+    All the usual :class:`google.ai.generativelanguage_v1alpha.types.ListCorporaResponse`
+    attributes are available on the pager. If multiple requests are made, only
+    the most recent response is retained, and thus used for attribute lookup.
+    """
+
+    def __init__(
+        self,
+        method: Callable[..., retriever_service.ListCorporaResponse],
+        request: retriever_service.ListCorporaRequest,
+        response: retriever_service.ListCorporaResponse,
+        *,
+        retry: OptionalRetry = gapic_v1.method.DEFAULT,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
+        metadata: Sequence[Tuple[str, Union[str, bytes]]] = ()
+    ):
+        """Instantiate the pager.
+
+        Args:
+            method (Callable): The method that was originally called, and
+                which instantiated this pager.
+            request (google.ai.generativelanguage_v1alpha.types.ListCorporaRequest):
+                The initial request object.
+            response (google.ai.generativelanguage_v1alpha.types.ListCorporaResponse):
+                The initial response object.
+            retry (google.api_core.retry.Retry): Designation of what errors,
+                if any, should be retried.
+            timeout (float): The timeout for this request.
+            metadata (Sequence[Tuple[str, Union[str, bytes]]]): Key/value pairs which should be
+                sent along with the request as metadata. Normally, each value must be of type `str`,
+                but for metadata keys ending with the suffix `-bin`, the corresponding values must
+                be of type `bytes`.
+        """
+        self._method = method
+        self._request = retriever_service.ListCorporaRequest(request)
+        self._response = response
+        self._retry = retry
+        self._timeout = timeout
+        self._metadata = metadata
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._response, name)
+
+    @property
+    def pages(self) -> Iterator[retriever_service.ListCorporaResponse]:
+        yield self._response
+        while self._response.next_page_token:
+            self._request.page_token = self._response.next_page_token
+            self._response = self._method(
+                self._request,
+                retry=self._retry,
+                timeout=self._timeout,
+                metadata=self._metadata,
+            )
+            yield self._response
+
+    def __iter__(self) -> Iterator[retriever.Corpus]:
+        for page in self.pages:
+            yield from page.corpora
+
+    def __repr__(self) -> str:
+        return "{0}<{1!r}>".format(self.__class__.__name__, self._response)
+
+
+class ListCorporaAsyncPager:
+    """A pager for iterating through ``list_corpora`` requests.
+
+    This class thinly wraps an initial
+    :class:`google.ai.generativelanguage_v1alpha.types.ListCorporaResponse` object, and
+    provides an ``__aiter__`` method to iterate through its
+    ``corpora`` field.
+
+    If there are more pages, the ``__aiter__`` method will make additional
+    ``ListCorpora`` requests and continue to iterate
+    through the ``corpora`` field on the
+    corresponding responses.
+
+    All the usual :class:`google.ai.generativelanguage_v1alpha.types.ListCorporaResponse`
+    attributes are available on the pager. If multiple requests are made, only
+    the most recent response is retained, and thus used for attribute lookup.
+    """
+
+    def __init__(
+        self,
+        method: Callable[..., Awaitable[retriever_service.ListCorporaResponse]],
+        request: retriever_service.ListCorporaRequest,
+        response: retriever_service.ListCorporaResponse,
+        *,
+        retry: OptionalAsyncRetry = gapic_v1.method.DEFAULT,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
+        metadata: Sequence[Tuple[str, Union[str, bytes]]] = ()
+    ):
+        """Instantiates the pager.
+
+        Args:
+            method (Callable): The method that was originally called, and
+                which instantiated this pager.
+            request (google.ai.generativelanguage_v1alpha.types.ListCorporaRequest):
+                The initial request object.
+            response (google.ai.generativelanguage_v1alpha.types.ListCorporaResponse):
+                The initial response object.
+            retry (google.api_core.retry.AsyncRetry): Designation of what errors,
+                if any, should be retried.
+            timeout (float): The timeout for this request.
+            metadata (Sequence[Tuple[str, Union[str, bytes]]]): Key/value pairs which should be
+                sent along with the request as metadata. Normally, each value must be of type `str`,
+                but for metadata keys ending with the suffix `-bin`, the corresponding values must
+                be of type `bytes`.
+        """
+        self._method = method
+        self._request = retriever_service.ListCorporaRequest(request)
+        self._response = response
+        self._retry = retry
+        self._timeout = timeout
+        self._metadata = metadata
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._response, name)
+
+    @property
+    async def pages(self) -> AsyncIterator[retriever_service.ListCorporaResponse]:
+        yield self._response
+        while self._response.next_page_token:
+            self._request.page_token = self._response.next_page_token
+            self._response = await self._method(
+                self._request,
+                retry=self._retry,
+                timeout=self._timeout,
+                metadata=self._metadata,
+            )
+            yield self._response
+
+    def __aiter__(self) -> AsyncIterator[retriever.Corpus]:
+        async def async_generator():
+            async for page in self.pages:
+                for response in page.corpora:
+                    yield response
+
+        return async_generator()
+
+    def __repr__(self) -> str:
+        return "{0}<{1!r}>".format(self.__class__.__name__, self._response)
+
+
+class ListDocumentsPager:
+    """A pager for iterating through ``list_documents`` requests.
+
+    This class thinly wraps an initial
+    :class:`google.ai.generativelanguage_v1alpha.types.ListDocumentsResponse` object, and
+    provides an ``__iter__`` method to iterate through its
+    ``documents`` field.
+
+    If there are more pages, the ``__iter__`` method will make additional
+    ``ListDocuments`` requests and continue to iterate
+    through the ``documents`` field on the
+    corresponding responses.
+
+    All the usual :class:`google.ai.generativelanguage_v1alpha.types.ListDocumentsResponse`
+    attributes are available on the pager. If multiple requests are made, only
+    the most recent response is retained, and thus used for attribute lookup.
+    """
+
+    def __init__(
+        self,
+        method: Callable[..., retriever_service.ListDocumentsResponse],
+        request: retriever_service.ListDocumentsRequest,
+        response: retriever_service.ListDocumentsResponse,
+        *,
+        retry: OptionalRetry = gapic_v1.method.DEFAULT,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
+        metadata: Sequence[Tuple[str, Union[str, bytes]]] = ()
+    ):
+        """Instantiate the pager.
+
+        Args:
+            method (Callable): The method that was originally called, and
+                which instantiated this pager.
+            request (google.ai.generativelanguage_v1alpha.types.ListDocumentsRequest):
+                The initial request object.
+            response (google.ai.generativelanguage_v1alpha.types.ListDocumentsResponse):
+                The initial response object.
+            retry (google.api_core.retry.Retry): Designation of what errors,
+                if any, should be retried.
+            timeout (float): The timeout for this request.
+            metadata (Sequence[Tuple[str, Union[str, bytes]]]): Key/value pairs which should be
+                sent along with the request as metadata. Normally, each value must be of type `str`,
+                but for metadata keys ending with the suffix `-bin`, the corresponding values must
+                be of type `bytes`.
+        """
+        self._method = method
+        self._request = retriever_service.ListDocumentsRequest(request)
+        self._response = response
+        self._retry = retry
+        self._timeout = timeout
+        self._metadata = metadata
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._response, name)
+
+    @property
+    def pages(self) -> Iterator[retriever_service.ListDocumentsResponse]:
+        yield self._response
+        while self._response.next_page_token:
+            self._request.page_token = self._response.next_page_token
+            self._response = self._method(
+                self._request,
+                retry=self._retry,
+                timeout=self._timeout,
+                metadata=self._metadata,
+            )
+            yield self._response
+
+    def __iter__(self) -> Iterator[retriever.Document]:
+        for page in self.pages:
+            yield from page.documents
+
+    def __repr__(self) -> str:
+        return "{0}<{1!r}>".format(self.__class__.__name__, self._response)
+
+
+class ListDocumentsAsyncPager:
+    """A pager for iterating through ``list_documents`` requests.
+
+    This class thinly wraps an initial
+    :class:`google.ai.generativelanguage_v1alpha.types.ListDocumentsResponse` object, and
+    provides an ``__aiter__`` method to iterate through its
+    ``documents`` field.
+
+    If there are more pages, the ``__aiter__`` method will make additional
+    ``ListDocuments`` requests and continue to iterate
+    through the ``documents`` field on the
+    corresponding responses.
+
+    All the usual :class:`google.ai.generativelanguage_v1alpha.types.ListDocumentsResponse`
+    attributes are available on the pager. If multiple requests are made, only
+    the most recent response is retained, and thus used for attribute lookup.
+    """
+
+    def __init__(
+        self,
+        method: Callable[..., Awaitable[retriever_service.ListDocumentsResponse]],
+        request: retriever_service.ListDocumentsRequest,
+        response: retriever_service.ListDocumentsResponse,
+        *,
+        retry: OptionalAsyncRetry = gapic_v1.method.DEFAULT,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
+        metadata: Sequence[Tuple[str, Union[str, bytes]]] = ()
+    ):
+        """Instantiates the pager.
+
+        Args:
+            method (Callable): The method that was originally called, and
+                which instantiated this pager.
+            request (google.ai.generativelanguage_v1alpha.types.ListDocumentsRequest):
+                The initial request object.
+            response (google.ai.generativelanguage_v1alpha.types.ListDocumentsResponse):
+                The initial response object.
+            retry (google.api_core.retry.AsyncRetry): Designation of what errors,
+                if any, should be retried.
+            timeout (float): The timeout for this request.
+            metadata (Sequence[Tuple[str, Union[str, bytes]]]): Key/value pairs which should be
+                sent along with the request as metadata. Normally, each value must be of type `str`,
+                but for metadata keys ending with the suffix `-bin`, the corresponding values must
+                be of type `bytes`.
+        """
+        self._method = method
+        self._request = retriever_service.ListDocumentsRequest(request)
+        self._response = response
+        self._retry = retry
+        self._timeout = timeout
+        self._metadata = metadata
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._response, name)
+
+    @property
+    async def pages(self) -> AsyncIterator[retriever_service.ListDocumentsResponse]:
+        yield self._response
+        while self._response.next_page_token:
+            self._request.page_token = self._response.next_page_token
+            self._response = await self._method(
+                self._request,
+                retry=self._retry,
+                timeout=self._timeout,
+                metadata=self._metadata,
+            )
+            yield self._response
+
+    def __aiter__(self) -> AsyncIterator[retriever.Document]:
+        async def async_generator():
+            async for page in self.pages:
+                for response in page.documents:
+                    yield response
+
+        return async_generator()
+
+    def __repr__(self) -> str:
+        return "{0}<{1!r}>".format(self.__class__.__name__, self._response)
+
+
+class ListChunksPager:
+    """A pager for iterating through ``list_chunks`` requests.
+
+    This class thinly wraps an initial
+    :class:`google.ai.generativelanguage_v1alpha.types.ListChunksResponse` object, and
+    provides an ``__iter__`` method to iterate through its
+    ``chunks`` field.
+
+    If there are more pages, the ``__iter__`` method will make additional
+    ``ListChunks`` requests and continue to iterate
+    through the ``chunks`` field on the
+    corresponding responses.
+
+    All the usual :class:`google.ai.generativelanguage_v1alpha.types.ListChunksResponse`
+    attributes are available on the pager. If multiple requests are made, only
+    the most recent response is retained, and thus used for attribute lookup.
+    """
+
+    def __init__(
+        self,
+        method: Callable[..., retriever_service.ListChunksResponse],
+        request: retriever_service.ListChunksRequest,
+        response: retriever_service.ListChunksResponse,
+        *,
+        retry: OptionalRetry = gapic_v1.method.DEFAULT,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
+        metadata: Sequence[Tuple[str, Union[str, bytes]]] = ()
+    ):
+        """Instantiate the pager.
+
+        Args:
+            method (Callable): The method that was originally called, and
+                which instantiated this pager.
+            request (google.ai.generativelanguage_v1alpha.types.ListChunksRequest):
+                The initial request object.
+            response (google.ai.generativelanguage_v1alpha.types.ListChunksResponse):
+                The initial response object.
+            retry (google.api_core.retry.Retry): Designation of what errors,
+                if any, should be retried.
+            timeout (float): The timeout for this request.
+            metadata (Sequence[Tuple[str, Union[str, bytes]]]): Key/value pairs which should be
+                sent along with the request as metadata. Normally, each value must be of type `str`,
+                but for metadata keys ending with the suffix `-bin`, the corresponding values must
+                be of type `bytes`.
+        """
+        self._method = method
+        self._request = retriever_service.ListChunksRequest(request)
+        self._response = response
+        self._retry = retry
+        self._timeout = timeout
+        self._metadata = metadata
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._response, name)
+
+    @property
+    def pages(self) -> Iterator[retriever_service.ListChunksResponse]:
+        yield self._response
+        while self._response.next_page_token:
+            self._request.page_token = self._response.next_page_token
+            self._response = self._method(
+                self._request,
+                retry=self._retry,
+                timeout=self._timeout,
+                metadata=self._metadata,
+            )
+            yield self._response
+
+    def __iter__(self) -> Iterator[retriever.Chunk]:
+        for page in self.pages:
+            yield from page.chunks
+
+    def __repr__(self) -> str:
+        return "{0}<{1!r}>".format(self.__class__.__name__, self._response)
+
+
+class ListChunksAsyncPager:
+    """A pager for iterating through ``list_chunks`` requests.
+
+    This class thinly wraps an initial
+    :class:`google.ai.generativelanguage_v1alpha.types.ListChunksResponse` object, and
+    provides an ``__aiter__`` method to iterate through its
+    ``chunks`` field.
+
+    If there are more pages, the ``__aiter__`` method will make additional
+    ``ListChunks`` requests and continue to iterate
+    through the ``chunks`` field on the
+    corresponding responses.
+
+    All the usual :class:`google.ai.generativelanguage_v1alpha.types.ListChunksResponse`
+    attributes are available on the pager. If multiple requests are made, only
+    the most recent response is retained, and thus used for attribute lookup.
+    """
+
+    def __init__(
+        self,
+        method: Callable[..., Awaitable[retriever_service.ListChunksResponse]],
+        request: retriever_service.ListChunksRequest,
+        response: retriever_service.ListChunksResponse,
+        *,
+        retry: OptionalAsyncRetry = gapic_v1.method.DEFAULT,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
+        metadata: Sequence[Tuple[str, Union[str, bytes]]] = ()
+    ):
+        """Instantiates the pager.
+
+        Args:
+            method (Callable): The method that was originally called, and
+                which instantiated this pager.
+            request (google.ai.generativelanguage_v1alpha.types.ListChunksRequest):
+                The initial request object.
+            response (google.ai.generativelanguage_v1alpha.types.ListChunksResponse):
+                The initial response object.
+            retry (google.api_core.retry.AsyncRetry): Designation of what errors,
+                if any, should be retried.
+            timeout (float): The timeout for this request.
+            metadata (Sequence[Tuple[str, Union[str, bytes]]]): Key/value pairs which should be
+                sent along with the request as metadata. Normally, each value must be of type `str`,
+                but for metadata keys ending with the suffix `-bin`, the corresponding values must
+                be of type `bytes`.
+        """
+        self._method = method
+        self._request = retriever_service.ListChunksRequest(request)
+        self._response = response
+        self._retry = retry
+        self._timeout = timeout
+        self._metadata = metadata
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._response, name)
+
+    @property
+    async def pages(self) -> AsyncIterator[retriever_service.ListChunksResponse]:
+        yield self._response
+        while self._response.next_page_token:
+            self._request.page_token = self._response.next_page_token
+            self._response = await self._method(
+                self._request,
+                retry=self._retry,
+                timeout=self._timeout,
+                metadata=self._metadata,
+            )
+            yield self._response
+
+    def __aiter__(self) -> AsyncIterator[retriever.Chunk]:
+        async def async_generator():
+            async for page in self.pages:
+                for response in page.chunks:
+                    yield response
+
+        return async_generator()
+
+    def __repr__(self) -> str:
+        return "{0}<{1!r}>".format(self.__class__.__name__, self._response)
@@ -0,0 +1,369 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+from .cache_service import (
+    CreateCachedContentRequest,
+    DeleteCachedContentRequest,
+    GetCachedContentRequest,
+    ListCachedContentsRequest,
+    ListCachedContentsResponse,
+    UpdateCachedContentRequest,
+)
+from .cached_content import CachedContent
+from .citation import CitationMetadata, CitationSource
+from .content import (
+    Blob,
+    CodeExecution,
+    CodeExecutionResult,
+    Content,
+    DynamicRetrievalConfig,
+    ExecutableCode,
+    FileData,
+    FunctionCall,
+    FunctionCallingConfig,
+    FunctionDeclaration,
+    FunctionResponse,
+    GoogleSearchRetrieval,
+    GroundingPassage,
+    GroundingPassages,
+    Part,
+    Schema,
+    Tool,
+    ToolConfig,
+    Type,
+)
+from .discuss_service import (
+    CountMessageTokensRequest,
+    CountMessageTokensResponse,
+    Example,
+    GenerateMessageRequest,
+    GenerateMessageResponse,
+    Message,
+    MessagePrompt,
+)
+from .file import File, VideoMetadata
+from .file_service import (
+    CreateFileRequest,
+    CreateFileResponse,
+    DeleteFileRequest,
+    GetFileRequest,
+    ListFilesRequest,
+    ListFilesResponse,
+)
+from .generative_service import (
+    AttributionSourceId,
+    BatchEmbedContentsRequest,
+    BatchEmbedContentsResponse,
+    BidiGenerateContentClientContent,
+    BidiGenerateContentClientMessage,
+    BidiGenerateContentRealtimeInput,
+    BidiGenerateContentServerContent,
+    BidiGenerateContentServerMessage,
+    BidiGenerateContentSetup,
+    BidiGenerateContentSetupComplete,
+    BidiGenerateContentToolCall,
+    BidiGenerateContentToolCallCancellation,
+    BidiGenerateContentToolResponse,
+    Candidate,
+    ContentEmbedding,
+    CountTokensRequest,
+    CountTokensResponse,
+    EmbedContentRequest,
+    EmbedContentResponse,
+    GenerateAnswerRequest,
+    GenerateAnswerResponse,
+    GenerateContentRequest,
+    GenerateContentResponse,
+    GenerationConfig,
+    GroundingAttribution,
+    GroundingChunk,
+    GroundingMetadata,
+    GroundingSupport,
+    LogprobsResult,
+    PrebuiltVoiceConfig,
+    RetrievalMetadata,
+    SearchEntryPoint,
+    Segment,
+    SemanticRetrieverConfig,
+    SpeechConfig,
+    TaskType,
+    VoiceConfig,
+)
+from .model import Model
+from .model_service import (
+    CreateTunedModelMetadata,
+    CreateTunedModelRequest,
+    DeleteTunedModelRequest,
+    GetModelRequest,
+    GetTunedModelRequest,
+    ListModelsRequest,
+    ListModelsResponse,
+    ListTunedModelsRequest,
+    ListTunedModelsResponse,
+    UpdateTunedModelRequest,
+)
+from .permission import Permission
+from .permission_service import (
+    CreatePermissionRequest,
+    DeletePermissionRequest,
+    GetPermissionRequest,
+    ListPermissionsRequest,
+    ListPermissionsResponse,
+    TransferOwnershipRequest,
+    TransferOwnershipResponse,
+    UpdatePermissionRequest,
+)
+from .prediction_service import PredictRequest, PredictResponse
+from .retriever import (
+    Chunk,
+    ChunkData,
+    Condition,
+    Corpus,
+    CustomMetadata,
+    Document,
+    MetadataFilter,
+    StringList,
+)
+from .retriever_service import (
+    BatchCreateChunksRequest,
+    BatchCreateChunksResponse,
+    BatchDeleteChunksRequest,
+    BatchUpdateChunksRequest,
+    BatchUpdateChunksResponse,
+    CreateChunkRequest,
+    CreateCorpusRequest,
+    CreateDocumentRequest,
+    DeleteChunkRequest,
+    DeleteCorpusRequest,
+    DeleteDocumentRequest,
+    GetChunkRequest,
+    GetCorpusRequest,
+    GetDocumentRequest,
+    ListChunksRequest,
+    ListChunksResponse,
+    ListCorporaRequest,
+    ListCorporaResponse,
+    ListDocumentsRequest,
+    ListDocumentsResponse,
+    QueryCorpusRequest,
+    QueryCorpusResponse,
+    QueryDocumentRequest,
+    QueryDocumentResponse,
+    RelevantChunk,
+    UpdateChunkRequest,
+    UpdateCorpusRequest,
+    UpdateDocumentRequest,
+)
+from .safety import (
+    ContentFilter,
+    HarmCategory,
+    SafetyFeedback,
+    SafetyRating,
+    SafetySetting,
+)
+from .text_service import (
+    BatchEmbedTextRequest,
+    BatchEmbedTextResponse,
+    CountTextTokensRequest,
+    CountTextTokensResponse,
+    Embedding,
+    EmbedTextRequest,
+    EmbedTextResponse,
+    GenerateTextRequest,
+    GenerateTextResponse,
+    TextCompletion,
+    TextPrompt,
+)
+from .tuned_model import (
+    Dataset,
+    Hyperparameters,
+    TunedModel,
+    TunedModelSource,
+    TuningContent,
+    TuningExample,
+    TuningExamples,
+    TuningMultiturnExample,
+    TuningPart,
+    TuningSnapshot,
+    TuningTask,
+)
+
+__all__ = (
+    "CreateCachedContentRequest",
+    "DeleteCachedContentRequest",
+    "GetCachedContentRequest",
+    "ListCachedContentsRequest",
+    "ListCachedContentsResponse",
+    "UpdateCachedContentRequest",
+    "CachedContent",
+    "CitationMetadata",
+    "CitationSource",
+    "Blob",
+    "CodeExecution",
+    "CodeExecutionResult",
+    "Content",
+    "DynamicRetrievalConfig",
+    "ExecutableCode",
+    "FileData",
+    "FunctionCall",
+    "FunctionCallingConfig",
+    "FunctionDeclaration",
+    "FunctionResponse",
+    "GoogleSearchRetrieval",
+    "GroundingPassage",
+    "GroundingPassages",
+    "Part",
+    "Schema",
+    "Tool",
+    "ToolConfig",
+    "Type",
+    "CountMessageTokensRequest",
+    "CountMessageTokensResponse",
+    "Example",
+    "GenerateMessageRequest",
+    "GenerateMessageResponse",
+    "Message",
+    "MessagePrompt",
+    "File",
+    "VideoMetadata",
+    "CreateFileRequest",
+    "CreateFileResponse",
+    "DeleteFileRequest",
+    "GetFileRequest",
+    "ListFilesRequest",
+    "ListFilesResponse",
+    "AttributionSourceId",
+    "BatchEmbedContentsRequest",
+    "BatchEmbedContentsResponse",
+    "BidiGenerateContentClientContent",
+    "BidiGenerateContentClientMessage",
+    "BidiGenerateContentRealtimeInput",
+    "BidiGenerateContentServerContent",
+    "BidiGenerateContentServerMessage",
+    "BidiGenerateContentSetup",
+    "BidiGenerateContentSetupComplete",
+    "BidiGenerateContentToolCall",
+    "BidiGenerateContentToolCallCancellation",
+    "BidiGenerateContentToolResponse",
+    "Candidate",
+    "ContentEmbedding",
+    "CountTokensRequest",
+    "CountTokensResponse",
+    "EmbedContentRequest",
+    "EmbedContentResponse",
+    "GenerateAnswerRequest",
+    "GenerateAnswerResponse",
+    "GenerateContentRequest",
+    "GenerateContentResponse",
+    "GenerationConfig",
+    "GroundingAttribution",
+    "GroundingChunk",
+    "GroundingMetadata",
+    "GroundingSupport",
+    "LogprobsResult",
+    "PrebuiltVoiceConfig",
+    "RetrievalMetadata",
+    "SearchEntryPoint",
+    "Segment",
+    "SemanticRetrieverConfig",
+    "SpeechConfig",
+    "VoiceConfig",
+    "TaskType",
+    "Model",
+    "CreateTunedModelMetadata",
+    "CreateTunedModelRequest",
+    "DeleteTunedModelRequest",
+    "GetModelRequest",
+    "GetTunedModelRequest",
+    "ListModelsRequest",
+    "ListModelsResponse",
+    "ListTunedModelsRequest",
+    "ListTunedModelsResponse",
+    "UpdateTunedModelRequest",
+    "Permission",
+    "CreatePermissionRequest",
+    "DeletePermissionRequest",
+    "GetPermissionRequest",
+    "ListPermissionsRequest",
+    "ListPermissionsResponse",
+    "TransferOwnershipRequest",
+    "TransferOwnershipResponse",
+    "UpdatePermissionRequest",
+    "PredictRequest",
+    "PredictResponse",
+    "Chunk",
+    "ChunkData",
+    "Condition",
+    "Corpus",
+    "CustomMetadata",
+    "Document",
+    "MetadataFilter",
+    "StringList",
+    "BatchCreateChunksRequest",
+    "BatchCreateChunksResponse",
+    "BatchDeleteChunksRequest",
+    "BatchUpdateChunksRequest",
+    "BatchUpdateChunksResponse",
+    "CreateChunkRequest",
+    "CreateCorpusRequest",
+    "CreateDocumentRequest",
+    "DeleteChunkRequest",
+    "DeleteCorpusRequest",
+    "DeleteDocumentRequest",
+    "GetChunkRequest",
+    "GetCorpusRequest",
+    "GetDocumentRequest",
+    "ListChunksRequest",
+    "ListChunksResponse",
+    "ListCorporaRequest",
+    "ListCorporaResponse",
+    "ListDocumentsRequest",
+    "ListDocumentsResponse",
+    "QueryCorpusRequest",
+    "QueryCorpusResponse",
+    "QueryDocumentRequest",
+    "QueryDocumentResponse",
+    "RelevantChunk",
+    "UpdateChunkRequest",
+    "UpdateCorpusRequest",
+    "UpdateDocumentRequest",
+    "ContentFilter",
+    "SafetyFeedback",
+    "SafetyRating",
+    "SafetySetting",
+    "HarmCategory",
+    "BatchEmbedTextRequest",
+    "BatchEmbedTextResponse",
+    "CountTextTokensRequest",
+    "CountTextTokensResponse",
+    "Embedding",
+    "EmbedTextRequest",
+    "EmbedTextResponse",
+    "GenerateTextRequest",
+    "GenerateTextResponse",
+    "TextCompletion",
+    "TextPrompt",
+    "Dataset",
+    "Hyperparameters",
+    "TunedModel",
+    "TunedModelSource",
+    "TuningContent",
+    "TuningExample",
+    "TuningExamples",
+    "TuningMultiturnExample",
+    "TuningPart",
+    "TuningSnapshot",
+    "TuningTask",
+)
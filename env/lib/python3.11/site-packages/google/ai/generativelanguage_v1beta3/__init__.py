@@ -0,0 +1,155 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+from google.ai.generativelanguage_v1beta3 import gapic_version as package_version
+
+__version__ = package_version.__version__
+
+
+from .services.discuss_service import DiscussServiceAsyncClient, DiscussServiceClient
+from .services.model_service import ModelServiceAsyncClient, ModelServiceClient
+from .services.permission_service import (
+    PermissionServiceAsyncClient,
+    PermissionServiceClient,
+)
+from .services.text_service import TextServiceAsyncClient, TextServiceClient
+from .types.citation import CitationMetadata, CitationSource
+from .types.discuss_service import (
+    CountMessageTokensRequest,
+    CountMessageTokensResponse,
+    Example,
+    GenerateMessageRequest,
+    GenerateMessageResponse,
+    Message,
+    MessagePrompt,
+)
+from .types.model import Model
+from .types.model_service import (
+    CreateTunedModelMetadata,
+    CreateTunedModelRequest,
+    DeleteTunedModelRequest,
+    GetModelRequest,
+    GetTunedModelRequest,
+    ListModelsRequest,
+    ListModelsResponse,
+    ListTunedModelsRequest,
+    ListTunedModelsResponse,
+    UpdateTunedModelRequest,
+)
+from .types.permission import Permission
+from .types.permission_service import (
+    CreatePermissionRequest,
+    DeletePermissionRequest,
+    GetPermissionRequest,
+    ListPermissionsRequest,
+    ListPermissionsResponse,
+    TransferOwnershipRequest,
+    TransferOwnershipResponse,
+    UpdatePermissionRequest,
+)
+from .types.safety import (
+    ContentFilter,
+    HarmCategory,
+    SafetyFeedback,
+    SafetyRating,
+    SafetySetting,
+)
+from .types.text_service import (
+    BatchEmbedTextRequest,
+    BatchEmbedTextResponse,
+    CountTextTokensRequest,
+    CountTextTokensResponse,
+    Embedding,
+    EmbedTextRequest,
+    EmbedTextResponse,
+    GenerateTextRequest,
+    GenerateTextResponse,
+    TextCompletion,
+    TextPrompt,
+)
+from .types.tuned_model import (
+    Dataset,
+    Hyperparameters,
+    TunedModel,
+    TunedModelSource,
+    TuningExample,
+    TuningExamples,
+    TuningSnapshot,
+    TuningTask,
+)
+
+__all__ = (
+    "DiscussServiceAsyncClient",
+    "ModelServiceAsyncClient",
+    "PermissionServiceAsyncClient",
+    "TextServiceAsyncClient",
+    "BatchEmbedTextRequest",
+    "BatchEmbedTextResponse",
+    "CitationMetadata",
+    "CitationSource",
+    "ContentFilter",
+    "CountMessageTokensRequest",
+    "CountMessageTokensResponse",
+    "CountTextTokensRequest",
+    "CountTextTokensResponse",
+    "CreatePermissionRequest",
+    "CreateTunedModelMetadata",
+    "CreateTunedModelRequest",
+    "Dataset",
+    "DeletePermissionRequest",
+    "DeleteTunedModelRequest",
+    "DiscussServiceClient",
+    "EmbedTextRequest",
+    "EmbedTextResponse",
+    "Embedding",
+    "Example",
+    "GenerateMessageRequest",
+    "GenerateMessageResponse",
+    "GenerateTextRequest",
+    "GenerateTextResponse",
+    "GetModelRequest",
+    "GetPermissionRequest",
+    "GetTunedModelRequest",
+    "HarmCategory",
+    "Hyperparameters",
+    "ListModelsRequest",
+    "ListModelsResponse",
+    "ListPermissionsRequest",
+    "ListPermissionsResponse",
+    "ListTunedModelsRequest",
+    "ListTunedModelsResponse",
+    "Message",
+    "MessagePrompt",
+    "Model",
+    "ModelServiceClient",
+    "Permission",
+    "PermissionServiceClient",
+    "SafetyFeedback",
+    "SafetyRating",
+    "SafetySetting",
+    "TextCompletion",
+    "TextPrompt",
+    "TextServiceClient",
+    "TransferOwnershipRequest",
+    "TransferOwnershipResponse",
+    "TunedModel",
+    "TunedModelSource",
+    "TuningExample",
+    "TuningExamples",
+    "TuningSnapshot",
+    "TuningTask",
+    "UpdatePermissionRequest",
+    "UpdateTunedModelRequest",
+)
@@ -0,0 +1,29 @@
+# -*- coding: utf-8 -*-
+# Copyright 2023 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""A collection of type definitions used throughout the library."""
+
+from google.generativeai.types.citation_types import *
+from google.generativeai.types.content_types import *
+from google.generativeai.types.file_types import *
+from google.generativeai.types.generation_types import *
+from google.generativeai.types.helper_types import *
+from google.generativeai.types.model_types import *
+from google.generativeai.types.permission_types import *
+from google.generativeai.types.safety_types import *
+
+
+del model_types
+del citation_types
+del safety_types